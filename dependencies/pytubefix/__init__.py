@@ -15,6 +15,7 @@ from pytubefix.captions import Caption
 from pytubefix.chapters import Chapter
 from pytubefix.keymoments import KeyMoment
 from pytubefix.query import CaptionQuery, StreamQuery
+from pytubefix.session import Session
 from pytubefix.__main__ import YouTube
 from pytubefix.contrib.playlist import Playlist
 from pytubefix.contrib.channel import Channel
@@ -30,18 +30,21 @@ smaller peripheral modules and functions.
 
 """
 
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from subprocess import CalledProcessError
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 import pytubefix
 import pytubefix.exceptions as exceptions
-from pytubefix import extract, request
+from pytubefix import async_request, extract, player_cache, request
 from pytubefix import Stream, StreamQuery
 from pytubefix.helpers import install_proxy
 from pytubefix.innertube import InnerTube
 from pytubefix.metadata import YouTubeMetadata
 from pytubefix.monostate import Monostate
+from pytubefix.session import Session
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +52,17 @@ logger = logging.getLogger(__name__)
 class YouTube:
     """Core developer interface for pytubefix."""
 
+    # Amount of fallback clients requested at the same time as the client when
+    # fetching the player, the first playable response wins. 0 tries them one
+    # after the other.
+    racing_clients = 0
+
+    # Fields that can only be read from the watch page, see the fields
+    # parameter of the constructor.
+    watch_page_fields = frozenset({
+        'initial_data', 'age_restricted', 'publish_date', 'chapters', 'key_moments', 'replayed_heatmap', 'metadata'
+    })
+
     def __init__(
             self,
             url: str,
@@ -62,6 +76,8 @@ class YouTube:
             oauth_verifier: Optional[Callable[[str, str], None]] = None,
             use_po_token: Optional[bool] = False,
             po_token_verifier: Optional[Callable[[None], Tuple[str, str]]] = None,
+            session: Optional[Session] = None,
+            fields: Optional[Iterable[str]] = None,
     ):
         """Construct a :class:`YouTube <YouTube>`.
 
@@ -95,6 +111,16 @@ class YouTube:
             (optional) Verifier to be used for getting oauth tokens.
             Verification URL and User-Code will be passed to it respectively.
             (if passed, else default verifier will be used)
+        :param Session session:
+            (Optional) Session sharing the visitorData, PO token and OAuth tokens
+            with the other videos using it, so they are only resolved once.
+        :param Iterable[str] fields:
+            (Optional) Names of the properties that will be read, for example
+            ``{'title', 'streams'}``. When none of them is in
+            :attr:`watch_page_fields`, the ~1 MB watch page is not downloaded:
+            the player url comes from the iframe API and the visitorData from
+            the InnerTube API. Other properties still work, fetching what they
+            need when read. Defaults to None, all the fields.
         """
         # js fetched by js_url
         self._js: Optional[str] = None
@@ -123,6 +149,7 @@ class YouTube:
         self.video_id = extract.video_id(url)
 
         self.watch_url = f"https://youtube.com/watch?v={self.video_id}"
+        self.iframe_api_url = "https://www.youtube.com/iframe_api"
         self.embed_url = f"https://www.youtube.com/embed/{self.video_id}"
 
         self.client = client
@@ -165,6 +192,9 @@ class YouTube:
         self.po_token = None
         self._pot = None
 
+        self.session = session
+        self.fields = frozenset(fields) if fields is not None else None
+
     def __repr__(self):
         return f'<pytubefix.__main__.YouTube object: videoId={self.video_id}>'
 
@@ -193,11 +223,27 @@ class YouTube:
         self._age_restricted = extract.is_age_restricted(self.watch_html)
         return self._age_restricted
 
+    @property
+    def _lean(self) -> bool:
+        """Whether the watch page is avoided, see the fields parameter."""
+        return self.fields is not None and not self.fields & self.watch_page_fields and not self._watch_html
+
     @property
     def js_url(self):
         if self._js_url:
             return self._js_url
 
+        if self._lean:
+            # The player is the same for every video, any url already known works
+            if pytubefix.__js_url__:
+                self._js_url = pytubefix.__js_url__
+                return self._js_url
+            try:
+                self._js_url = extract.js_url_from_iframe_api(request.get(self.iframe_api_url))
+                return self._js_url
+            except exceptions.RegexMatchError:
+                logger.debug("Player url not found in the iframe API, reading it from the watch page")
+
         if self.age_restricted:
             self._js_url = extract.js_url(self.embed_html)
         else:
@@ -210,17 +256,31 @@ class YouTube:
         if self._js:
             return self._js
 
-        # If the js_url doesn't match the cached url, fetch the new js and update
-        #  the cache; otherwise, load the cache.
-        if pytubefix.__js_url__ != self.js_url:
+        # If the js_url doesn't match the cached url, look for it on disk, then
+        #  fetch the new js and update the caches.
+        self._js = self._cached_js()
+        if self._js is None:
             self._js = request.get(self.js_url)
-            pytubefix.__js__ = self._js
-            pytubefix.__js_url__ = self.js_url
-        else:
-            self._js = pytubefix.__js__
+            self._cache_js(self._js)
 
         return self._js
 
+    def _cached_js(self) -> Optional[str]:
+        """Get the player's base.js from the process or the disk cache."""
+        if pytubefix.__js_url__ == self.js_url:
+            return pytubefix.__js__
+
+        js = player_cache.load(self.js_url)
+        if js is not None:
+            pytubefix.__js__ = js
+            pytubefix.__js_url__ = self.js_url
+        return js
+
+    def _cache_js(self, js: str):
+        pytubefix.__js__ = js
+        pytubefix.__js_url__ = self.js_url
+        player_cache.save(self.js_url, js)
+
     @property
     def visitor_data(self) -> str:
         """
@@ -229,25 +289,36 @@ class YouTube:
         if self._visitor_data:
             return self._visitor_data
 
-        if InnerTube(self.client).require_po_token:
+        if self.session is not None:
+            self._visitor_data = self.session.visitor_data(self._resolve_visitor_data)
+        else:
+            self._visitor_data = self._resolve_visitor_data()
+        return self._visitor_data
+
+    def _resolve_visitor_data(self) -> str:
+        """Request the visitorData, from the watch page or the WEB client."""
+        if InnerTube(self.client).require_po_token and not self._lean:
             try:
                 logger.debug("Looking for visitorData in initial_data")
-                self._visitor_data = extract.visitor_data(str(self.initial_data['responseContext']))
+                visitor_data = extract.visitor_data(str(self.initial_data['responseContext']))
                 logger.debug('VisitorData obtained successfully')
-                return self._visitor_data
+                return visitor_data
             except (KeyError, pytubefix.exceptions.RegexMatchError):
                 logger.debug("Unable to obtain visitorData from initial_data. Trying to request from the WEB client")
 
         logger.debug("Looking for visitorData in InnerTube API")
-        innertube_response = InnerTube('WEB').player(self.video_id)
+        return self._visitor_data_from(InnerTube('WEB').player(self.video_id))
+
+    @staticmethod
+    def _visitor_data_from(innertube_response) -> str:
+        """Get the visitorData out of a player response."""
         try:
-            self._visitor_data = innertube_response['responseContext']['visitorData']
+            visitor_data = innertube_response['responseContext']['visitorData']
         except KeyError:
             p_dicts = innertube_response['responseContext']['serviceTrackingParams'][0]['params']
-            self._visitor_data = next(p for p in p_dicts if p['key'] == 'visitor_data')['value']
+            visitor_data = next(p for p in p_dicts if p['key'] == 'visitor_data')['value']
         logger.debug('VisitorData obtained successfully')
-
-        return self._visitor_data
+        return visitor_data
 
     @property
     def initial_data(self):
@@ -315,6 +386,7 @@ class YouTube:
                 extract.apply_signature(stream_manifest, self.vid_info, self.js, self.js_url)
             except exceptions.ExtractError:
                 # To force an update to the js file, we clear the cache and retry
+                player_cache.remove(self.js_url)
                 self._js = None
                 self._js_url = None
                 pytubefix.__js__ = None
@@ -435,7 +507,9 @@ class YouTube:
             self._signature_timestamp = {
                 'playbackContext': {
                     'contentPlaybackContext': {
-                        'signatureTimestamp': extract.signature_timestamp(self.js)
+                        'signatureTimestamp': player_cache.derived(
+                            self.js_url, 'signature_timestamp', lambda: extract.signature_timestamp(self.js)
+                        )
                     }
                 }
             }
@@ -481,6 +555,147 @@ class YouTube:
     def vid_info(self, value):
         self._vid_info = value
 
+    def _player_innertube(self, client):
+        """Get an InnerTube object ready to request the player of this video.
+
+        :param str client:
+            The client to request the player with.
+        :rtype: InnerTube
+        """
+        innertube = InnerTube(
+            client=client,
+            use_oauth=self.use_oauth,
+            allow_cache=self.allow_oauth_cache,
+            token_file=self.token_file,
+            oauth_verifier=self.oauth_verifier,
+            use_po_token=self.use_po_token,
+            po_token_verifier=self.po_token_verifier,
+            session=self.session
+        )
+        if innertube.require_js_player:
+            innertube.innertube_context.update(self.signature_timestamp)
+
+        # Automatically generates a poToken
+        if innertube.require_po_token and not self.use_po_token:
+            logger.debug(f"The {client} client requires poToken to obtain functional streams")
+            logger.debug("Automatically generating poToken")
+            innertube.insert_visitor_data(visitor_data=self.visitor_data)
+        elif not self.use_po_token:
+            # from 01/22/2025 all clients must send the visitorData in the API request
+            innertube.insert_visitor_data(visitor_data=self.visitor_data)
+        return innertube
+
+    def _read_player_response(self, innertube, response):
+        """Keep what the player request left in the InnerTube object."""
+        # Retrieves the sent poToken
+        if self.use_po_token or innertube.require_po_token:
+            self.po_token = innertube.access_po_token or self.pot
+        return response
+
+    @staticmethod
+    def _client_unavailable(innertube_response) -> bool:
+        """Whether the video can't be accessed with the client that was used."""
+        playability_status = innertube_response['playabilityStatus']
+        return (
+            playability_status['status'] == 'UNPLAYABLE'
+            and playability_status.get('reason') == 'This video is not available'
+        )
+
+    def _player_clients(self, client) -> Tuple[Tuple[str, ...], List[str]]:
+        """Get the clients to request the player with, in order.
+
+        :param str client:
+            The client to try first.
+        :rtype: Tuple[Tuple[str], List[str]]
+        :returns:
+            The client followed by the fallback clients, and the same clients
+            starting with the one that played the previous videos of the session.
+        """
+        clients = [client] + [fallback for fallback in self.fallback_clients if fallback != client]
+        chain = tuple(clients)
+        preferred = self.session.preferred_client(chain) if self.session is not None else None
+        if preferred in clients:
+            clients.remove(preferred)
+            clients.insert(0, preferred)
+        return chain, clients
+
+    def _keep_player_client(self, optional_client, chain, client, innertube_response):
+        """Remember which client the player response was obtained with."""
+        if client != optional_client:
+            self.client = client
+        if self.session is not None and innertube_response and not self._client_unavailable(innertube_response):
+            self.session.set_preferred_client(chain, client)
+
+    def _call_player(self, client):
+        innertube = self._player_innertube(client)
+        return self._read_player_response(innertube, innertube.player(self.video_id))
+
+    async def _call_player_async(self, client):
+        innertube = self._player_innertube(client)
+        return self._read_player_response(innertube, await innertube.player_async(self.video_id))
+
+    def _race_player(self, clients: List[str]) -> Tuple[str, dict]:
+        """Request the player with several clients at once.
+
+        :rtype: Tuple[str, dict]
+        :returns:
+            The first client to answer with a playable response and its
+            response. If none of them can play the video, the first client and
+            its response.
+        """
+        innertubes = {client: self._player_innertube(client) for client in clients}
+        executor = ThreadPoolExecutor(max_workers=len(clients))
+        try:
+            futures = {
+                executor.submit(innertube.player, self.video_id): client
+                for client, innertube in innertubes.items()
+            }
+            for future in as_completed(futures):
+                client = futures[future]
+                try:
+                    response = future.result()
+                    if self._client_unavailable(response):
+                        continue
+                except Exception as e:
+                    logger.debug(f"{client} client failed: {e}")
+                    continue
+                logger.debug(f"{client} client answered first")
+                return client, self._read_player_response(innertubes[client], response)
+
+            first = next(future for future, client in futures.items() if client == clients[0])
+            return clients[0], self._read_player_response(innertubes[clients[0]], first.result())
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _race_player_async(self, clients: List[str]) -> Tuple[str, dict]:
+        """Asynchronous version of :meth:`_race_player`."""
+        innertubes = {client: self._player_innertube(client) for client in clients}
+        tasks = {
+            asyncio.ensure_future(innertube.player_async(self.video_id)): client
+            for client, innertube in innertubes.items()
+        }
+        try:
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    client = tasks[task]
+                    try:
+                        response = task.result()
+                        if self._client_unavailable(response):
+                            continue
+                    except Exception as e:
+                        logger.debug(f"{client} client failed: {e}")
+                        continue
+                    logger.debug(f"{client} client answered first")
+                    return client, self._read_player_response(innertubes[client], response)
+
+            first = next(task for task, client in tasks.items() if client == clients[0])
+            return clients[0], self._read_player_response(innertubes[clients[0]], first.result())
+        finally:
+            for task in tasks:
+                task.cancel()
+
     def vid_info_client(self, optional_client=None):
 
         if optional_client is None:
@@ -488,53 +703,98 @@ class YouTube:
                 return self._vid_info
             optional_client = self.client
 
-        def call_innertube(optional_client):
-            innertube = InnerTube(
-                client=optional_client,
-                use_oauth=self.use_oauth,
-                allow_cache=self.allow_oauth_cache,
-                token_file=self.token_file,
-                oauth_verifier=self.oauth_verifier,
-                use_po_token=self.use_po_token,
-                po_token_verifier=self.po_token_verifier
-            )
-            if innertube.require_js_player:
-                innertube.innertube_context.update(self.signature_timestamp)
-
-            # Automatically generates a poToken
-            if innertube.require_po_token and not self.use_po_token:
-                logger.debug(f"The {optional_client} client requires poToken to obtain functional streams")
-                logger.debug("Automatically generating poToken")
-                innertube.insert_visitor_data(visitor_data=self.visitor_data)
-            elif not self.use_po_token:
-                # from 01/22/2025 all clients must send the visitorData in the API request
-                innertube.insert_visitor_data(visitor_data=self.visitor_data)
-
-            response = innertube.player(self.video_id)
-
-            # Retrieves the sent poToken
-            if self.use_po_token or innertube.require_po_token:
-                self.po_token = innertube.access_po_token or self.pot
-            return response
-
-        innertube_response = call_innertube(optional_client)
-        for client in self.fallback_clients:
+        chain, clients = self._player_clients(optional_client)
+        racing = clients[:1 + self.racing_clients]
+        if len(racing) > 1:
+            client, innertube_response = self._race_player(racing)
+        else:
+            client, innertube_response = racing[0], self._call_player(racing[0])
+
+        for fallback in clients[len(racing):]:
             # Some clients are unable to access certain types of videos
             # If the video is unavailable for the current client, attempts will be made with fallback clients
-            playability_status = innertube_response['playabilityStatus']
-            if playability_status['status'] == 'UNPLAYABLE' and 'reason' in playability_status and playability_status['reason'] == 'This video is not available':
-                logger.warning(f"{self.client} client returned: This video is not available")
-                self.client = client
-                logger.warning(f"Switching to client: {client}")
-                innertube_response = call_innertube(client)
+            if self._client_unavailable(innertube_response):
+                logger.warning(f"{client} client returned: This video is not available")
+                logger.warning(f"Switching to client: {fallback}")
+                client, innertube_response = fallback, self._call_player(fallback)
+            else:
+                break
+
+        self._keep_player_client(optional_client, chain, client, innertube_response)
+        if not innertube_response:
+            raise pytubefix.exceptions.InnerTubeResponseError(self.video_id, self.client)
+
+        return innertube_response
+
+    async def vid_info_client_async(self, optional_client=None):
+        """Asynchronous version of :meth:`vid_info_client`."""
+        if optional_client is None:
+            if self._vid_info:
+                return self._vid_info
+            optional_client = self.client
+
+        chain, clients = self._player_clients(optional_client)
+        racing = clients[:1 + self.racing_clients]
+        if len(racing) > 1:
+            client, innertube_response = await self._race_player_async(racing)
+        else:
+            client, innertube_response = racing[0], await self._call_player_async(racing[0])
+
+        for fallback in clients[len(racing):]:
+            if self._client_unavailable(innertube_response):
+                logger.warning(f"{client} client returned: This video is not available")
+                logger.warning(f"Switching to client: {fallback}")
+                client, innertube_response = fallback, await self._call_player_async(fallback)
             else:
                 break
 
+        self._keep_player_client(optional_client, chain, client, innertube_response)
         if not innertube_response:
             raise pytubefix.exceptions.InnerTubeResponseError(self.video_id, self.client)
 
         return innertube_response
 
+    async def prefetch_async(self) -> "YouTube":
+        """Fetch the data of the video without blocking the event loop.
+
+        The watch page, the player's base.js (when the client needs it), the
+        visitorData and the player response are requested asynchronously and
+        cached, so reading :attr:`streams`, :attr:`title` and the other
+        properties built on them afterwards makes no blocking request.
+
+        :rtype: YouTube
+        :returns: This object.
+        """
+        if not self._watch_html and not self._lean:
+            self._watch_html = await async_request.get(self.watch_url)
+
+        innertube = InnerTube(self.client)
+        if innertube.require_js_player and not self._js:
+            if self._lean and not self._js_url and not pytubefix.__js_url__:
+                try:
+                    self._js_url = extract.js_url_from_iframe_api(await async_request.get(self.iframe_api_url))
+                except exceptions.RegexMatchError:
+                    self._watch_html = await async_request.get(self.watch_url)
+            if not self._lean and self.age_restricted and not self._embed_html:
+                self._embed_html = await async_request.get(self.embed_url)
+            self._js = self._cached_js()
+            if self._js is None:
+                self._js = await async_request.get(self.js_url)
+                self._cache_js(self._js)
+
+        if not self._visitor_data and self.session is not None:
+            self._visitor_data = self.session.cached_visitor_data
+
+        if not self._visitor_data and not innertube.require_po_token:
+            logger.debug("Looking for visitorData in InnerTube API")
+            self._visitor_data = self._visitor_data_from(await InnerTube('WEB').player_async(self.video_id))
+            if self.session is not None:
+                self.session.set_visitor_data(self._visitor_data)
+
+        if not self._vid_info:
+            self._vid_info = await self.vid_info_client_async()
+        return self
+
     @property
     def vid_details(self):
         """Parse the raw vid details and return the parsed result.
@@ -553,7 +813,8 @@ class YouTube:
             token_file=self.token_file,
             oauth_verifier=self.oauth_verifier,
             use_po_token=self.use_po_token,
-            po_token_verifier=self.po_token_verifier
+            po_token_verifier=self.po_token_verifier,
+            session=self.session
         )
         innertube_response = innertube.next(self.video_id)
         self._vid_details = innertube_response
@@ -577,7 +838,8 @@ class YouTube:
             token_file=self.token_file,
             oauth_verifier=self.oauth_verifier,
             use_po_token=self.use_po_token,
-            po_token_verifier=self.po_token_verifier
+            po_token_verifier=self.po_token_verifier,
+            session=self.session
         )
 
         if innertube.require_js_player:
@@ -612,7 +874,8 @@ class YouTube:
             token_file=self.token_file,
             oauth_verifier=self.oauth_verifier,
             use_po_token=self.use_po_token,
-            po_token_verifier=self.po_token_verifier
+            po_token_verifier=self.po_token_verifier,
+            session=self.session
         )
 
         innertube.innertube_context.update(self.signature_timestamp)
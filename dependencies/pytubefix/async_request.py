@@ -0,0 +1,624 @@
+"""Implements an asyncio counterpart of :mod:`pytubefix.request`.
+
+The transfers run on a small keep-alive HTTP/1.1 client built on asyncio
+streams, so a single event loop can drive many downloads at once instead of
+using one thread per download. Range sizes, pool limits and the file size
+cache are shared with the blocking API, and errors are raised as the same
+urllib exceptions.
+"""
+import asyncio
+import http.client
+import io
+import json
+import logging
+import socket
+import ssl
+import time
+import weakref
+from urllib import parse
+from urllib.error import HTTPError, URLError
+
+from pytubefix import request, throttle
+from pytubefix.exceptions import MaxRetriesExceeded
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of redirects followed by a single request.
+max_redirects = 10
+
+_ssl_context = None
+
+# Connections can't be shared between event loops, each one gets its own pool.
+_pools = weakref.WeakKeyDictionary()
+
+
+class _Connection:
+    """A keep-alive connection to a single host."""
+
+    def __init__(self, host_key, reader, writer):
+        self.host_key = host_key
+        self.reader = reader
+        self.writer = writer
+        self.last_used = time.monotonic()
+        self.reused = False
+
+    def close(self):
+        self.writer.close()
+
+
+class ConnectionPool:
+    """Keep-alive connections of one event loop, grouped by host.
+
+    Follows the settings of the blocking pool: at most
+    ``request.default_pool_max_connections_per_host`` connections are opened
+    to a host at the same time, extra requests wait for one to be released,
+    and connections idle for more than ``request.default_pool_idle_timeout``
+    seconds are closed instead of being reused.
+    """
+
+    def __init__(self):
+        # (scheme, host, port) -> idle connections
+        self._idle = {}
+        # (scheme, host, port) -> semaphore limiting the open connections
+        self._slots = {}
+
+    async def acquire(self, scheme, host, port, timeout):
+        """Get an idle connection to a host, or open a new one.
+
+        :rtype: _Connection
+        """
+        host_key = (scheme, host, port)
+        slots = self._slots.get(host_key)
+        if slots is None:
+            slots = asyncio.Semaphore(request.default_pool_max_connections_per_host)
+            self._slots[host_key] = slots
+        await slots.acquire()
+
+        try:
+            idle = self._idle.get(host_key, [])
+            while idle:
+                connection = idle.pop()
+                expired = time.monotonic() - connection.last_used >= request.default_pool_idle_timeout
+                if expired or connection.reader.at_eof():
+                    connection.close()
+                    continue
+                connection.reused = True
+                return connection
+
+            reader, writer = await _wait(
+                asyncio.open_connection(host, port, ssl=_get_ssl_context() if scheme == "https" else None),
+                timeout
+            )
+            return _Connection(host_key, reader, writer)
+        except BaseException:
+            slots.release()
+            raise
+
+    def release(self, connection, reusable):
+        """Give a connection back, closing it if it can't serve another request."""
+        if reusable:
+            connection.last_used = time.monotonic()
+            self._idle.setdefault(connection.host_key, []).append(connection)
+        else:
+            connection.close()
+        self._slots[connection.host_key].release()
+
+    def close(self):
+        """Close every idle connection."""
+        for idle in self._idle.values():
+            for connection in idle:
+                connection.close()
+        self._idle.clear()
+
+
+class Response:
+    """Response of an asynchronous request, the body is read on demand.
+
+    The connection goes back to the pool as soon as the body is fully read,
+    and is closed if the response is closed before that.
+    """
+
+    def __init__(self, pool, connection, method, status, reason, headers, keep_alive, timeout):
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self._pool = pool
+        self._connection = connection
+        self._keep_alive = keep_alive
+        self._timeout = timeout
+        self._chunked = False
+
+        length = headers.get("Content-Length")
+        if method == "HEAD" or status in (204, 304):
+            self._remaining = 0
+        elif "chunked" in headers.get("Transfer-Encoding", "").lower():
+            self._chunked = True
+            # Bytes left in the current chunk
+            self._remaining = 0
+        elif length is not None:
+            self._remaining = int(length)
+        else:
+            # The body ends when the server closes the connection
+            self._remaining = None
+            self._keep_alive = False
+
+        if self._remaining == 0 and not self._chunked:
+            self._finish()
+
+    def _finish(self):
+        if self._connection is not None:
+            self._pool.release(self._connection, self._keep_alive)
+            self._connection = None
+
+    def close(self):
+        """Drop the rest of the body and the connection with it."""
+        if self._connection is not None:
+            self._pool.release(self._connection, False)
+            self._connection = None
+
+    async def _read_part(self, amount):
+        reader = self._connection.reader
+        if self._chunked:
+            if self._remaining == 0:
+                line = await reader.readline()
+                try:
+                    size = int(line.split(b";")[0].strip(), 16)
+                except ValueError:
+                    raise http.client.IncompleteRead(b"")
+                if size == 0:
+                    # Skip the trailers
+                    while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                        pass
+                    self._finish()
+                    return b""
+                self._remaining = size
+            data = await reader.read(min(amount, self._remaining))
+            if not data:
+                raise http.client.IncompleteRead(b"", self._remaining)
+            self._remaining -= len(data)
+            if self._remaining == 0:
+                await reader.readexactly(2)
+            return data
+
+        if self._remaining is None:
+            data = await reader.read(amount)
+            if not data:
+                self._finish()
+            return data
+
+        data = await reader.read(min(amount, self._remaining))
+        if not data:
+            raise http.client.IncompleteRead(b"", self._remaining)
+        self._remaining -= len(data)
+        if self._remaining == 0:
+            self._finish()
+        return data
+
+    async def read_part(self, amount):
+        """Read at most ``amount`` bytes of the body.
+
+        :rtype: bytes
+        :returns:
+            The bytes read, empty once the body is complete.
+        """
+        if self._connection is None:
+            return b""
+        try:
+            return await _wait(self._read_part(amount), self._timeout)
+        except BaseException:
+            self.close()
+            raise
+
+    async def readinto(self, buffer):
+        """Read the next part of the body into ``buffer``.
+
+        :rtype: int
+        :returns:
+            The number of bytes read, 0 once the body is complete.
+        """
+        data = await self.read_part(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+    async def read(self):
+        """Read the whole body.
+
+        :rtype: bytes
+        """
+        body = bytearray()
+        while True:
+            data = await self.read_part(request.default_buffer_size)
+            if not data:
+                return bytes(body)
+            body += data
+
+
+def _get_ssl_context():
+    global _ssl_context
+    if _ssl_context is None:
+        _ssl_context = ssl.create_default_context()
+    return _ssl_context
+
+
+async def _wait(awaitable, timeout):
+    if timeout is None:
+        return await awaitable
+    return await asyncio.wait_for(awaitable, timeout)
+
+
+def _pool():
+    """Get the connection pool of the running event loop."""
+    loop = asyncio.get_running_loop()
+    pool = _pools.get(loop)
+    if pool is None:
+        pool = ConnectionPool()
+        _pools[loop] = pool
+    return pool
+
+
+async def close_pool():
+    """Close the pooled connections of the running event loop."""
+    pool = _pools.pop(asyncio.get_running_loop(), None)
+    if pool is not None:
+        pool.close()
+
+
+async def _send(method, url, headers, data, timeout):
+    """Send a single request and read the head of its response.
+
+    :rtype: Response
+    """
+    split_url = parse.urlsplit(url)
+    scheme = split_url.scheme.lower()
+    port = split_url.port or (443 if scheme == "https" else 80)
+    target = split_url.path or "/"
+    if split_url.query:
+        target += f"?{split_url.query}"
+
+    host = split_url.hostname if split_url.port is None else f"{split_url.hostname}:{port}"
+    lines = [f"{method} {target} HTTP/1.1", f"Host: {host}"]
+    lines += [f"{name}: {value}" for name, value in headers.items()]
+    if data is not None:
+        lines.append(f"Content-Length: {len(data)}")
+    head = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+    pool = _pool()
+    while True:
+        connection = await pool.acquire(scheme, split_url.hostname, port, timeout)
+        try:
+            connection.writer.write(head + data if data else head)
+            await _wait(connection.writer.drain(), timeout)
+            status_line = await _wait(connection.reader.readline(), timeout)
+            if not status_line:
+                raise ConnectionResetError("Connection closed by the server")
+
+            version, status, reason = (status_line.decode("latin-1").rstrip("\r\n").split(None, 2) + [""])[:3]
+            response_headers = http.client.HTTPMessage()
+            while True:
+                line = await _wait(connection.reader.readline(), timeout)
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                response_headers[name.strip()] = value.strip()
+        except ConnectionError:
+            pool.release(connection, False)
+            # The server may have closed a kept-alive connection in the meantime
+            if connection.reused:
+                continue
+            raise
+        except BaseException:
+            pool.release(connection, False)
+            raise
+
+        keep_alive = version == "HTTP/1.1" and response_headers.get("Connection", "").lower() != "close"
+        return Response(pool, connection, method, int(status), reason, response_headers, keep_alive, timeout)
+
+
+async def _execute_request(
+    url,
+    method=None,
+    headers=None,
+    data=None,
+    timeout=socket._GLOBAL_DEFAULT_TIMEOUT
+):
+    base_headers = {"User-Agent": "Mozilla/5.0", "accept-language": "en-US,en"}
+    if headers:
+        base_headers.update(headers)
+    if data and not isinstance(data, bytes): # encode data for request
+            data = bytes(json.dumps(data), encoding="utf-8")
+    if not url.lower().startswith("http"):
+        raise ValueError("Invalid URL")
+    if method is None:
+        method = "POST" if data is not None else "GET"
+    if timeout is socket._GLOBAL_DEFAULT_TIMEOUT:
+        timeout = socket.getdefaulttimeout()
+
+    for _ in range(max_redirects + 1):
+        try:
+            response = await _send(method, url, base_headers, data, timeout)
+        except asyncio.TimeoutError as e:
+            raise URLError(socket.timeout("timed out")) from e
+        except OSError as e:
+            raise URLError(e) from e
+
+        location = response.headers.get("Location")
+        if response.status in (301, 302, 303, 307, 308) and location:
+            response.close()
+            url = parse.urljoin(url, location)
+            if response.status == 303:
+                method, data = "GET", None
+            continue
+
+        if response.status >= 400:
+            body = await response.read()
+            raise HTTPError(url, response.status, response.reason, response.headers, io.BytesIO(body))
+        return response
+
+    raise URLError(OSError(f"Exceeded {max_redirects} redirects"))
+
+
+async def _in_thread(iterator):
+    """Iterate over a blocking generator from worker threads, a chunk at a time."""
+    done = object()
+    while True:
+        chunk = await asyncio.to_thread(next, iterator, done)
+        if chunk is done:
+            return
+        yield chunk
+
+
+async def get(url, extra_headers=None, timeout=socket._GLOBAL_DEFAULT_TIMEOUT):
+    """Send an http GET request.
+
+    :param str url:
+        The URL to perform the GET request for.
+    :param dict extra_headers:
+        Extra headers to add to the request
+    :rtype: str
+    :returns:
+        UTF-8 encoded string of response
+    """
+    if request._proxies:
+        # Proxies are only supported by the blocking transport
+        return await asyncio.to_thread(request.get, url, extra_headers, timeout)
+    response = await _execute_request(url, headers=extra_headers, timeout=timeout)
+    return (await response.read()).decode("utf-8")
+
+
+async def post(url, extra_headers=None, data=None, timeout=socket._GLOBAL_DEFAULT_TIMEOUT):
+    """Send an http POST request.
+
+    :param str url:
+        The URL to perform the POST request for.
+    :param dict extra_headers:
+        Extra headers to add to the request
+    :param dict data:
+        The data to send on the POST request
+    :rtype: str
+    :returns:
+        UTF-8 encoded string of response
+    """
+    if request._proxies:
+        return await asyncio.to_thread(request.post, url, extra_headers, data, timeout)
+    if extra_headers is None:
+        extra_headers = {}
+    if data is None:
+        data = {}
+    # required because the youtube servers are strict on content type
+    extra_headers.update({"Content-Type": "application/json"})
+    response = await _execute_request(url, headers=extra_headers, data=data, timeout=timeout)
+    return (await response.read()).decode("utf-8")
+
+
+async def head(url):
+    """Fetch headers returned http GET request.
+
+    :param str url:
+        The URL to perform the GET request for.
+    :rtype: dict
+    :returns:
+        dictionary of lowercase headers
+    """
+    if request._proxies:
+        return await asyncio.to_thread(request.head, url)
+    response = await _execute_request(url, method="HEAD")
+    return {k.lower(): v for k, v in response.headers.items()}
+
+
+async def filesize(url):
+    """Fetch size in bytes of file at given URL
+
+    The result is kept in the cache shared with :func:`pytubefix.request.filesize`.
+
+    :param str url: The URL to get the size of
+    :returns: int: size in bytes of remote file
+    """
+    size = request._filesize_cache.get(url)
+    if size is None:
+        size = int((await head(url))["content-length"])
+        request._cache_filesize(url, size)
+    return size
+
+
+async def _request_range(url, start, stop, timeout, max_retries):
+    """Request the bytes ``start`` to ``stop`` (inclusive) of a stream.
+
+    Timeouts and incomplete reads are retried up to ``max_retries`` times.
+
+    :rtype: Response
+    """
+    tries = 0
+    while True:
+        if tries >= 1 + max_retries:
+            raise MaxRetriesExceeded()
+
+        try:
+            return await _execute_request(f"{url}&range={start}-{stop}", method="GET", timeout=timeout)
+        except URLError as e:
+            if not isinstance(e.reason, (socket.timeout, OSError)):
+                raise
+        except http.client.IncompleteRead:
+            pass
+        if request.adaptive_range_size:
+            request.range_size_controller.failure(url)
+        tries += 1
+
+
+async def _read_chunks(response, url, buffer, limiter=None):
+    """Read the body of a range response into a reusable buffer.
+
+    See :func:`pytubefix.request._read_chunks`.
+
+    :rtype: AsyncIterator[memoryview]
+    """
+    view = memoryview(buffer)
+    try:
+        while True:
+            try:
+                size = await response.readinto(buffer)
+            except (http.client.IncompleteRead, asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+                # The connection broke mid-range, request the rest again
+                size = 0
+                if request.adaptive_range_size:
+                    request.range_size_controller.failure(url)
+            if not size:
+                break
+            await throttle.consume_async(size, limiter)
+            yield view[:size]
+    finally:
+        response.close()
+
+
+async def stream(url,
+                 timeout=socket._GLOBAL_DEFAULT_TIMEOUT,
+                 max_retries=0,
+                 file_size=None,
+                 buffer=None,
+                 limiter=None):
+    """Read the response in chunks.
+
+    Asynchronous version of :func:`pytubefix.request.stream`.
+
+    :param str url: The URL to perform the GET request for.
+    :param int file_size: (Optional) Size of the file in bytes, if already known.
+    :param bytearray buffer:
+        (Optional) Buffer to read into. When given, the chunks are views of
+        this buffer, only valid until the next chunk is requested. Otherwise
+        every chunk is a new bytes object.
+    :param TokenBucket limiter:
+        (Optional) Bandwidth limit of this download, see :mod:`pytubefix.throttle`.
+    :rtype: AsyncIterator[bytes]
+    """
+    if request._proxies:
+        async for chunk in _in_thread(request.stream(url, timeout, max_retries, file_size, buffer, limiter)):
+            yield chunk
+        return
+
+    file_size = file_size or request._filesize_cache.get(url)
+    shared = buffer is not None
+    if not shared:
+        buffer = bytearray(request.default_buffer_size)
+    downloaded = 0
+    if file_size is None:
+        range_size = request._range_size(url)
+        started = time.monotonic()
+        response = await _request_range(url, 0, range_size - 1, timeout, max_retries)
+        file_size = request._content_range_total(response)
+        expected = int(response.headers.get("Content-Length", -1))
+
+        paused = 0.0
+        chunks = _read_chunks(response, url, buffer, limiter)
+        try:
+            async for chunk in chunks:
+                downloaded += len(chunk)
+                yielded = time.monotonic()
+                yield chunk if shared else bytes(chunk)
+                paused += time.monotonic() - yielded
+        finally:
+            # Give the connection back now if the consumer stopped early
+            await chunks.aclose()
+
+        if request.adaptive_range_size:
+            request.range_size_controller.success(url, range_size, downloaded, time.monotonic() - started - paused)
+
+        if file_size is None:
+            if downloaded == expected and downloaded < range_size:
+                file_size = downloaded
+            else:
+                file_size = await filesize(url)
+        request._cache_filesize(url, file_size)
+
+    chunks = range_stream(
+        url,
+        downloaded,
+        file_size - 1,
+        timeout=timeout,
+        max_retries=max_retries,
+        buffer=buffer if shared else None,
+        limiter=limiter
+    )
+    try:
+        async for chunk in chunks:
+            yield chunk
+    finally:
+        await chunks.aclose()
+
+
+async def range_stream(url,
+                       start,
+                       stop,
+                       timeout=socket._GLOBAL_DEFAULT_TIMEOUT,
+                       max_retries=0,
+                       buffer=None,
+                       limiter=None):
+    """Read the bytes ``start`` to ``stop`` (inclusive) of a stream in chunks.
+
+    Asynchronous version of :func:`pytubefix.request.range_stream`.
+
+    :param str url: The URL to perform the GET requests for.
+    :param int start: Offset of the first byte to read.
+    :param int stop: Offset of the last byte to read.
+    :param bytearray buffer:
+        (Optional) Buffer to read into, see :func:`stream`.
+    :param TokenBucket limiter:
+        (Optional) Bandwidth limit of this download, see :mod:`pytubefix.throttle`.
+    :rtype: AsyncIterator[bytes]
+    """
+    if request._proxies:
+        async for chunk in _in_thread(request.range_stream(url, start, stop, timeout, max_retries, buffer, limiter)):
+            yield chunk
+        return
+
+    shared = buffer is not None
+    if not shared:
+        buffer = bytearray(request.default_buffer_size)
+    downloaded = start
+    stalls = 0
+    while downloaded <= stop:
+        stop_pos = min(downloaded + request._range_size(url) - 1, stop)
+        started = time.monotonic()
+        response = await _request_range(url, downloaded, stop_pos, timeout, max_retries)
+
+        received = 0
+        paused = 0.0
+        chunks = _read_chunks(response, url, buffer, limiter)
+        try:
+            async for chunk in chunks:
+                if len(chunk) > stop + 1 - downloaded:
+                    chunk = chunk[:stop + 1 - downloaded]
+                received += len(chunk)
+                downloaded += len(chunk)
+                yielded = time.monotonic()
+                yield chunk if shared else bytes(chunk)
+                paused += time.monotonic() - yielded
+        finally:
+            await chunks.aclose()
+
+        if request.adaptive_range_size:
+            request.range_size_controller.success(
+                url, stop_pos + 1 - (downloaded - received), received, time.monotonic() - started - paused
+            )
+
+        stalls = stalls + 1 if not received else 0
+        if stalls > max_retries:
+            raise MaxRetriesExceeded()
@@ -2,11 +2,12 @@
 """Module for interacting with a user's youtube channel."""
 import json
 import logging
-from typing import Dict, List, Optional, Tuple, Iterable, Any, Callable
+from typing import Dict, List, Optional, Tuple, Iterable, Any, Callable, Union
 
 from pytubefix import extract, YouTube, Playlist, request
 from pytubefix.helpers import cache, uniqueify, DeferredGeneratorList
 from pytubefix.innertube import InnerTube
+from pytubefix.session import Session
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +24,7 @@ class Channel(Playlist):
             oauth_verifier: Optional[Callable[[str, str], None]] = None,
             use_po_token: Optional[bool] = False,
             po_token_verifier: Optional[Callable[[None], Tuple[str, str]]] = None,
+            session: Optional[Session] = None,
     ):
         """Construct a :class:`Channel <Channel>`.
         :param str url:
@@ -51,6 +53,9 @@ class Channel(Playlist):
             (Optional) Verified used to obtain the visitorData and po_token.
             The verifier will return the visitorData and po_token respectively.
             (if passed, else default verifier will be used)
+        :param Session session:
+            (Optional) Session shared by the videos of the channel. Defaults to
+            a new one.
         """
         super().__init__(url, proxies)
 
@@ -65,6 +70,8 @@ class Channel(Playlist):
         self.use_po_token = use_po_token
         self.po_token_verifier = po_token_verifier
 
+        self.session = session or Session()
+
         self.channel_url = (
             f"https://www.youtube.com{self.channel_uri}"
         )
@@ -278,11 +285,11 @@ class Channel(Playlist):
         # remove duplicates
         return uniqueify(items_obj)
 
-    def _extract_videos(self, raw_json: str, context: Optional[Any] = None) -> Tuple[List[str], Optional[str]]:
-        """Extracts videos from a raw json page
+    def _extract_videos(self, raw_json: Union[dict, str], context: Optional[Any] = None) -> Tuple[List[str], Optional[str]]:
+        """Extracts videos from a json page
 
-        :param str raw_json: Input json extracted from the page or the last
-            server response
+        :param dict raw_json: Input json extracted from the page or the last
+            server response, parsed or not
         :rtype: Tuple[List[str], Optional[str]]
         :returns: Tuple containing a list of up to 100 video watch ids and
             a continuation token, if more videos are available
@@ -358,7 +365,8 @@ class Channel(Playlist):
                            token_file=self.token_file,
                            oauth_verifier=self.oauth_verifier,
                            use_po_token=self.use_po_token,
-                           po_token_verifier=self.po_token_verifier
+                           po_token_verifier=self.po_token_verifier,
+                           session=self.session
                            )
         except (KeyError, IndexError, TypeError):
             return self._extract_shorts_id(x)
@@ -384,7 +392,8 @@ class Channel(Playlist):
                            token_file=self.token_file,
                            oauth_verifier=self.oauth_verifier,
                            use_po_token=self.use_po_token,
-                           po_token_verifier=self.po_token_verifier
+                           po_token_verifier=self.po_token_verifier,
+                           session=self.session
                            )
         except (KeyError, IndexError, TypeError):
             return self._extract_release_id(x)
@@ -403,7 +412,8 @@ class Channel(Playlist):
                             token_file=self.token_file,
                             oauth_verifier=self.oauth_verifier,
                             use_po_token=self.use_po_token,
-                            po_token_verifier=self.po_token_verifier
+                            po_token_verifier=self.po_token_verifier,
+                            session=self.session
                             )
         except (KeyError, IndexError, TypeError):
             return self._extract_video_id_from_home(x)
@@ -423,7 +433,8 @@ class Channel(Playlist):
                            token_file=self.token_file,
                            oauth_verifier=self.oauth_verifier,
                            use_po_token=self.use_po_token,
-                           po_token_verifier=self.po_token_verifier
+                           po_token_verifier=self.po_token_verifier,
+                           session=self.session
                            )
         except (KeyError, IndexError, TypeError):
             return self._extract_shorts_id_from_home(x)
@@ -442,7 +453,8 @@ class Channel(Playlist):
                            token_file=self.token_file,
                            oauth_verifier=self.oauth_verifier,
                            use_po_token=self.use_po_token,
-                           po_token_verifier=self.po_token_verifier
+                           po_token_verifier=self.po_token_verifier,
+                           session=self.session
                            )
         except (KeyError, IndexError, TypeError):
             return self._extract_playlist_id(x)
@@ -461,7 +473,8 @@ class Channel(Playlist):
                             token_file=self.token_file,
                             oauth_verifier=self.oauth_verifier,
                             use_po_token=self.use_po_token,
-                            po_token_verifier=self.po_token_verifier
+                            po_token_verifier=self.po_token_verifier,
+                            session=self.session
                             )
         except (KeyError, IndexError, TypeError):
             return self._extract_channel_id_from_home(x)
@@ -480,7 +493,8 @@ class Channel(Playlist):
                            token_file=self.token_file,
                            oauth_verifier=self.oauth_verifier,
                            use_po_token=self.use_po_token,
-                           po_token_verifier=self.po_token_verifier
+                           po_token_verifier=self.po_token_verifier,
+                           session=self.session
                            )
         except (KeyError, IndexError, TypeError):
             return self._extract_playlist_id_from_lockup_view_model(x)
@@ -499,7 +513,8 @@ class Channel(Playlist):
                             token_file=self.token_file,
                             oauth_verifier=self.oauth_verifier,
                             use_po_token=self.use_po_token,
-                            po_token_verifier=self.po_token_verifier
+                            po_token_verifier=self.po_token_verifier,
+                            session=self.session
                             )
         except (KeyError, IndexError, TypeError):
             return []
@@ -1,12 +1,17 @@
 """Module to download a complete playlist from a youtube channel."""
+import collections
 import json
 import logging
+import queue
+import threading
 from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
 from typing import Dict, Iterable, List, Optional, Tuple, Union, Any, Callable
 
 from pytubefix import extract, request, YouTube
 from pytubefix.innertube import InnerTube
+from pytubefix.session import Session
 from pytubefix.helpers import cache, DeferredGeneratorList, install_proxy, uniqueify
 
 logger = logging.getLogger(__name__)
@@ -15,6 +20,10 @@ logger = logging.getLogger(__name__)
 class Playlist(Sequence):
     """Load a YouTube playlist with URL"""
 
+    # Amount of pages of videos requested in the background ahead of the page
+    # being read. 0 requests each page when the previous one is consumed.
+    prefetch_pages = 2
+
     def __init__(
             self,
             url: str,
@@ -26,6 +35,8 @@ class Playlist(Sequence):
             oauth_verifier: Optional[Callable[[str, str], None]] = None,
             use_po_token: Optional[bool] = False,
             po_token_verifier: Optional[Callable[[None], Tuple[str, str]]] = None,
+            session: Optional[Session] = None,
+            video_fields: Optional[Iterable[str]] = None,
     ):
         """
         :param dict proxies:
@@ -52,6 +63,14 @@ class Playlist(Sequence):
             (Optional) Verified used to obtain the visitorData and po_token.
             The verifier will return the visitorData and po_token respectively.
             (if passed, else default verifier will be used)
+        :param Session session:
+            (Optional) Session shared by the videos of the playlist. Defaults to
+            a new one, so the visitorData and tokens are resolved once for the
+            whole playlist instead of once per video.
+        :param Iterable[str] video_fields:
+            (Optional) Properties that will be read from the videos, passed as
+            the ``fields`` of every :class:`YouTube <YouTube>` object so they
+            skip the watch page when it is not needed.
         """
         if proxies:
             install_proxy(proxies)
@@ -68,6 +87,9 @@ class Playlist(Sequence):
         self.use_po_token = use_po_token
         self.po_token_verifier = po_token_verifier
 
+        self.session = session or Session()
+        self.video_fields = video_fields
+
         # These need to be initialized as None for the properties.
         self._html = None
         self._ytcfg = None
@@ -165,9 +187,12 @@ class Playlist(Sequence):
         :rtype: Iterable[List[str]]
         :returns: Iterable of lists of YouTube watch ids
         """
-        videos_urls, continuation = self._extract_videos(
-            json.dumps(extract.initial_data(initial_html)), context
-        )
+        # The page of the playlist is usually parsed already
+        if initial_html is self._html:
+            initial_data = self.initial_data
+        else:
+            initial_data = extract.initial_data(initial_html)
+        videos_urls, continuation = self._extract_videos(initial_data, context)
         if until_watch_id:
             try:
                 trim_index = videos_urls.index(f"/watch?v={until_watch_id}")
@@ -175,34 +200,116 @@ class Playlist(Sequence):
                 return
             except ValueError:
                 pass
-        yield videos_urls
 
         # Extraction from a playlist only returns 100 videos at a time
         # if self._extract_videos returns a continuation there are more
         # than 100 songs inside a playlist, so we need to add further requests
         # to gather all of them
+        stop = threading.Event()
+        next_pages = self._continuation_pages(continuation, context, stop)
+        try:
+            yield videos_urls
+
+            for videos_urls in next_pages:
+                if until_watch_id:
+                    try:
+                        trim_index = videos_urls.index(f"/watch?v={until_watch_id}")
+                        yield videos_urls[:trim_index]
+                        return
+                    except ValueError:
+                        pass
+                yield videos_urls
+        finally:
+            # Stops the background requests when the caller stops reading
+            stop.set()
+
+    def _fetch_page(self, continuation: str, context: Optional[Any] = None) -> Tuple[List[str], Optional[str]]:
+        """Request the page of videos following a continuation token.
 
-        while continuation:  # there is an url found
-            # requesting the next page of videos with the url generated from the
-            # previous page, needs to be a post
-            req = InnerTube('WEB').browse(continuation=continuation, visitor_data=self._visitor_data)
-            # extract up to 100 songs from the page loaded
-            # returns another continuation if more videos are available
-            videos_urls, continuation = self._extract_videos(req, context)
-            if until_watch_id:
+        :rtype: Tuple[List[str], Optional[str]]
+        :returns: The videos of the page and the continuation token of the
+            next page, if any
+        """
+        # requesting the next page of videos with the url generated from the
+        # previous page, needs to be a post
+        req = InnerTube('WEB').browse(continuation=continuation, visitor_data=self._visitor_data)
+        # extract up to 100 songs from the page loaded
+        # returns another continuation if more videos are available
+        return self._extract_videos(req, context)
+
+    def _continuation_pages(
+            self,
+            continuation: Optional[str],
+            context: Optional[Any] = None,
+            stop: Optional[threading.Event] = None
+    ) -> Iterable[List[str]]:
+        """Get the pages of videos following a continuation token.
+
+        Each page holds the token of the next one, so pages can't be requested
+        in parallel. Instead, up to :attr:`prefetch_pages` pages are requested
+        in the background, while the caller processes the previous ones.
+
+        :param threading.Event stop:
+            (Optional) Event set when no more pages are needed, ends the
+            background requests.
+        :rtype: Iterable[List[str]]
+        """
+        if not continuation:
+            return iter(())
+
+        if self.prefetch_pages < 1:
+            def serial_pages(continuation):
+                while continuation:
+                    videos_urls, continuation = self._fetch_page(continuation, context)
+                    yield videos_urls
+            return serial_pages(continuation)
+
+        pages = queue.Queue(maxsize=self.prefetch_pages)
+        stop = stop or threading.Event()
+
+        def put(item) -> bool:
+            # Gives up when the caller stopped reading the pages
+            while not stop.is_set():
                 try:
-                    trim_index = videos_urls.index(f"/watch?v={until_watch_id}")
-                    yield videos_urls[:trim_index]
-                    return
-                except ValueError:
-                    pass
-            yield videos_urls
+                    pages.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
 
-    def _extract_videos(self, raw_json: str, context: Optional[Any] = None) -> Tuple[List[str], Optional[str]]:
-        """Extracts videos from a raw json page
+        def fetch_pages(continuation):
+            try:
+                while continuation:
+                    videos_urls, continuation = self._fetch_page(continuation, context)
+                    if not put(videos_urls):
+                        return
+            except Exception as e:
+                put(e)
+                return
+            put(None)
 
-        :param str raw_json: Input json extracted from the page or the last
-            server response
+        # Started right away, the first request runs while the caller reads the
+        # first page
+        threading.Thread(target=fetch_pages, args=(continuation,), daemon=True).start()
+
+        def prefetched_pages():
+            try:
+                while True:
+                    item = pages.get()
+                    if item is None:
+                        return
+                    if isinstance(item, Exception):
+                        raise item
+                    yield item
+            finally:
+                stop.set()
+        return prefetched_pages()
+
+    def _extract_videos(self, raw_json: Union[dict, str], context: Optional[Any] = None) -> Tuple[List[str], Optional[str]]:
+        """Extracts videos from a json page
+
+        :param dict raw_json: Input json extracted from the page or the last
+            server response, parsed or not
         :param Optional[Any] context: Auxiliary object from _paginate
         :rtype: Tuple[List[str], Optional[str]]
         :returns: Tuple containing a list of up to 100 video watch ids and
@@ -340,18 +447,79 @@ class Playlist(Sequence):
         """
         return DeferredGeneratorList(self.url_generator())
 
+    def _video(self, url: str) -> YouTube:
+        """Create the :class:`YouTube <YouTube>` object of a video of the playlist."""
+        return YouTube(
+            url,
+            client=self.client,
+            use_oauth=self.use_oauth,
+            allow_oauth_cache=self.allow_oauth_cache,
+            token_file=self.token_file,
+            oauth_verifier=self.oauth_verifier,
+            use_po_token=self.use_po_token,
+            po_token_verifier=self.po_token_verifier,
+            session=self.session,
+            fields=self.video_fields
+        )
+
     def videos_generator(self):
         for url in self.video_urls:
-            yield YouTube(
-                url,
-                client=self.client,
-                use_oauth=self.use_oauth,
-                allow_oauth_cache=self.allow_oauth_cache,
-                token_file=self.token_file,
-                oauth_verifier=self.oauth_verifier,
-                use_po_token=self.use_po_token,
-                po_token_verifier=self.po_token_verifier
-            )
+            yield self._video(url)
+
+    def _resolve_video(self, video: YouTube) -> YouTube:
+        """Request the player response of a video, and its streams if needed.
+
+        Errors are not raised here, the same properties raise them again when
+        the caller reads them.
+        """
+        if not isinstance(video, YouTube):
+            return video
+        try:
+            video.vid_info
+            if self.video_fields is None or 'streams' in self.video_fields:
+                video.fmt_streams
+        except Exception as e:
+            logger.debug(f"unable to resolve {video.video_id} ahead: {e}")
+        return video
+
+    def videos_parallel(self, workers: int = 4, lookahead: Optional[int] = None) -> Iterable[YouTube]:
+        """Yields YouTube objects of videos in this playlist, resolved ahead.
+
+        The player responses (and streams) of the next videos are requested by
+        a pool of threads while the caller processes the current one. Videos
+        are still yielded in the order of the playlist.
+
+        :param int workers:
+            (Optional) Amount of videos resolved at the same time. Defaults
+            to 4.
+        :param int lookahead:
+            (Optional) Amount of videos resolved ahead of the one yielded,
+            which bounds the memory used. Defaults to twice the workers.
+        :rtype: Iterable[YouTube]
+        """
+        if workers < 1:
+            yield from self.videos_generator()
+            return
+
+        lookahead = max(lookahead or workers * 2, 1)
+        videos = self.videos_generator()
+        pending = collections.deque()
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='pytubefix-playlist')
+        try:
+            for video in videos:
+                pending.append(executor.submit(self._resolve_video, video))
+                if len(pending) >= lookahead:
+                    break
+
+            while pending:
+                video = pending.popleft().result()
+                # Keeps the window full before handing the video to the caller
+                for next_video in videos:
+                    pending.append(executor.submit(self._resolve_video, next_video))
+                    break
+                yield video
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
     @property
     def videos(self) -> Iterable[YouTube]:
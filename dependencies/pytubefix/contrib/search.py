@@ -9,6 +9,7 @@ from pytubefix import YouTube, Channel, Playlist
 from pytubefix.helpers import install_proxy
 from pytubefix.innertube import InnerTube
 from pytubefix.protobuf import encode_protobuf
+from pytubefix.session import Session
 
 logger = logging.getLogger(__name__)
 
@@ -293,7 +294,8 @@ class Search:
             oauth_verifier: Optional[Callable[[str, str], None]] = None,
             use_po_token: Optional[bool] = False,
             po_token_verifier: Optional[Callable[[None], Tuple[str, str]]] = None,
-            filters: Optional[Filter] = None
+            filters: Optional[Filter] = None,
+            session: Optional[Session] = None
     ):
         """Initialize Search object.
 
@@ -327,6 +329,8 @@ class Search:
             (Optional) Apply filters when searching.
             Can be used: `upload_date`, `type`, `duration`, `features`, `sort_by`.
             features can be combined into a list with other parameters of the same type.
+        :param Session session:
+            (Optional) Session shared by the videos found. Defaults to a new one.
         """
         self.query = query
         self.client = client
@@ -338,6 +342,8 @@ class Search:
         self.use_po_token = use_po_token
         self.po_token_verifier = po_token_verifier
 
+        self.session = session or Session()
+
         self._innertube_client = InnerTube(
             client='WEB',
             use_oauth=self.use_oauth,
@@ -345,7 +351,8 @@ class Search:
             token_file=self.token_file,
             oauth_verifier=self.oauth_verifier,
             use_po_token=self.use_po_token,
-            po_token_verifier=self.po_token_verifier
+            po_token_verifier=self.po_token_verifier,
+            session=self.session
         )
 
         # The first search, without a continuation, is structured differently
@@ -593,7 +600,8 @@ class Search:
                                              token_file=self.token_file,
                                              oauth_verifier=self.oauth_verifier,
                                              use_po_token=self.use_po_token,
-                                             po_token_verifier=self.po_token_verifier
+                                             po_token_verifier=self.po_token_verifier,
+                                             session=self.session
                                              ))
 
                 # Get channel results
@@ -606,7 +614,8 @@ class Search:
                                            token_file=self.token_file,
                                            oauth_verifier=self.oauth_verifier,
                                            use_po_token=self.use_po_token,
-                                           po_token_verifier=self.po_token_verifier
+                                           po_token_verifier=self.po_token_verifier,
+                                           session=self.session
                                            ))
 
                 # Get shorts results
@@ -625,7 +634,8 @@ class Search:
                                               token_file=self.token_file,
                                               oauth_verifier=self.oauth_verifier,
                                               use_po_token=self.use_po_token,
-                                              po_token_verifier=self.po_token_verifier
+                                              po_token_verifier=self.po_token_verifier,
+                                              session=self.session
                                               ))
 
                 # Get videos results
@@ -638,7 +648,8 @@ class Search:
                                           token_file=self.token_file,
                                           oauth_verifier=self.oauth_verifier,
                                           use_po_token=self.use_po_token,
-                                          po_token_verifier=self.po_token_verifier
+                                          po_token_verifier=self.po_token_verifier,
+                                          session=self.session
                                           ))
 
             results['videos'] = videos
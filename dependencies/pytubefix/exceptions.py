@@ -20,6 +20,10 @@ class MaxRetriesExceeded(PytubeFixError):
         super().__init__("Maximum number of retries exceeded")
 
 
+class StreamRefreshError(PytubeFixError):
+    """The signed url of a stream could not be refreshed."""
+
+
 class HTMLParseError(PytubeFixError):
     """HTML could not be parsed"""
 
@@ -277,6 +277,21 @@ def js_url(html: str) -> str:
     return f"https://youtube.com{base_js}"
 
 
+def js_url_from_iframe_api(js: str) -> str:
+    """Get the base JavaScript url from the iframe API loader.
+
+    The loader weighs a few kilobytes and references the same player as the
+    watch page, which weighs about a megabyte.
+
+    :param str js:
+        The contents of https://www.youtube.com/iframe_api.
+    :rtype: str
+    """
+    pattern = r"player\\?/([0-9a-fA-F]{8})\\?/"
+    player_id = regex_search(pattern, js, group=1)
+    return f"https://youtube.com/s/player/{player_id}/player_ias.vflset/en_US/base.js"
+
+
 def mime_type_codec(mime_type_codec: str) -> Tuple[str, List[str]]:
     """Parse the type data.
 
@@ -7,6 +7,7 @@ import os
 import re
 import warnings
 import shutil
+import sys
 from typing import Any, Callable, Dict, List, Optional, TypeVar
 from urllib import request
 
@@ -258,9 +259,13 @@ def target_directory(output_path: Optional[str] = None) -> str:
 
 
 def install_proxy(proxy_handler: Dict[str, str]) -> None:
+    # Imported here as pytubefix.request depends on this module
+    from pytubefix import request as pytubefix_request
+
     proxy_support = request.ProxyHandler(proxy_handler)
     opener = request.build_opener(proxy_support)
     request.install_opener(opener)
+    pytubefix_request.set_proxies(proxy_handler)
 
 
 def uniqueify(duped_list: List) -> List:
@@ -341,14 +346,37 @@ def strip_color_codes(input_str):
     return ansi_escape.sub('', input_str)
 
 
+def user_cache_dir() -> str:
+    """Get the directory of the caches kept between runs.
+
+    It is ``$PYTUBEFIX_CACHE_DIR`` when set, otherwise a ``pytubefix`` folder
+    in the cache directory of the user (``$XDG_CACHE_HOME`` or ``~/.cache``,
+    ``~/Library/Caches`` on macOS, ``%LOCALAPPDATA%`` on Windows), so nothing
+    is written in the installed package.
+
+    :rtype: str
+    """
+    override = os.environ.get('PYTUBEFIX_CACHE_DIR')
+    if override:
+        return override
+
+    if sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser(os.path.join('~', 'AppData', 'Local'))
+    elif sys.platform == 'darwin':
+        base = os.path.expanduser(os.path.join('~', 'Library', 'Caches'))
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser(os.path.join('~', '.cache'))
+    return os.path.join(base, 'pytubefix')
+
+
 def reset_cache(verbose: bool = False):
     """
-    Deletes the `__cache__` directory to reset the cache.
+    Deletes the `__cache__` directory and the user cache directory to reset the cache.
 
     This function checks if the `__cache__` directory exists in the same directory
-    as the script. If it exists and is a directory, it deletes it along with its contents.
-    If the directory does not exist, it logs a message indicating that the cache directory
-    is not present.
+    as the script, and if the directory of :func:`user_cache_dir` exists. Each one
+    that exists and is a directory is deleted along with its contents. If a directory
+    does not exist, it logs a message indicating that the cache directory is not present.
 
     Parameters:
         verbose (bool): If True, sets up logging at the DEBUG level. Default is False.
@@ -367,13 +395,14 @@ def reset_cache(verbose: bool = False):
         None
     """
 
-    cache_dir = os.path.join(os.path.dirname(__file__), '__cache__')
+    cache_dirs = [os.path.join(os.path.dirname(__file__), '__cache__'), user_cache_dir()]
 
     if verbose:
         setup_logger(level=logging.DEBUG)
 
-    if os.path.exists(cache_dir) and os.path.isdir(cache_dir):
-        shutil.rmtree(cache_dir)
-        logger.debug(f"Cache directory '{cache_dir}' has been reset.")
-    else:
-        logger.debug(f"Cache directory '{cache_dir}' does not exist.")
+    for cache_dir in cache_dirs:
+        if os.path.exists(cache_dir) and os.path.isdir(cache_dir):
+            shutil.rmtree(cache_dir)
+            logger.debug(f"Cache directory '{cache_dir}' has been reset.")
+        else:
+            logger.debug(f"Cache directory '{cache_dir}' does not exist.")
@@ -0,0 +1,449 @@
+"""Implements the optional HTTP/2 transport of :mod:`pytubefix.request`.
+
+Concurrent requests to a host that negotiates HTTP/2 are multiplexed as
+streams over a single connection, instead of taking one socket each. It
+needs the ``h2`` package: without it, or for hosts that only speak HTTP/1.1,
+:func:`request` returns None and the caller uses the HTTP/1.1 pool.
+
+The responses mimic the urllib3 ones (``status``, ``headers``, ``read``,
+``readinto``, ``stream``, ``release_conn``, ``close``) and raise the same
+urllib3 exceptions, so the rest of :mod:`pytubefix.request` handles both
+transports alike.
+"""
+import http.client
+import logging
+import select
+import socket
+import ssl
+import threading
+import time
+from collections import deque
+from urllib import parse
+
+from urllib3 import HTTPHeaderDict
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError, ProtocolError, ReadTimeoutError
+
+try:
+    import h2.config
+    import h2.connection
+    import h2.errors
+    import h2.events
+    import h2.exceptions
+    import h2.settings
+except ImportError:  # h2 is optional
+    h2 = None
+
+logger = logging.getLogger(__name__)
+
+# Bytes the server may send on a stream before it is read, this bounds the
+# memory used by each response.
+stream_window_size = 4194304  # 4MB
+# Bytes the server may send on a connection before any of it is read.
+connection_window_size = 16777216  # 16MB
+
+_DEFAULT_WINDOW_SIZE = 65535
+
+_lock = threading.Lock()
+# (host, port) -> Connection
+_connections = {}
+# (host, port) -> lock held while connecting to the host
+_connecting = {}
+# (host, port) of the hosts that did not negotiate HTTP/2
+_http1_hosts = set()
+# Whether warn_unavailable() already logged its warning
+_warned_unavailable = False
+
+
+class _NotSupported(Exception):
+    """The server did not negotiate HTTP/2."""
+
+
+class _Stream:
+    """State of a single request, filled by the connection."""
+
+    def __init__(self, stream_id):
+        self.stream_id = stream_id
+        self.status = None
+        self.headers = None
+        # [data, flow controlled length] received but not read yet
+        self.chunks = deque()
+        self.ended = False
+        self.error = None
+
+
+class Connection:
+    """An HTTP/2 connection to a host, shared by concurrent requests.
+
+    There is no dedicated reader thread: a thread waiting for data reads the
+    socket and hands out the frames of every stream, while the others wait
+    for it. The TLS socket is only ever used with the lock held.
+    """
+
+    def __init__(self, host, port, timeout):
+        self.host = host
+        self.port = port
+        self.authority = host if port == 443 else f"{host}:{port}"
+
+        context = ssl.create_default_context()
+        context.set_alpn_protocols(["h2", "http/1.1"])
+        try:
+            sock = socket.create_connection((host, port), timeout=timeout)
+        except socket.timeout as e:
+            raise ConnectTimeoutError(None, f"Connection to {host} timed out") from e
+        except OSError as e:
+            raise NewConnectionError(None, f"Failed to establish a new connection: {e}") from e
+        try:
+            self.sock = context.wrap_socket(sock, server_hostname=host)
+        except BaseException:
+            sock.close()
+            raise
+        if self.sock.selected_alpn_protocol() != "h2":
+            self.sock.close()
+            raise _NotSupported()
+        self.sock.settimeout(None)
+
+        config = h2.config.H2Configuration(client_side=True, header_encoding="utf-8")
+        self.conn = h2.connection.H2Connection(config=config)
+        self.cond = threading.Condition()
+        self.streams = {}
+        self.error = None
+        self.reading = False
+        self.last_used = time.monotonic()
+
+        with self.cond:
+            self.conn.initiate_connection()
+            self.conn.update_settings({
+                h2.settings.SettingCodes.ENABLE_PUSH: 0,
+                h2.settings.SettingCodes.INITIAL_WINDOW_SIZE: stream_window_size,
+            })
+            self.conn.increment_flow_control_window(connection_window_size - _DEFAULT_WINDOW_SIZE)
+            self._flush()
+
+    def _flush(self):
+        data = self.conn.data_to_send()
+        if data:
+            self.sock.sendall(data)
+
+    def _fail(self, error):
+        """Mark the connection and all its streams as broken."""
+        if self.error is None:
+            logger.debug("HTTP/2 connection to %s lost: %s", self.authority, error)
+            self.error = error
+        for stream in self.streams.values():
+            if stream.error is None:
+                stream.error = error
+        self.cond.notify_all()
+
+    def _handle(self, events):
+        for event in events:
+            stream = self.streams.get(getattr(event, "stream_id", None))
+            if isinstance(event, h2.events.ResponseReceived) and stream:
+                headers = HTTPHeaderDict()
+                for name, value in event.headers:
+                    if name == ":status":
+                        stream.status = int(value)
+                    else:
+                        headers.add(name, value)
+                stream.headers = headers
+            elif isinstance(event, h2.events.DataReceived):
+                if stream:
+                    stream.chunks.append([event.data, event.flow_controlled_length])
+                else:
+                    self.conn.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+            elif isinstance(event, h2.events.StreamEnded) and stream:
+                stream.ended = True
+            elif isinstance(event, h2.events.StreamReset) and stream:
+                stream.error = f"stream reset by the server (error code {event.error_code})"
+            elif isinstance(event, h2.events.ConnectionTerminated):
+                self._fail(f"connection terminated by the server (error code {event.error_code})")
+        self.cond.notify_all()
+
+    def when(self, ready, action, timeout, url=None):
+        """Run ``action`` with the lock held, as soon as ``ready`` returns True.
+
+        While waiting, the calling thread takes its turn reading the socket.
+
+        :raises ProtocolError: If the connection breaks.
+        :raises ReadTimeoutError: If ``ready`` is still False after ``timeout`` seconds.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self.cond:
+            while not ready():
+                if self.error is not None:
+                    raise ProtocolError(f"Connection broken: {self.error}")
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise ReadTimeoutError(None, url, "Read timed out.")
+                if self.reading:
+                    self.cond.wait(remaining)
+                    continue
+
+                self.reading = True
+                try:
+                    readable = self.sock.pending() > 0
+                    if not readable:
+                        # Let the other threads send while this one waits
+                        self.cond.release()
+                        try:
+                            readable = bool(select.select([self.sock], [], [], remaining)[0])
+                        finally:
+                            self.cond.acquire()
+                    if readable:
+                        data = self.sock.recv(65536)
+                        if not data:
+                            self._fail("connection closed by the server")
+                        else:
+                            self._handle(self.conn.receive_data(data))
+                            self._flush()
+                except (OSError, ValueError, h2.exceptions.ProtocolError) as e:
+                    self._fail(e)
+                finally:
+                    self.reading = False
+                    self.cond.notify_all()
+            return action()
+
+    def request(self, method, path, headers, body, timeout):
+        """Send a request and wait for the head of its response.
+
+        :rtype: HTTP2Response
+        """
+        request_headers = [
+            (":method", method),
+            (":scheme", "https"),
+            (":authority", self.authority),
+            (":path", path),
+        ]
+        request_headers += [
+            (name.lower(), str(value)) for name, value in headers.items()
+            if name.lower() not in ("host", "connection", "transfer-encoding")
+        ]
+        if body:
+            request_headers.append(("content-length", str(len(body))))
+
+        def can_open():
+            return self.conn.open_outbound_streams < self.conn.remote_settings.max_concurrent_streams
+
+        def open_stream():
+            stream = _Stream(self.conn.get_next_available_stream_id())
+            self.streams[stream.stream_id] = stream
+            self.conn.send_headers(stream.stream_id, request_headers, end_stream=not body)
+            self._flush()
+            return stream
+
+        stream = self.when(can_open, open_stream, timeout)
+        self.last_used = time.monotonic()
+
+        try:
+            view = memoryview(body or b"")
+            while view:
+                # A reset stream never gets a window again, it must stop the wait too.
+                def can_send():
+                    return stream.error is not None or self.conn.local_flow_control_window(stream.stream_id) > 0
+
+                def send_data():
+                    if stream.error is not None:
+                        raise ProtocolError(f"Connection broken: {stream.error}")
+                    size = min(
+                        len(view),
+                        self.conn.local_flow_control_window(stream.stream_id),
+                        self.conn.max_outbound_frame_size,
+                    )
+                    self.conn.send_data(stream.stream_id, view[:size].tobytes(), end_stream=size == len(view))
+                    self._flush()
+                    return size
+
+                sent = self.when(can_send, send_data, timeout)
+                view = view[sent:]
+
+            self.when(lambda: stream.status is not None or stream.ended or stream.error is not None, lambda: None, timeout)
+            if stream.status is None:
+                raise ProtocolError(f"Connection broken: {stream.error or 'response without headers'}")
+        except BaseException:
+            self.reset(stream)
+            raise
+        return HTTP2Response(self, stream, timeout)
+
+    def reset(self, stream):
+        """Cancel a stream and hand back the window of its unread data."""
+        with self.cond:
+            if self.streams.pop(stream.stream_id, None) is None:
+                # Already fully read or cancelled
+                return
+            try:
+                if not stream.ended and stream.error is None and self.error is None:
+                    self.conn.reset_stream(stream.stream_id, h2.errors.ErrorCodes.CANCEL)
+                while stream.chunks:
+                    self.conn.acknowledge_received_data(stream.chunks.popleft()[1], stream.stream_id)
+                self._flush()
+            except (OSError, h2.exceptions.ProtocolError) as e:
+                self._fail(e)
+
+    def close(self):
+        with self.cond:
+            try:
+                self.conn.close_connection()
+                self._flush()
+            except (OSError, h2.exceptions.ProtocolError):
+                pass
+            self._fail("connection closed")
+            self.sock.close()
+
+
+class HTTP2Response:
+    """Response received on an HTTP/2 stream, read as it arrives."""
+
+    version = 20
+
+    def __init__(self, connection, stream, timeout):
+        self.status = stream.status
+        self.reason = http.client.responses.get(stream.status, "")
+        self.headers = stream.headers
+        self._connection = connection
+        self._stream = stream
+        self._timeout = timeout
+
+    def _take(self, amount):
+        stream = self._stream
+        if not stream.chunks:
+            if stream.error is not None:
+                raise ProtocolError(f"Connection broken: {stream.error}")
+            # Ended
+            self._connection.streams.pop(stream.stream_id, None)
+            return b""
+
+        chunk = stream.chunks[0]
+        data, flow_controlled_length = chunk
+        if amount is not None and len(data) > amount:
+            chunk[0] = data[amount:]
+            return data[:amount]
+        stream.chunks.popleft()
+        self._connection.conn.acknowledge_received_data(flow_controlled_length, stream.stream_id)
+        self._connection._flush()
+        return data
+
+    def _read_part(self, amount=None):
+        stream = self._stream
+        return self._connection.when(
+            lambda: stream.chunks or stream.ended or stream.error is not None,
+            lambda: self._take(amount),
+            self._timeout
+        )
+
+    def read(self, amt=None, decode_content=None):
+        """Read ``amt`` bytes of the body, or all of it."""
+        body = bytearray()
+        while amt is None or len(body) < amt:
+            data = self._read_part(None if amt is None else amt - len(body))
+            if not data:
+                break
+            body += data
+        return bytes(body)
+
+    def readinto(self, b):
+        """Read the next part of the body into ``b``, 0 once it is complete."""
+        data = self._read_part(len(b))
+        b[:len(data)] = data
+        return len(data)
+
+    def stream(self, amt=65536, decode_content=None):
+        """Iterate over the body in parts of at most ``amt`` bytes."""
+        while True:
+            data = self._read_part(amt)
+            if not data:
+                return
+            yield data
+
+    def release_conn(self):
+        # The stream is cancelled if the body was not fully read
+        self.close()
+
+    def close(self):
+        self._connection.reset(self._stream)
+
+
+def available():
+    """Whether the h2 package is installed."""
+    return h2 is not None
+
+
+def warn_unavailable():
+    """Log once that HTTP/2 was requested but h2 is not installed."""
+    global _warned_unavailable
+    if _warned_unavailable:
+        return
+    _warned_unavailable = True
+    logger.warning('HTTP/2 is enabled but the h2 package is not installed (pip install h2), using HTTP/1.1')
+
+
+def _connection(host, port, timeout):
+    """Get the HTTP/2 connection to a host, connecting if needed.
+
+    :rtype: Optional[Connection]
+    :returns:
+        None if the host does not speak HTTP/2.
+    """
+    # Imported here to avoid a circular import
+    from pytubefix import request as pytubefix_request
+
+    key = (host, port)
+    with _lock:
+        if key in _http1_hosts:
+            return None
+        connecting = _connecting.setdefault(key, threading.Lock())
+
+    with connecting:
+        with _lock:
+            connection = _connections.get(key)
+        if connection is not None:
+            idle = not connection.streams and \
+                time.monotonic() - connection.last_used >= pytubefix_request.default_pool_idle_timeout
+            if connection.error is None and not idle:
+                return connection
+            connection.close()
+
+        try:
+            connection = Connection(host, port, timeout)
+        except _NotSupported:
+            logger.debug("%s does not speak HTTP/2, using HTTP/1.1", host)
+            with _lock:
+                _http1_hosts.add(key)
+            return None
+        with _lock:
+            _connections[key] = connection
+        return connection
+
+
+def request(method, url, headers, body=None, timeout=None):
+    """Send a request over HTTP/2 if the host supports it.
+
+    :param str method: The HTTP method.
+    :param str url: The https URL to request.
+    :param dict headers: The request headers.
+    :param bytes body: (Optional) The request body.
+    :param float timeout: (Optional) Seconds to wait for the connection and each read.
+    :rtype: Optional[HTTP2Response]
+    :returns:
+        The response, or None if the request must go through HTTP/1.1.
+    """
+    split_url = parse.urlsplit(url)
+    if h2 is None or split_url.scheme.lower() != "https":
+        return None
+
+    connection = _connection(split_url.hostname, split_url.port or 443, timeout)
+    if connection is None:
+        return None
+
+    path = split_url.path or "/"
+    if split_url.query:
+        path += f"?{split_url.query}"
+    return connection.request(method, path, headers, body, timeout)
+
+
+def clear():
+    """Close every HTTP/2 connection and forget which hosts lack HTTP/2."""
+    with _lock:
+        connections = list(_connections.values())
+        _connections.clear()
+        _http1_hosts.clear()
+    for connection in connections:
+        connection.close()
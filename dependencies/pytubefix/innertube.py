@@ -5,6 +5,8 @@ interfaces returns raw results. These should instead be parsed to extract
 the useful information for the end user.
 """
 # Native python imports
+import asyncio
+import copy
 import json
 import os
 import pathlib
@@ -12,7 +14,7 @@ import time
 from typing import Tuple
 from urllib import parse
 
-from pytubefix import request
+from pytubefix import async_request, request, response_cache, throttle
 from pytubefix.helpers import reset_cache
 
 # YouTube on TV client secrets
@@ -542,7 +544,8 @@ class InnerTube:
             token_file=None,
             oauth_verifier=None,
             use_po_token=False,
-            po_token_verifier=None
+            po_token_verifier=None,
+            session=None
 
     ):
         """Initialize an InnerTube object.
@@ -570,9 +573,13 @@ class InnerTube:
             (Optional) Verified used to obtain the visitorData and po_token.
             The verifier will return the visitorData and po_token respectively.
             (if passed, else default verifier will be used)
+        :param Session session:
+            (Optional) Session sharing the tokens with other InnerTube objects.
+            Its tokens are used instead of the ones of the token file.
         """
         self.client_name = client
-        self.innertube_context = _default_clients[client]['innertube_context']
+        # Copied, requests add the video, continuation and tokens to their context
+        self.innertube_context = copy.deepcopy(_default_clients[client]['innertube_context'])
         self.header = _default_clients[client]['header']
         self.api_key = _default_clients[client]['api_key']
         self.require_js_player = _default_clients[client]['require_js_player']
@@ -596,9 +603,13 @@ class InnerTube:
         if not self.allow_cache:
             reset_cache()
 
-        # Try to load from file if specified
+        self.session = session
+
+        # Try to load from the session, then from file if specified
         self.token_file = token_file or _token_file
-        if self.use_oauth and self.allow_cache and os.path.exists(self.token_file):
+        if self.session is not None and self.session.load_tokens(self):
+            self.refresh_bearer_token()
+        elif self.use_oauth and self.allow_cache and os.path.exists(self.token_file):
             with open(self.token_file) as f:
                 data = json.load(f)
                 if data['access_token']:
@@ -607,14 +618,20 @@ class InnerTube:
                     self.expires = data['expires']
                     self.refresh_bearer_token()
 
-        if self.use_po_token and self.allow_cache and os.path.exists(self.token_file):
+        if self.use_po_token and not self.access_po_token and self.allow_cache and os.path.exists(self.token_file):
             with open(self.token_file) as f:
                 data = json.load(f)
                 self.access_visitorData = data['visitorData']
                 self.access_po_token = data['po_token']
 
+        if self.session is not None:
+            self.session.save_tokens(self)
+
     def cache_tokens(self):
-        """Cache tokens to file if allowed."""
+        """Cache tokens to file if allowed, and to the session if any."""
+        if self.session is not None:
+            self.session.save_tokens(self)
+
         if not self.allow_cache:
             return
 
@@ -753,8 +770,11 @@ class InnerTube:
             'prettyPrint': "false"
         }
 
-    def _call_api(self, endpoint, query, data):
-        """Make a request to a given endpoint with the provided query parameters and data."""
+    def _api_request(self, endpoint, query):
+        """Build the url and headers of a request to a given endpoint.
+
+        :rtype: Tuple[str, dict]
+        """
         # When YouTube used an API key, it was necessary to remove it when using oauth
         # if self.use_oauth:
         #     del query['key']
@@ -780,14 +800,65 @@ class InnerTube:
                 self.fetch_po_token()
 
         headers.update(self.header)
+        return endpoint_url, headers
+
+    def _call_api(self, endpoint, query, data, cache=False):
+        """Make a request to a given endpoint with the provided query parameters and data.
 
+        :param bool cache:
+            Look for the response in :mod:`response_cache <pytubefix.response_cache>`
+            before making the request, and cache it afterwards.
+        """
+        endpoint_url, headers = self._api_request(endpoint, query)
+        key = self._cache_key(endpoint, query, data) if cache else None
+        cached = response_cache.get(key) if key else None
+        if cached is not None:
+            return json.loads(cached)
+
+        throttle.innertube_call()
         response = request._execute_request(
             endpoint_url,
             'POST',
             headers=headers,
             data=data
         )
-        return json.loads(response.read())
+        return self._read_response(response.read(), endpoint, data, key)
+
+    async def _call_api_async(self, endpoint, query, data, cache=False):
+        """Asynchronous version of :meth:`_call_api`."""
+        if request._proxies:
+            # Proxies are only supported by the blocking transport
+            return await asyncio.to_thread(self._call_api, endpoint, query, data, cache)
+
+        endpoint_url, headers = self._api_request(endpoint, query)
+        key = self._cache_key(endpoint, query, data) if cache else None
+        cached = response_cache.get(key) if key else None
+        if cached is not None:
+            return json.loads(cached)
+
+        await throttle.innertube_call_async()
+        response = await async_request._execute_request(
+            endpoint_url,
+            'POST',
+            headers=headers,
+            data=data
+        )
+        return self._read_response(await response.read(), endpoint, data, key)
+
+    def _cache_key(self, endpoint, query, data):
+        # Computed once the tokens are inserted in the request, since they
+        # change the response
+        if response_cache.cache is None:
+            return None
+        return response_cache.request_key(endpoint, query, data, self.use_oauth)
+
+    @staticmethod
+    def _read_response(body, endpoint, data, key):
+        """Parse a response, caching it if it was requested."""
+        result = json.loads(body)
+        if key:
+            response_cache.store(key, endpoint, body.decode('utf-8'), tag=data.get('videoId'))
+        return result
 
     def browse(self, continuation=None, visitor_data=None):
         """Make a request to the browse endpoint.
@@ -809,7 +880,7 @@ class InnerTube:
         if visitor_data:
             self.base_data['context']['client'].update({"visitorData": visitor_data})
 
-        return self._call_api(endpoint, query, self.base_data)
+        return self._call_api(endpoint, query, self.base_data, cache=True)
 
     def reel(self):
         """Make a request to the reel endpoint.
@@ -859,7 +930,7 @@ class InnerTube:
         endpoint = f'{self.base_url}/next'
         query = self.base_params
 
-        return self._call_api(endpoint, query, self.base_data)
+        return self._call_api(endpoint, query, self.base_data, cache=True)
 
     def player(self, video_id):
         """Make a request to the player endpoint.
@@ -874,7 +945,22 @@ class InnerTube:
         query = self.base_params
 
         self.base_data.update({'videoId': video_id, 'contentCheckOk': "true"})
-        return self._call_api(endpoint, query, self.base_data)
+        return self._call_api(endpoint, query, self.base_data, cache=True)
+
+    async def player_async(self, video_id):
+        """Asynchronous version of :meth:`player`.
+
+        :param str video_id:
+            The video id to get player info for.
+        :rtype: dict
+        :returns:
+            Raw player info results.
+        """
+        endpoint = f'{self.base_url}/player'
+        query = self.base_params
+
+        self.base_data.update({'videoId': video_id, 'contentCheckOk': "true"})
+        return await self._call_api_async(endpoint, query, self.base_data, cache=True)
 
     def search(self, search_query, continuation=None, data=None):
         """Make a request to the search endpoint.
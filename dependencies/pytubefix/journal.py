@@ -0,0 +1,139 @@
+"""This module implements the sidecar journal of partially downloaded files.
+
+The journal records which byte ranges of a stream were already written to the
+output file, so an interrupted download can later request only the missing
+ranges instead of starting again from the first byte.
+"""
+
+import json
+import logging
+import os
+import time
+from typing import List, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class DownloadJournal:
+    """Completed byte ranges of a download, persisted next to the output file."""
+
+    suffix = ".journal"
+
+    # Minimum amount of seconds between two writes of the journal file.
+    save_interval = 1.0
+
+    def __init__(self, file_path: str, size: int, identity: dict):
+        """Construct a :class:`DownloadJournal <DownloadJournal>`.
+
+        :param str file_path:
+            Path of the file being downloaded.
+        :param int size:
+            Size of the complete file in bytes.
+        :param dict identity:
+            Data identifying the downloaded stream (video id, itag...). A journal
+            written for another stream is never reused.
+        """
+        self.file_path = file_path
+        self.path = file_path + self.suffix
+        self.size = size
+        self.identity = identity
+        # Sorted and merged list of [start, end) ranges.
+        self.ranges: List[List[int]] = []
+        self._last_save = 0.0
+
+    @classmethod
+    def journal_exists(cls, file_path: str) -> bool:
+        """Whether the file at this path is a partial download."""
+        return os.path.isfile(file_path + cls.suffix)
+
+    def load(self) -> bool:
+        """Load the completed ranges written by a previous attempt.
+
+        :rtype: bool
+        :returns:
+            True if a journal matching this download was found, False otherwise.
+        """
+        if not os.path.isfile(self.path) or not os.path.isfile(self.file_path):
+            return False
+
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.debug(f"unreadable journal {self.path}: {e}")
+            return False
+
+        if data.get("size") != self.size or data.get("identity") != self.identity:
+            logger.debug(f"journal {self.path} belongs to another stream, ignoring it")
+            return False
+
+        for start, end in data.get("ranges", []):
+            self.add(start, end - start)
+        return True
+
+    def add(self, offset: int, length: int) -> None:
+        """Record that ``length`` bytes were written at ``offset``."""
+        if length <= 0:
+            return
+        start, end = offset, offset + length
+        merged = []
+        for range_start, range_end in self.ranges:
+            if range_end < start or range_start > end:
+                merged.append([range_start, range_end])
+            else:
+                start, end = min(start, range_start), max(end, range_end)
+        merged.append([start, end])
+        merged.sort()
+        self.ranges = merged
+
+    def missing(self) -> List[Tuple[int, int]]:
+        """Get the ranges that still have to be downloaded.
+
+        :rtype: List[Tuple[int, int]]
+        :returns:
+            A list of (first byte, last byte) inclusive ranges.
+        """
+        missing = []
+        position = 0
+        for start, end in self.ranges:
+            if start > position:
+                missing.append((position, start - 1))
+            position = max(position, end)
+        if position < self.size:
+            missing.append((position, self.size - 1))
+        return missing
+
+    @property
+    def completed(self) -> int:
+        """Amount of bytes already downloaded."""
+        return sum(end - start for start, end in self.ranges)
+
+    @property
+    def save_due(self) -> bool:
+        """Whether `save_interval` seconds went by since the last write."""
+        return time.monotonic() - self._last_save >= self.save_interval
+
+    def save(self, force: bool = False) -> None:
+        """Write the journal to disk, at most once every `save_interval` seconds.
+
+        :param bool force:
+            Write the journal even if it was saved recently.
+        """
+        if not force and not self.save_due:
+            return
+        self._last_save = time.monotonic()
+
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "w") as f:
+            json.dump({"size": self.size, "identity": self.identity, "ranges": self.ranges}, f)
+        # Atomic, a crash never leaves a half written journal behind.
+        os.replace(temp_path, self.path)
+
+    def remove(self) -> None:
+        """Delete the journal once the download is complete."""
+        for path in (self.path, self.path + ".tmp"):
+            if os.path.isfile(path):
+                os.remove(path)
+
+    def __repr__(self) -> str:
+        return f"<DownloadJournal: {self.completed}/{self.size} bytes of {self.file_path}>"
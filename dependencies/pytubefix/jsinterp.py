@@ -1226,7 +1226,10 @@ class JSInterpreter:
         return self.build_function(argnames, code, local_vars, *global_stack)
 
     def call_function(self, funcname, *args):
-        return self.extract_function(funcname)(args)
+        # Locating a function scans the whole player, do it once per interpreter
+        if funcname not in self._functions:
+            self._functions[funcname] = self.extract_function(funcname)
+        return self._functions[funcname](args)
 
     def build_function(self, argnames, code, *global_stack):
         global_stack = list(global_stack) or [{}]
@@ -57,6 +57,35 @@ def parse_for_object(html, preceding_regex):
     return parse_for_object_from_startpoint(html, start_index)
 
 
+# Characters ending each context, see find_object_from_startpoint().
+_context_closers = {
+    '{': '}',
+    '[': ']',
+    '"': '"',
+    '\'': '\'',
+    '/': '/'  # javascript regex
+}
+
+# Complete string literals, skipped in a single step.
+_strings = r'"[^"\\]*(?:\\[\s\S][^"\\]*)*"|\'[^\'\\]*(?:\\[\s\S][^\'\\]*)*\''
+
+# Next token that may change the context, for each context. Everything in
+# between is skipped at once instead of one character at a time.
+_context_tokens = {
+    '{': re.compile(_strings + r'|[{}\["\'/]'),
+    '[': re.compile(_strings + r'|[{\[\]"\'/]'),
+    '"': re.compile(r'["\\]'),
+    '\'': re.compile(r"['\\]"),
+    '/': re.compile(r'[/\\]'),
+}
+
+# Characters after which a slash starts a regular expression instead of being
+# a division.
+_regex_preceding_chars = frozenset('(,=:[!&|?{};')
+
+_json_decoder = json.JSONDecoder()
+
+
 def find_object_from_startpoint(html, start_point):
     """Parses input html to find the end of a JavaScript object.
 
@@ -64,61 +93,64 @@ def find_object_from_startpoint(html, start_point):
         HTML to be parsed for an object.
     :param int start_point:
         Index of where the object starts.
-    :rtype dict:
+    :rtype str:
     :returns:
-        A dict created from parsing the object.
+        The source code of the object.
     """
-    html = html[start_point:]
-    if html[0] not in ['{','[']:
-        raise HTMLParseError(f'Invalid start point. Start of HTML:\n{html[:20]}')
+    if start_point >= len(html) or html[start_point] not in '{[':
+        raise HTMLParseError(f'Invalid start point. Start of HTML:\n{html[start_point:start_point + 20]}')
 
     # First letter MUST be a open brace, so we put that in the stack,
     # and skip the first character.
-    last_char = '{'
-    curr_char = None
-    stack = [html[0]]
-    i = 1
-
-    context_closers = {
-        '{': '}',
-        '[': ']',
-        '"': '"',
-        '\'': '\'',
-        '/': '/' # javascript regex
-    }
-
-    while i < len(html):
-        if not stack:
-            break
-        if curr_char not in [' ', '\n']:
-            last_char = curr_char
-        curr_char = html[i]
+    stack = [html[start_point]]
+    i = start_point + 1
+
+    while stack:
         curr_context = stack[-1]
+        match = _context_tokens[curr_context].search(html, i)
+        if match is None:
+            # Unterminated object, everything left belongs to it
+            return html[start_point:]
+        i = match.start()
+        if match.end() - i > 1:
+            # A whole string literal
+            i = match.end()
+            continue
+        curr_char = html[i]
 
         # If we've reached a context closer, we can remove an element off the stack
-        if curr_char == context_closers[curr_context]:
+        if curr_char == _context_closers[curr_context]:
             stack.pop()
             i += 1
             continue
 
         # Strings and regex expressions require special context handling because they can contain
         #  context openers *and* closers
-        if curr_context in ['"', '\'', '/']:
+        if curr_context in '"\'/':
             # If there's a backslash in a string or regex expression, we skip a character
             if curr_char == '\\':
                 i += 2
                 continue
-        else:
-            # Non-string contexts are when we need to look for context openers.
-            if curr_char in context_closers.keys():
-                # Slash starts a regular expression depending on context
-                if not (curr_char == '/' and last_char not in ['(', ',', '=', ':', '[', '!', '&', '|', '?', '{', '}', ';']): 
-                    stack.append(curr_char)
+        elif curr_char != '/' or _previous_char(html, start_point, i) in _regex_preceding_chars:
+            # Slash starts a regular expression depending on context
+            stack.append(curr_char)
 
         i += 1
 
-    full_obj = html[:i]
-    return full_obj  # noqa: R504
+    return html[start_point:i]
+
+
+def _previous_char(html, start_point, end):
+    """Get the last character before ``end`` that isn't a space or a line break.
+
+    :rtype: str
+    :returns:
+        The character, or None if there is none after the opening brace.
+    """
+    j = end - 1
+    while j > start_point and html[j] in ' \n':
+        j -= 1
+    return html[j] if j > start_point else None
 
 
 def parse_for_object_from_startpoint(html, start_point):
@@ -132,6 +164,13 @@ def parse_for_object_from_startpoint(html, start_point):
     :returns:
         A dict created from parsing the object.
     """
+    if start_point < len(html) and html[start_point] in '{[':
+        # Most objects are plain JSON, decoded without looking for their end first
+        try:
+            return _json_decoder.raw_decode(html, start_point)[0]
+        except json.decoder.JSONDecodeError:
+            pass
+
     full_obj = find_object_from_startpoint(html, start_point)
     try:
         return json.loads(full_obj)
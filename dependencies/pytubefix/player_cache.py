@@ -0,0 +1,198 @@
+"""This module implements the on-disk cache of the player's base.js.
+
+The player JavaScript weighs a few megabytes and only changes when YouTube
+releases a new player, so it is kept on disk keyed by its url and shared by
+every process. Values extracted from it (like the signature timestamp) are
+stored next to it, so a new process does not have to download nor parse the
+player again before its first request.
+
+Each entry is a ``<key>.js`` file holding the player and a ``<key>.json`` file
+holding its url, its SHA-256 digest and the derived values. An entry whose
+digest does not match its JavaScript is discarded. The least recently used
+entries are removed once there are more than :data:`max_entries`.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pathlib
+from typing import Any, Callable, Optional
+
+from pytubefix.helpers import user_cache_dir
+
+logger = logging.getLogger(__name__)
+
+# Set to False to only keep the player in memory.
+enabled = True
+
+# Amount of players kept on disk.
+max_entries = 8
+
+# See helpers.user_cache_dir(), assign another path to move the players.
+cache_dir = pathlib.Path(user_cache_dir()) / 'players'
+
+
+def _key(js_url: str) -> str:
+    return hashlib.sha256(js_url.encode('utf-8')).hexdigest()[:32]
+
+
+def _paths(js_url: str):
+    key = _key(js_url)
+    return os.path.join(cache_dir, key + '.js'), os.path.join(cache_dir, key + '.json')
+
+
+def _write(path: str, data: bytes):
+    # Atomic, a process never reads a half written file.
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(data)
+    os.replace(temp_path, path)
+
+
+def _read_metadata(js_url: str) -> Optional[dict]:
+    _, metadata_path = _paths(js_url)
+    try:
+        with open(metadata_path, 'r') as f:
+            metadata = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return metadata if metadata.get('js_url') == js_url else None
+
+
+def _write_metadata(js_url: str, metadata: dict):
+    _, metadata_path = _paths(js_url)
+    _write(metadata_path, json.dumps(metadata).encode('utf-8'))
+
+
+def load(js_url: str) -> Optional[str]:
+    """Get a player from the cache.
+
+    :param str js_url:
+        The url of the player's base.js.
+    :rtype: str
+    :returns:
+        The player JavaScript, or None if it is not cached or its entry is
+        corrupted.
+    """
+    if not enabled:
+        return None
+
+    metadata = _read_metadata(js_url)
+    if metadata is None:
+        return None
+
+    js_path, metadata_path = _paths(js_url)
+    try:
+        with open(js_path, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return None
+
+    if hashlib.sha256(data).hexdigest() != metadata.get('sha256'):
+        logger.debug(f"corrupted player cache entry for {js_url}, removing it")
+        remove(js_url)
+        return None
+
+    try:
+        # Marks the entry as recently used
+        os.utime(metadata_path)
+    except OSError:
+        pass
+
+    logger.debug(f"player {js_url} loaded from the disk cache")
+    return data.decode('utf-8')
+
+
+def save(js_url: str, js: str):
+    """Add a player to the cache, evicting the least recently used ones.
+
+    :param str js_url:
+        The url of the player's base.js.
+    :param str js:
+        The player JavaScript.
+    """
+    if not enabled:
+        return
+
+    data = js.encode('utf-8')
+    js_path, _ = _paths(js_url)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        _write(js_path, data)
+        _write_metadata(js_url, {
+            'js_url': js_url,
+            'sha256': hashlib.sha256(data).hexdigest(),
+            'derived': {}
+        })
+        _evict()
+    except OSError as e:
+        logger.debug(f"could not cache the player {js_url}: {e}")
+
+
+def derived(js_url: str, name: str, compute: Callable[[], Any]) -> Any:
+    """Get a value extracted from a player, computing it once per player.
+
+    :param str js_url:
+        The url of the player's base.js.
+    :param str name:
+        Name of the value.
+    :param Callable compute:
+        Function extracting the value from the player, called when the value is
+        not cached yet. It must return something JSON serializable.
+    :returns:
+        The value.
+    """
+    metadata = _read_metadata(js_url) if enabled else None
+    if metadata is not None and name in metadata.get('derived', {}):
+        return metadata['derived'][name]
+
+    value = compute()
+
+    # The player may have been cached meanwhile by compute()
+    metadata = _read_metadata(js_url) if enabled else None
+    if metadata is not None:
+        metadata.setdefault('derived', {})[name] = value
+        try:
+            _write_metadata(js_url, metadata)
+        except OSError as e:
+            logger.debug(f"could not cache {name} of the player {js_url}: {e}")
+    return value
+
+
+def remove(js_url: str):
+    """Remove a player and its derived values from the cache."""
+    for path in _paths(js_url):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def _evict():
+    entries = []
+    for entry in os.scandir(cache_dir):
+        if entry.name.endswith('.json'):
+            try:
+                entries.append((entry.stat().st_mtime, entry.path))
+            except OSError:
+                pass
+
+    entries.sort(reverse=True)
+    for _, metadata_path in entries[max_entries:]:
+        for path in (metadata_path, metadata_path[:-len('.json')] + '.js'):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+def clear():
+    """Remove every player from the cache."""
+    if not os.path.isdir(cache_dir):
+        return
+    for entry in os.scandir(cache_dir):
+        try:
+            os.remove(entry.path)
+        except OSError:
+            pass
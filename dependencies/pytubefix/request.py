@@ -1,19 +1,243 @@
-"""Implements a simple wrapper around urlopen."""
+"""Implements a simple wrapper around a pooled urllib3 transport."""
 import http.client
+import io
 import json
 import logging
 import re
 import socket
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 from urllib import parse
-from urllib.error import URLError
-from urllib.request import Request, urlopen
-
+from urllib.error import HTTPError, URLError
+
+import urllib3
+from urllib3.exceptions import (
+    HTTPError as TransportError,
+    MaxRetryError,
+    NewConnectionError,
+    ProtocolError,
+    ReadTimeoutError,
+    TimeoutError as TransportTimeoutError,
+)
+
+from pytubefix import http2, throttle
 from pytubefix.exceptions import RegexMatchError, MaxRetriesExceeded
 from pytubefix.helpers import regex_search
 
 logger = logging.getLogger(__name__)
 default_range_size = 9437184  # 9MB
+default_buffer_size = 1048576  # 1MB, size of the reusable read buffers
+# Number of segments of sequential (OTF) streams fetched at the same time.
+default_segment_workers = 4
+
+# Multiplex the requests to HTTPS hosts over HTTP/2 when possible, see
+# :mod:`pytubefix.http2`. Hosts without HTTP/2 keep using the HTTP/1.1 pool.
+use_http2 = False
+
+# Keep-alive connection pool settings, see :func:`configure_pool`.
+default_pool_size = 10  # number of hosts kept alive at the same time
+default_pool_idle_timeout = 60  # seconds before an idle host is disconnected
+default_pool_max_connections_per_host = 8
+
+_pool_lock = threading.Lock()
+_pool_managers = {}
+_pool_last_used = {}
+_proxies = {}
+
+# Size of the files already discovered, shared by filesize() and stream().
+_filesize_cache = OrderedDict()
+_filesize_cache_size = 128
+
+# Adaptive range sizing, see :class:`RangeSizeController`.
+# When disabled, every range is default_range_size bytes long.
+adaptive_range_size = False
+min_range_size = 262144  # 256KB
+max_range_size = 67108864  # 64MB
+
+
+class RangeSizeController:
+    """Learn the best range size of each host from the measured throughput.
+
+    Ranges start at ``min_range_size`` so the first bytes arrive quickly. The
+    size doubles as long as the throughput of full ranges keeps improving, up
+    to ``max_range_size``, and is halved after a timeout or an incomplete read.
+    The learned sizes are kept for the whole process, so the next downloads
+    from the same host start where the previous ones stopped.
+    """
+
+    # Throughput gain a range must show to let the next one grow.
+    growth_threshold = 1.1
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # host -> [range size, best throughput in bytes per second]
+        self._hosts = {}
+
+    @staticmethod
+    def _host(url):
+        return parse.urlsplit(url).netloc.lower()
+
+    def size(self, url):
+        """Get the size in bytes of the next range to request from this host."""
+        with self._lock:
+            state = self._hosts.setdefault(self._host(url), [min_range_size, 0.0])
+            return state[0]
+
+    def success(self, url, requested, received, elapsed):
+        """Record a completed range and grow the next ones if it was faster.
+
+        :param str url: URL the range was requested from.
+        :param int requested: Size in bytes of the requested range.
+        :param int received: Amount of bytes actually received.
+        :param float elapsed: Seconds spent between the request and the last byte.
+        """
+        # Short or instant ranges (end of file, tiny files) tell nothing
+        if received != requested or elapsed <= 0:
+            return
+        throughput = received / elapsed
+        with self._lock:
+            state = self._hosts.setdefault(self._host(url), [min_range_size, 0.0])
+            if requested < state[0]:
+                return
+            if throughput > state[1] * self.growth_threshold:
+                state[0] = min(state[0] * 2, max_range_size)
+            state[1] = max(state[1], throughput)
+
+    def failure(self, url):
+        """Shrink the ranges of a host after a timeout or an incomplete read."""
+        with self._lock:
+            state = self._hosts.setdefault(self._host(url), [min_range_size, 0.0])
+            state[0] = max(state[0] // 2, min_range_size)
+            state[1] = 0.0
+            logger.debug("range size of %s reduced to %s bytes", self._host(url), state[0])
+
+    def reset(self):
+        """Forget everything learned about the hosts."""
+        with self._lock:
+            self._hosts.clear()
+
+
+range_size_controller = RangeSizeController()
+
+
+def _range_size(url):
+    """Get the size in bytes of the next range to request from a URL."""
+    if adaptive_range_size:
+        return range_size_controller.size(url)
+    return default_range_size
+
+
+def configure_pool(pool_size=None, idle_timeout=None, max_connections_per_host=None):
+    """Configure the keep-alive connection pool shared by every request.
+
+    Existing connections are closed, the new settings apply to the next request.
+
+    :param int pool_size:
+        Number of hosts whose connections are kept alive at the same time.
+    :param float idle_timeout:
+        Seconds after which the idle connections of a host are closed.
+    :param int max_connections_per_host:
+        Maximum number of simultaneous connections opened to a single host.
+        Extra requests wait for a connection to be released.
+    """
+    global default_pool_size, default_pool_idle_timeout, default_pool_max_connections_per_host
+    if pool_size is not None:
+        default_pool_size = pool_size
+    if idle_timeout is not None:
+        default_pool_idle_timeout = idle_timeout
+    if max_connections_per_host is not None:
+        default_pool_max_connections_per_host = max_connections_per_host
+    clear_pool()
+
+
+def set_proxies(proxies):
+    """Route the pooled requests through the given proxies.
+
+    :param dict proxies:
+        A dict mapping protocol to proxy address.
+    """
+    _proxies.clear()
+    _proxies.update(proxies or {})
+    clear_pool()
+
+
+def clear_pool():
+    """Close every pooled connection."""
+    with _pool_lock:
+        for manager in _pool_managers.values():
+            manager.clear()
+        _pool_managers.clear()
+        _pool_last_used.clear()
+    http2.clear()
+
+
+def _pool_manager(url):
+    """Get the pool manager in charge of the given url, creating it if needed."""
+    scheme = parse.urlsplit(url).scheme.lower()
+    proxy_url = _proxies.get(scheme)
+    with _pool_lock:
+        manager = _pool_managers.get(proxy_url)
+        if manager is None:
+            pool_kw = {
+                "num_pools": default_pool_size,
+                "maxsize": default_pool_max_connections_per_host,
+                "block": True,
+            }
+            if proxy_url:
+                manager = urllib3.ProxyManager(proxy_url, **pool_kw)
+            else:
+                manager = urllib3.PoolManager(**pool_kw)
+            _pool_managers[proxy_url] = manager
+    return manager
+
+
+def _drop_idle_connections(manager, url):
+    """Close the connections to a host that stayed idle for too long.
+
+    Servers silently drop idle keep-alive sockets, reusing them would only
+    cost a failed request.
+    """
+    host_key = (id(manager), parse.urlsplit(url).netloc.lower())
+    now = time.monotonic()
+    with _pool_lock:
+        last_used = _pool_last_used.get(host_key)
+        _pool_last_used[host_key] = now
+    if last_used is None or now - last_used < default_pool_idle_timeout:
+        return
+    logger.debug("closing idle connections to %s", host_key[1])
+    connections = manager.connection_from_url(url).pool
+    if connections is None:
+        return
+    with connections.mutex:
+        for connection in connections.queue:
+            if connection is not None:
+                connection.close()
+
+
+def _transport_error(error):
+    """Convert a urllib3 error into the urllib one the callers expect."""
+    reason = error.reason if isinstance(error, MaxRetryError) and error.reason else error
+    if isinstance(reason, NewConnectionError):
+        return URLError(OSError(str(reason)))
+    if isinstance(reason, TransportTimeoutError):
+        return URLError(socket.timeout(str(reason)))
+    if isinstance(reason, OSError):
+        return URLError(reason)
+    return URLError(OSError(str(reason)))
+
+
+def _discard(response):
+    """Give the connection of a response back to the pool without reading it.
+
+    Fully read responses already released their connection, so this is a no-op
+    for them. Otherwise the connection is closed, as the unread body makes it
+    unusable, and its pool slot is freed.
+    """
+    response.close()
+    response.release_conn()
 
 
 def _execute_request(
@@ -28,11 +252,75 @@ def _execute_request(
         base_headers.update(headers)
     if data and not isinstance(data, bytes): # encode data for request
             data = bytes(json.dumps(data), encoding="utf-8")
-    if url.lower().startswith("http"):
-        request = Request(url, headers=base_headers, method=method, data=data)
-    else:
+    if not url.lower().startswith("http"):
         raise ValueError("Invalid URL")
-    return urlopen(request, timeout=timeout)  # nosec
+    if method is None:
+        method = "POST" if data is not None else "GET"
+    if timeout is socket._GLOBAL_DEFAULT_TIMEOUT:
+        timeout = urllib3.Timeout.DEFAULT_TIMEOUT
+
+    if use_http2 and not _proxies:
+        if http2.available():
+            response, url = _execute_http2_request(url, method, base_headers, data, timeout)
+            if response is not None:
+                return response
+        else:
+            http2.warn_unavailable()
+
+    manager = _pool_manager(url)
+    _drop_idle_connections(manager, url)
+    try:
+        response = manager.request(
+            method,
+            url,
+            body=data,
+            headers=base_headers,
+            timeout=timeout,
+            retries=urllib3.Retry(connect=1, read=False, redirect=10, status=0, other=0),
+            preload_content=False,
+        )
+    except TransportError as e:
+        raise _transport_error(e) from e
+
+    if response.status >= 400:
+        body = response.read()
+        response.release_conn()
+        raise HTTPError(url, response.status, response.reason, response.headers, io.BytesIO(body))
+    return response
+
+
+def _execute_http2_request(url, method, headers, data, timeout):
+    """Send a request over HTTP/2, following the redirects.
+
+    :rtype: Tuple[Optional[http2.HTTP2Response], str]
+    :returns:
+        The response, or None if the (redirected) URL must be requested over
+        HTTP/1.1, and the last URL requested.
+    """
+    if timeout is urllib3.Timeout.DEFAULT_TIMEOUT:
+        timeout = socket.getdefaulttimeout()
+    for _ in range(10):
+        try:
+            response = http2.request(method, url, headers, data, timeout)
+        except TransportError as e:
+            raise _transport_error(e) from e
+        if response is None:
+            return None, url
+
+        location = response.headers.get("location")
+        if response.status in (301, 302, 303, 307, 308) and location:
+            response.close()
+            url = parse.urljoin(url, location)
+            if response.status == 303:
+                method, data = "GET", None
+            continue
+
+        if response.status >= 400:
+            body = response.read()
+            response.release_conn()
+            raise HTTPError(url, response.status, response.reason, response.headers, io.BytesIO(body))
+        return response, url
+    return None, url
 
 
 def get(url, extra_headers=None, timeout=socket._GLOBAL_DEFAULT_TIMEOUT):
@@ -86,12 +374,24 @@ def post(url, extra_headers=None, data=None, timeout=socket._GLOBAL_DEFAULT_TIME
 def seq_stream(
             url,
             timeout=socket._GLOBAL_DEFAULT_TIMEOUT,
-            max_retries=0):
+            max_retries=0,
+            workers=None,
+            limiter=None):
 
     """Read the response in sequence.
+
+    Up to ``workers`` segments are downloaded ahead of the one being read, but
+    the segments are always yielded in order.
+
     :param str url: The URL to perform the GET request for.
+    :param int workers:
+        (Optional) Number of segments fetched at the same time. Defaults to
+        ``default_segment_workers``.
+    :param TokenBucket limiter:
+        (Optional) Bandwidth limit of this download, see :mod:`pytubefix.throttle`.
     :rtype: Iterable[bytes]
     """
+    workers = workers or default_segment_workers
     # YouTube expects a request sequence number as part of the parameters.
     split_url = parse.urlsplit(url)
     base_url = f'{split_url.scheme}://{split_url.netloc}/{split_url.path}?'
@@ -103,8 +403,8 @@ def seq_stream(
     querys['sq'] = 0
     url = base_url + parse.urlencode(querys)
 
-    segment_data = b''
-    for chunk in stream(url, timeout=timeout, max_retries=max_retries):
+    segment_data = bytearray()
+    for chunk in stream(url, timeout=timeout, max_retries=max_retries, limiter=limiter):
         yield chunk
         segment_data += chunk
 
@@ -116,102 +416,301 @@ def seq_stream(
         if match:
             segment_count = int(match.group(1).decode('utf-8'))
 
-    # We request these segments sequentially to build the file.
-    seq_num = 1
-    while seq_num <= segment_count:
-        # Create sequential request URL
-        querys['sq'] = seq_num
-        url = base_url + parse.urlencode(querys)
-
-        yield from stream(url, timeout=timeout, max_retries=max_retries)
-        seq_num += 1
+    def segment_url(seq_num):
+        return base_url + parse.urlencode({**querys, 'sq': seq_num})
+
+    if workers <= 1:
+        # We request these segments sequentially to build the file.
+        seq_num = 1
+        while seq_num <= segment_count:
+            yield from stream(segment_url(seq_num), timeout=timeout, max_retries=max_retries, limiter=limiter)
+            seq_num += 1
+        return  # pylint: disable=R1711
+
+    local = threading.local()
+
+    def fetch(seq_num):
+        # Each thread reuses its read buffer for all the segments it fetches
+        if not hasattr(local, 'buffer'):
+            local.buffer = bytearray(default_buffer_size)
+        segment = bytearray()
+        for chunk in stream(
+            segment_url(seq_num), timeout=timeout, max_retries=max_retries, buffer=local.buffer, limiter=limiter
+        ):
+            segment += chunk
+        return bytes(segment)
+
+    # Keep a window of segments downloading ahead and hand them out in order.
+    executor = ThreadPoolExecutor(max_workers=workers)
+    pending = deque()
+    try:
+        seq_num = 1
+        while seq_num <= segment_count or pending:
+            while seq_num <= segment_count and len(pending) < workers:
+                pending.append(executor.submit(fetch, seq_num))
+                seq_num += 1
+            yield pending.popleft().result()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
     return  # pylint: disable=R1711
 
 
-# TODO: Refactor this code
+def _request_range(url, start, stop, timeout, max_retries):
+    """Request the bytes ``start`` to ``stop`` (inclusive) of a stream.
+
+    Timeouts and incomplete reads are retried up to ``max_retries`` times.
+
+    :rtype: urllib3.response.HTTPResponse
+    """
+    tries = 0
+
+    # Attempt to make the request multiple times as necessary.
+    while True:
+        # If the max retries is exceeded, raise an exception
+        if tries >= 1 + max_retries:
+            raise MaxRetriesExceeded()
+
+        # Try to execute the request, ignoring socket timeouts
+        try:
+            return _execute_request(
+                f"{url}&range={start}-{stop}",
+                method="GET",
+                timeout=timeout
+            )
+        except URLError as e:
+            # We only want to skip over timeout errors, and
+            # raise any other URLError exceptions
+            if not isinstance(e.reason, (socket.timeout, OSError)):
+                raise
+        except http.client.IncompleteRead:
+            # Allow retries on IncompleteRead errors for unreliable connections
+            pass
+        if adaptive_range_size:
+            range_size_controller.failure(url)
+        tries += 1
+
+
+def _readinto(response, buffer):
+    """Read the next part of a response body into ``buffer``.
+
+    urllib3's ``readinto`` reads a new bytes object, then copies it into the
+    buffer. The :class:`http.client.HTTPResponse` under it fills the buffer
+    itself, so it is read directly unless urllib3 has to decode the body.
+
+    :rtype: int
+    :returns: The amount of bytes read, 0 once the body is complete.
+    """
+    raw = getattr(response, "_fp", None)
+    if not isinstance(raw, http.client.HTTPResponse) or response.headers.get("Content-Encoding", "identity") != "identity":
+        return response.readinto(buffer)
+
+    try:
+        size = raw.readinto(buffer)
+    except (http.client.HTTPException, OSError) as e:
+        # Same error as urllib3 for a broken connection
+        raise ProtocolError(f"Connection broken: {e!r}", e) from e
+    if raw.isclosed():
+        # The whole body was read, the connection goes back to the pool
+        response.release_conn()
+    return size
+
+
+def _read_chunks(response, url, buffer, limiter=None):
+    """Read the body of a range response into a reusable buffer.
+
+    Every chunk is a view of ``buffer``, overwritten by the next one. Stops
+    early, without raising, if the connection breaks: the caller requests the
+    missing bytes again. The reads are paced by the bandwidth limits.
+
+    :param bytearray buffer: The buffer the chunks are read into.
+    :param TokenBucket limiter: (Optional) Bandwidth limit of the download.
+    :rtype: Iterable[memoryview]
+    """
+    view = memoryview(buffer)
+    try:
+        while True:
+            try:
+                size = _readinto(response, buffer)
+            except (ProtocolError, ReadTimeoutError):
+                # The connection broke mid-range, request the rest again
+                size = 0
+                if adaptive_range_size:
+                    range_size_controller.failure(url)
+            if not size:
+                break
+            throttle.consume(size, limiter)
+            yield view[:size]
+    finally:
+        _discard(response)
+
+
+def _content_range_total(response):
+    """Get the total size of the file from a ``Content-Range`` header.
+
+    :rtype: Optional[int]
+    :returns:
+        The size in bytes, or None if the header is missing or the size unknown.
+    """
+    content_range = response.headers.get("Content-Range", "")
+    total = content_range.rpartition("/")[2].strip()
+    return int(total) if total.isdigit() else None
+
+
 def stream(url,
            timeout=socket._GLOBAL_DEFAULT_TIMEOUT,
-           max_retries=0):
+           max_retries=0,
+           file_size=None,
+           buffer=None,
+           limiter=None):
     """Read the response in chunks.
+
+    The size of the file is taken, in order, from ``file_size``, the size cache
+    shared with :func:`filesize`, the ``Content-Range`` of the first range
+    response, or a (cached) HEAD request once the first range has been read.
+
     :param str url: The URL to perform the GET request for.
+    :param int file_size: (Optional) Size of the file in bytes, if already known.
+    :param bytearray buffer:
+        (Optional) Buffer to read into. When given, the chunks are views of
+        this buffer, only valid until the next chunk is requested. Otherwise
+        every chunk is a new bytes object.
+    :param TokenBucket limiter:
+        (Optional) Bandwidth limit of this download, see :mod:`pytubefix.throttle`.
     :rtype: Iterable[bytes]
     """
-    file_size: int = default_range_size  # fake filesize to start
+    file_size = file_size or _filesize_cache.get(url)
+    shared = buffer is not None
+    if not shared:
+        buffer = bytearray(default_buffer_size)
     downloaded = 0
-    while downloaded < file_size:
-        stop_pos = min(downloaded + default_range_size, file_size) - 1
-        range_header = f"bytes={downloaded}-{stop_pos}"
-        tries = 0
-
-        # Attempt to make the request multiple times as necessary.
-        while True:
-            # If the max retries is exceeded, raise an exception
-            if tries >= 1 + max_retries:
-                raise MaxRetriesExceeded()
-
-            # Try to execute the request, ignoring socket timeouts
-            try:
-                response = _execute_request(
-                    f"{url}&range={downloaded}-{stop_pos}",
-                    method="GET",
-                    timeout=timeout
-                )
-            except URLError as e:
-                # We only want to skip over timeout errors, and
-                # raise any other URLError exceptions
-                if not isinstance(e.reason, (socket.timeout, OSError)):
-                    raise
-            except http.client.IncompleteRead:
-                # Allow retries on IncompleteRead errors for unreliable connections
-                pass
+    if file_size is None:
+        range_size = _range_size(url)
+        started = time.monotonic()
+        response = _request_range(url, 0, range_size - 1, timeout, max_retries)
+        file_size = _content_range_total(response)
+        expected = int(response.headers.get("Content-Length", -1))
+
+        paused = 0.0
+        for chunk in _read_chunks(response, url, buffer, limiter):
+            downloaded += len(chunk)
+            # Time spent by the consumer must not count against the network
+            yielded = time.monotonic()
+            yield chunk if shared else bytes(chunk)
+            paused += time.monotonic() - yielded
+
+        if adaptive_range_size:
+            range_size_controller.success(url, range_size, downloaded, time.monotonic() - started - paused)
+
+        if file_size is None:
+            if downloaded == expected and downloaded < range_size:
+                # A complete but short first range means we have the whole file
+                file_size = downloaded
             else:
-                # On a successful request, break from loop
-                break
-            tries += 1
+                file_size = filesize(url)
+        _cache_filesize(url, file_size)
 
-        if file_size == default_range_size:
-            try:
-                resp = _execute_request(
-                    f"{url}&range=0-99999999999",
-                    method="GET",
-                    timeout=timeout
-                )
-                content_range = resp.info()["Content-Length"]
-                file_size = int(content_range)
-            except (KeyError, IndexError, ValueError) as e:
-                logger.error(e)
-        while True:
-            try:
-                chunk = response.read()
-            except StopIteration:
-                return
-            except http.client.IncompleteRead as e:
-                chunk = e.partial
-            if not chunk:
-                break
-
-            if chunk: downloaded += len(chunk)
-            yield chunk
+    yield from range_stream(
+        url,
+        downloaded,
+        file_size - 1,
+        timeout=timeout,
+        max_retries=max_retries,
+        buffer=buffer if shared else None,
+        limiter=limiter
+    )
     return  # pylint: disable=R1711
 
 
-@lru_cache()
+def range_stream(url,
+                 start,
+                 stop,
+                 timeout=socket._GLOBAL_DEFAULT_TIMEOUT,
+                 max_retries=0,
+                 buffer=None,
+                 limiter=None):
+    """Read the bytes ``start`` to ``stop`` (inclusive) of a stream in chunks.
+
+    Unlike :func:`stream`, the size of the file must already be known, which
+    allows several ranges of the same file to be read concurrently.
+
+    :param str url: The URL to perform the GET requests for.
+    :param int start: Offset of the first byte to read.
+    :param int stop: Offset of the last byte to read.
+    :param bytearray buffer:
+        (Optional) Buffer to read into, see :func:`stream`.
+    :param TokenBucket limiter:
+        (Optional) Bandwidth limit of this download, see :mod:`pytubefix.throttle`.
+    :rtype: Iterable[bytes]
+    """
+    shared = buffer is not None
+    if not shared:
+        buffer = bytearray(default_buffer_size)
+    downloaded = start
+    stalls = 0
+    while downloaded <= stop:
+        stop_pos = min(downloaded + _range_size(url) - 1, stop)
+        started = time.monotonic()
+        response = _request_range(url, downloaded, stop_pos, timeout, max_retries)
+
+        received = 0
+        paused = 0.0
+        for chunk in _read_chunks(response, url, buffer, limiter):
+            # Never hand out more than the requested range
+            if len(chunk) > stop + 1 - downloaded:
+                chunk = chunk[:stop + 1 - downloaded]
+            received += len(chunk)
+            downloaded += len(chunk)
+            # Time spent by the consumer must not count against the network
+            yielded = time.monotonic()
+            yield chunk if shared else bytes(chunk)
+            paused += time.monotonic() - yielded
+
+        if adaptive_range_size:
+            range_size_controller.success(
+                url, stop_pos + 1 - (downloaded - received), received, time.monotonic() - started - paused
+            )
+
+        # An empty response would make us loop forever on the same range
+        stalls = stalls + 1 if not received else 0
+        if stalls > max_retries:
+            raise MaxRetriesExceeded()
+
+
+def _cache_filesize(url, size):
+    """Remember the size of the file at the given URL."""
+    with _pool_lock:
+        _filesize_cache[url] = size
+        _filesize_cache.move_to_end(url)
+        while len(_filesize_cache) > _filesize_cache_size:
+            _filesize_cache.popitem(last=False)
+
+
 def filesize(url):
     """Fetch size in bytes of file at given URL
 
+    The result is kept in a cache shared with :func:`stream`.
+
     :param str url: The URL to get the size of
     :returns: int: size in bytes of remote file
     """
-    return int(head(url)["content-length"])
+    size = _filesize_cache.get(url)
+    if size is None:
+        size = int(head(url)["content-length"])
+        _cache_filesize(url, size)
+    return size
 
 
 @lru_cache()
-def seq_filesize(url):
+def seq_filesize(url, workers=None):
     """Fetch size in bytes of file at given URL from sequential requests
 
     :param str url: The URL to get the size of
+    :param int workers:
+        (Optional) Number of HEAD requests made at the same time. Defaults to
+        ``default_segment_workers``.
     :returns: int: size in bytes of remote file
     """
+    workers = workers or default_segment_workers
     total_filesize = 0
     # YouTube expects a request sequence number as part of the parameters.
     split_url = parse.urlsplit(url)
@@ -245,15 +744,13 @@ def seq_filesize(url):
     if segment_count == 0:
         raise RegexMatchError('seq_filesize', segment_regex)
 
-    # We make HEAD requests to the segments sequentially to find the total filesize.
-    seq_num = 1
-    while seq_num <= segment_count:
-        # Create sequential request URL
-        querys['sq'] = seq_num
-        url = base_url + parse.urlencode(querys)
+    # We make HEAD requests to the segments to find the total filesize.
+    def segment_size(seq_num):
+        url = base_url + parse.urlencode({**querys, 'sq': seq_num})
+        return int(head(url)['content-length'])
 
-        total_filesize += int(head(url)['content-length'])
-        seq_num += 1
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        total_filesize += sum(executor.map(segment_size, range(1, segment_count + 1)))
     return total_filesize
 
 
@@ -266,5 +763,6 @@ def head(url):
     :returns:
         dictionary of lowercase headers
     """
-    response_headers = _execute_request(url, method="HEAD").info()
-    return {k.lower(): v for k, v in response_headers.items()}
+    response = _execute_request(url, method="HEAD")
+    response.release_conn()
+    return {k.lower(): v for k, v in response.headers.items()}
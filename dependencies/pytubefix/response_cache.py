@@ -0,0 +1,318 @@
+"""This module implements the cache of the InnerTube API responses.
+
+Player, next and browse responses are cached by request, so creating a new
+:class:`YouTube <YouTube>` object for a video that was already fetched (a retry,
+a playlist processed again...) does not make any API call. A player response
+lives until its streaming urls expire, see the ``expire`` parameter of the urls,
+other responses live :data:`default_ttl` seconds.
+
+Responses are kept in memory by default. :func:`configure` can add a SQLite
+database shared between processes, and any :class:`ResponseCache` can be
+assigned to :data:`cache`. Only player responses are saved in the database:
+playlists and channels change, a new run must see their current content.
+"""
+
+import abc
+import collections
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import List, Optional, Tuple
+
+from pytubefix.helpers import user_cache_dir
+
+logger = logging.getLogger(__name__)
+
+# Seconds a next or browse response is reused.
+default_ttl = 3600
+
+# A player response is dropped this amount of seconds before its urls expire,
+# so a download never starts with an url about to stop working.
+expire_margin = 600
+
+# Database used when configure() is asked for a persistent cache, see
+# helpers.user_cache_dir(). Assign another path to move it.
+default_database = os.path.join(user_cache_dir(), 'responses.sqlite3')
+
+_expire_regex = re.compile(r'(?:[?&]|%3F|%26)expire(?:=|%3D)(\d+)')
+
+
+class ResponseCache(abc.ABC):
+    """Storage of the responses, by request key.
+
+    Values are the raw JSON texts of the responses, so every hit is parsed
+    again and callers never share a mutable response.
+    """
+
+    @abc.abstractmethod
+    def get(self, key: str) -> Optional[Tuple[str, float, Optional[str]]]:
+        """Get a response.
+
+        :param str key:
+            Key of the request.
+        :rtype: Tuple[str, float, str]
+        :returns:
+            The response, the time it expires at and its tag, or None if it is
+            not cached or expired.
+        """
+
+    @abc.abstractmethod
+    def set(self, key: str, value: str, expires: float, tag: Optional[str] = None, persist: bool = True):
+        """Add a response.
+
+        :param str key:
+            Key of the request.
+        :param str value:
+            The response.
+        :param float expires:
+            Time (as returned by :func:`time.time`) the response expires at.
+        :param str tag:
+            (Optional) Tag used to invalidate the response, the video id.
+        :param bool persist:
+            (Optional) Whether the response may outlive the process. Caches
+            shared between runs ignore the responses that may not.
+        """
+
+    @abc.abstractmethod
+    def invalidate(self, tag: str):
+        """Remove every response with the given tag."""
+
+    @abc.abstractmethod
+    def clear(self):
+        """Remove every response."""
+
+
+class MemoryCache(ResponseCache):
+    """Least recently used responses of the process."""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[1] <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key, value, expires, tag=None, persist=True):
+        with self._lock:
+            self._entries[key] = (value, expires, tag)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, tag):
+        with self._lock:
+            for key in [key for key, entry in self._entries.items() if entry[2] == tag]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteCache(ResponseCache):
+    """Responses saved in a SQLite database, shared between processes."""
+
+    def __init__(self, path: str):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, timeout=10, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS responses '
+                '(key TEXT PRIMARY KEY, tag TEXT, expires REAL, value TEXT)'
+            )
+            self._connection.execute('CREATE INDEX IF NOT EXISTS responses_tag ON responses (tag)')
+            self._connection.execute('DELETE FROM responses WHERE expires <= ?', (time.time(),))
+
+    def get(self, key):
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT value, expires, tag FROM responses WHERE key = ? AND expires > ?', (key, time.time())
+            ).fetchone()
+        return tuple(row) if row else None
+
+    def set(self, key, value, expires, tag=None, persist=True):
+        if not persist:
+            return
+        with self._lock, self._connection:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO responses (key, tag, expires, value) VALUES (?, ?, ?, ?)',
+                (key, tag, expires, value)
+            )
+
+    def invalidate(self, tag):
+        with self._lock, self._connection:
+            self._connection.execute('DELETE FROM responses WHERE tag = ?', (tag,))
+
+    def clear(self):
+        with self._lock, self._connection:
+            self._connection.execute('DELETE FROM responses')
+
+
+class TieredCache(ResponseCache):
+    """Several caches looked up in order, the fastest first.
+
+    A response found in a slower cache is copied to the faster ones.
+    """
+
+    def __init__(self, caches: List[ResponseCache]):
+        self.caches = caches
+
+    def get(self, key):
+        for index, cache in enumerate(self.caches):
+            entry = cache.get(key)
+            if entry is not None:
+                for faster_cache in self.caches[:index]:
+                    faster_cache.set(key, *entry)
+                return entry
+        return None
+
+    def set(self, key, value, expires, tag=None, persist=True):
+        for cache in self.caches:
+            cache.set(key, value, expires, tag, persist)
+
+    def invalidate(self, tag):
+        for cache in self.caches:
+            cache.invalidate(tag)
+
+    def clear(self):
+        for cache in self.caches:
+            cache.clear()
+
+
+cache: Optional[ResponseCache] = MemoryCache()
+
+
+def configure(max_entries: int = 256, database: Optional[str] = None):
+    """Set the caches used for the responses.
+
+    :param int max_entries:
+        Amount of responses kept in memory. 0 disables the memory cache.
+    :param str database:
+        (Optional) Path of a SQLite database keeping the responses between
+        runs, see :data:`default_database`.
+    """
+    global cache
+    caches = []
+    if max_entries > 0:
+        caches.append(MemoryCache(max_entries))
+    if database:
+        try:
+            caches.append(SQLiteCache(database))
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"unable to open the response cache {database}: {e}")
+
+    if not caches:
+        cache = None
+    else:
+        cache = caches[0] if len(caches) == 1 else TieredCache(caches)
+
+
+def request_key(endpoint: str, query: dict, data: dict, use_oauth: bool) -> str:
+    """Get the key of an API request.
+
+    The body holds the client, its context (visitorData, signatureTimestamp,
+    poToken...) and the requested video or continuation, so two requests with
+    the same key get the same response.
+    """
+    request = json.dumps([endpoint, query, data, use_oauth], sort_keys=True, default=str)
+    return hashlib.sha256(request.encode('utf-8')).hexdigest()
+
+
+def player_expiration(response: dict) -> Optional[float]:
+    """Get the time a player response stops being usable.
+
+    :rtype: float
+    :returns:
+        The earliest expiration of its streaming urls, or None if the
+        response must not be cached (unplayable video, no streams).
+    """
+    if response.get('playabilityStatus', {}).get('status') != 'OK':
+        return None
+    streaming_data = response.get('streamingData')
+    if not streaming_data:
+        return None
+
+    urls = [streaming_data.get('serverAbrStreamingUrl', '')]
+    for fmt in streaming_data.get('formats', []) + streaming_data.get('adaptiveFormats', []):
+        urls.append(fmt.get('url') or fmt.get('signatureCipher', ''))
+    expires = [int(match.group(1)) for url in urls for match in _expire_regex.finditer(url)]
+    if expires:
+        return min(expires)
+
+    if 'expiresInSeconds' in streaming_data:
+        return time.time() + int(streaming_data['expiresInSeconds'])
+    return None
+
+
+def get(key: str) -> Optional[str]:
+    """Get a cached response, None if there is none."""
+    if cache is None:
+        return None
+    entry = cache.get(key)
+    if entry is None:
+        return None
+    logger.debug(f"InnerTube response {key[:12]} found in the cache")
+    return entry[0]
+
+
+def store(key: str, endpoint: str, value: str, tag: Optional[str] = None):
+    """Cache a response for as long as it stays valid.
+
+    Only player responses are saved in the caches shared between runs.
+
+    :param str key:
+        Key of the request.
+    :param str endpoint:
+        Url of the requested endpoint.
+    :param str value:
+        Raw JSON response.
+    :param str tag:
+        (Optional) The requested video id.
+    """
+    if cache is None:
+        return
+
+    persist = endpoint.endswith('/player')
+    if persist:
+        try:
+            expires = player_expiration(json.loads(value))
+        except ValueError:
+            return
+        if expires is None:
+            return
+        expires -= expire_margin
+    else:
+        expires = time.time() + default_ttl
+
+    if expires > time.time():
+        cache.set(key, value, expires, tag, persist)
+
+
+def invalidate(video_id: str):
+    """Forget the responses of a video, to fetch fresh streaming urls."""
+    if cache is not None:
+        cache.invalidate(video_id)
+
+
+def clear():
+    """Forget every cached response."""
+    if cache is not None:
+        cache.clear()
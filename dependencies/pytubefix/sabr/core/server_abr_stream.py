@@ -7,8 +7,8 @@ from enum import Enum
 from time import sleep
 from typing import Optional
 from collections.abc import Callable
-from urllib.request import Request, urlopen
 
+from pytubefix import request, throttle
 from pytubefix.sabr.core.UMP import UMP
 from pytubefix.monostate import Monostate
 from pytubefix.exceptions import SABRError
@@ -81,9 +81,10 @@ class PoTokenStatus(enum.Enum):
 
 
 class ServerAbrStream:
-    def __init__(self, stream, write_chunk: Callable, monostate: Monostate):
+    def __init__(self, stream, write_chunk: Callable, monostate: Monostate, limiter=None):
 
         self.stream = stream
+        self.limiter = limiter
         self.write_chunk = write_chunk
         self.youtube = monostate.youtube
         self.po_token = self.stream.po_token
@@ -221,8 +222,14 @@ class ServerAbrStream:
         base_headers = {
             "User-Agent": "Mozilla/5.0", "accept-language": "en-US,en", "Content-Type": "application/vnd.yt-ump",
         }
-        request = Request(self.server_abr_streaming_url, headers=base_headers, method="POST", data=bytes(body))
-        return self.parse_ump_response(bytes(urlopen(request).read()))
+        response = request._execute_request(
+            self.server_abr_streaming_url, method="POST", headers=base_headers, data=bytes(body)
+        )
+        data = bytearray()
+        for chunk in response.stream(request.default_buffer_size):
+            throttle.consume(len(chunk), self.limiter)
+            data += chunk
+        return self.parse_ump_response(bytes(data))
 
     def parse_ump_response(self, response):
         self.header_id_to_format_key_map.clear()
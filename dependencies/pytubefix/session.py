@@ -0,0 +1,123 @@
+"""This module implements the state shared by the requests of several videos.
+
+Every :class:`YouTube <YouTube>` object needs a visitorData, and may need a
+PO token or an OAuth bearer token. Without a session each object resolves them
+on its own, which costs at least one request per video. The objects created
+with the same :class:`Session` resolve them once, then reuse them until they
+expire.
+"""
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+
+class Session:
+    """visitorData, PO token and OAuth tokens shared between videos.
+
+    The token attributes are named after the ones of :class:`InnerTube
+    <pytubefix.innertube.InnerTube>`, which copies them from and to the session.
+    """
+
+    def __init__(self, visitor_data_ttl: float = 21600):
+        """Construct a :class:`Session <Session>`.
+
+        :param float visitor_data_ttl:
+            (Optional) Seconds a visitorData is reused before resolving a new
+            one. Defaults to 6 hours.
+        """
+        self.visitor_data_ttl = visitor_data_ttl
+        self._visitor_data: Optional[str] = None
+        self._visitor_data_expires = 0.0
+
+        # OAuth, see InnerTube.fetch_bearer_token()
+        self.access_token: Optional[str] = None
+        self.refresh_token: Optional[str] = None
+        self.expires: Optional[int] = None
+
+        # PO token and its visitorData, see InnerTube.fetch_po_token()
+        self.access_visitorData: Optional[str] = None
+        self.access_po_token: Optional[str] = None
+
+        # Client that returned a playable player response, by list of clients
+        # tried, see YouTube.vid_info_client()
+        self._preferred_clients: Dict[Tuple[str, ...], str] = {}
+
+        self._lock = threading.RLock()
+
+    @property
+    def cached_visitor_data(self) -> Optional[str]:
+        """The visitorData of the session, None if it is unknown or expired."""
+        with self._lock:
+            if self._visitor_data and time.time() < self._visitor_data_expires:
+                return self._visitor_data
+            return None
+
+    def set_visitor_data(self, visitor_data: str):
+        """Use this visitorData for the next :attr:`visitor_data_ttl` seconds."""
+        with self._lock:
+            self._visitor_data = visitor_data
+            self._visitor_data_expires = time.time() + self.visitor_data_ttl
+
+    def visitor_data(self, resolve: Callable[[], str]) -> str:
+        """Get the visitorData of the session.
+
+        :param Callable resolve:
+            Function requesting a new visitorData, only called if the session
+            has none or it expired. Concurrent callers wait for the first one
+            instead of all making the request.
+        :rtype: str
+        """
+        with self._lock:
+            visitor_data = self.cached_visitor_data
+            if visitor_data is None:
+                visitor_data = resolve()
+                self.set_visitor_data(visitor_data)
+            return visitor_data
+
+    def preferred_client(self, clients: Tuple[str, ...]) -> Optional[str]:
+        """Get the client that could play the previous videos.
+
+        :param Tuple[str] clients:
+            The client of the video followed by its fallback clients.
+        :rtype: str
+        """
+        with self._lock:
+            return self._preferred_clients.get(clients)
+
+    def set_preferred_client(self, clients: Tuple[str, ...], client: str):
+        """Try this client first for the next videos using the same clients."""
+        with self._lock:
+            self._preferred_clients[clients] = client
+
+    def load_tokens(self, innertube) -> bool:
+        """Copy the tokens of the session to an InnerTube object.
+
+        :rtype: bool
+        :returns:
+            True if the session had OAuth tokens, so there is no need to read
+            them from the token file.
+        """
+        with self._lock:
+            if self.access_po_token:
+                innertube.access_visitorData = self.access_visitorData
+                innertube.access_po_token = self.access_po_token
+            if not self.access_token:
+                return False
+            innertube.access_token = self.access_token
+            innertube.refresh_token = self.refresh_token
+            innertube.expires = self.expires
+            return True
+
+    def save_tokens(self, innertube):
+        """Keep the tokens an InnerTube object fetched or refreshed."""
+        with self._lock:
+            if innertube.access_token:
+                self.access_token = innertube.access_token
+                self.refresh_token = innertube.refresh_token
+                self.expires = innertube.expires
+            if innertube.access_po_token:
+                self.access_visitorData = innertube.access_visitorData
+                self.access_po_token = innertube.access_po_token
+
+    def __repr__(self) -> str:
+        return f'<pytubefix.session.Session object: visitorData={self._visitor_data}>'
@@ -7,19 +7,24 @@ has been renamed to accommodate DASH (which serves the audio and video
 separately).
 """
 
+import asyncio
 import logging
 import os
 from math import ceil
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import BinaryIO, Dict, Optional, Tuple, Iterator, Callable
 from urllib.error import HTTPError
 from urllib.parse import parse_qs
 from pathlib import Path
 
-from pytubefix import extract, request
+from pytubefix import async_request, extract, request, response_cache, throttle
+from pytubefix.exceptions import StreamRefreshError
 from pytubefix.helpers import target_directory
+from pytubefix.journal import DownloadJournal
 from pytubefix.itags import get_format_profile
 from pytubefix.monostate import Monostate
 from pytubefix.file_system import file_system_verify
@@ -328,7 +333,11 @@ class Stream:
         skip_existing: bool = True,
         timeout: Optional[int] = None,
         max_retries: int = 0,
-        interrupt_checker: Optional[Callable[[], bool]] = None
+        interrupt_checker: Optional[Callable[[], bool]] = None,
+        workers: int = 1,
+        segment_size: Optional[int] = None,
+        resume: bool = False,
+        max_bandwidth: Optional[int] = None
     ) -> Optional[str]:
         """
         Downloads a file from the URL provided by `self.url` and saves it locally with optional configurations.
@@ -341,6 +350,10 @@ class Stream:
             timeout (Optional[int]): Maximum time, in seconds, to wait for the download request. Defaults to None for no timeout.
             max_retries (int): The number of times to retry the download if it fails. Defaults to 0 (no retries).
             interrupt_checker (Optional[Callable[[], bool]]): A callable function that is checked periodically during the download. If it returns True, the download will stop without errors.
+            workers (int): Number of connections used to download the file concurrently. Defaults to 1 (sequential download).
+            segment_size (Optional[int]): Size in bytes of the ranges fetched by each worker when `workers` is above 1. Defaults to an even split of the file between the workers.
+            resume (bool): Whether to continue a previous attempt that left a partial file and its journal behind, downloading only the missing ranges. Defaults to False.
+            max_bandwidth (Optional[int]): Maximum bytes per second read by this download, on top of the process-wide limit of `pytubefix.throttle`. Defaults to None for no limit.
 
         Returns:
             Optional[str]: The full file path of the downloaded file, or None if the download was skipped or failed.
@@ -351,32 +364,11 @@ class Stream:
         Note:
             - The `skip_existing` flag avoids redownloading if the file already exists in the target location.
             - The `interrupt_checker` allows for the download to be halted cleanly if certain conditions are met during the download process.
+            - Segmented downloads (`workers` above 1) write each range at its offset in a preallocated file. OTF and SABR streams are always downloaded sequentially.
+            - Segmented and resumable downloads keep a `.journal` file of the completed ranges next to the output file until the download is complete. When resuming, an expired stream url is refreshed first.
             - Download progress can be monitored using the `on_progress` callback, and the `on_complete` callback is triggered once the download is finished.
         """
-
-        kernel = sys.platform
-
-        if kernel == "linux":
-            file_system = "ext4"
-        elif kernel == "darwin":
-            file_system = "APFS"
-        else:
-            file_system = "NTFS"
-
-        translation_table = file_system_verify(file_system)
-
-        if filename is None:
-            filename = self.default_filename.translate(translation_table)
-
-        if filename:
-            filename = filename.translate(translation_table)
-
-        file_path = self.get_file_path(
-            filename=filename,
-            output_path=output_path,
-            filename_prefix=filename_prefix,
-            file_system=file_system
-        )
+        file_path = self._download_path(output_path, filename, filename_prefix)
 
         if skip_existing and self.exists_at_path(file_path):
             logger.debug(f'file {file_path} already exists, skipping')
@@ -390,14 +382,59 @@ class Stream:
             # send to the on_progress callback.
             self.on_progress(chunk_, fh, bytes_remaining_)
 
+        limiter = throttle.TokenBucket(max_bandwidth) if max_bandwidth else None
 
-        with open(file_path, "wb") as fh:
+        # Segmented and resumed downloads go range by range, tracked by a journal.
+        journal = None
+        if not self.is_sabr and not self.is_otf and (workers > 1 or resume):
+            if resume:
+                self._refresh_if_expired()
+            journal = DownloadJournal(file_path, self.filesize, self._journal_identity())
+            if resume and journal.load():
+                logger.debug(f'resuming {journal}')
+
+        with open(file_path, "r+b" if journal and journal.ranges else "wb") as fh:
             try:
-                if not self.is_sabr:
+                if journal is not None:
+                    try:
+                        completed = self._download_segments(
+                            fh,
+                            workers=workers,
+                            segment_size=segment_size,
+                            timeout=timeout,
+                            max_retries=max_retries,
+                            interrupt_checker=interrupt_checker,
+                            journal=journal,
+                            limiter=limiter
+                        )
+                    except HTTPError as e:
+                        # Signed urls are rejected once expired, get a new one and go on.
+                        if e.code != 403 or not resume:
+                            raise
+                        logger.debug('stream url rejected, refreshing it before resuming')
+                        self.refresh_url()
+                        completed = self._download_segments(
+                            fh,
+                            workers=workers,
+                            segment_size=segment_size,
+                            timeout=timeout,
+                            max_retries=max_retries,
+                            interrupt_checker=interrupt_checker,
+                            journal=journal,
+                            limiter=limiter
+                        )
+                    if not completed:
+                        logger.debug('interrupt_checker returned True, causing to force stop the downloading')
+                        return
+                    journal.remove()
+                elif not self.is_sabr:
                     for chunk in request.stream(
                         self.url,
                         timeout=timeout,
-                        max_retries=max_retries
+                        max_retries=max_retries,
+                        file_size=self.filesize,
+                        buffer=bytearray(request.default_buffer_size),
+                        limiter=limiter
                     ):
                         if interrupt_checker is not None and interrupt_checker() == True:
                             logger.debug('interrupt_checker returned True, causing to force stop the downloading')
@@ -407,7 +444,9 @@ class Stream:
                         write_chunk(chunk, bytes_remaining)
                 else:
                     logger.debug('This stream is SABR. Starting ServerAbrStream')
-                    ServerAbrStream(stream=self, write_chunk=write_chunk, monostate=self._monostate).start()
+                    ServerAbrStream(
+                        stream=self, write_chunk=write_chunk, monostate=self._monostate, limiter=limiter
+                    ).start()
 
             except HTTPError as e:
                 if e.code != 404:
@@ -418,7 +457,8 @@ class Stream:
                     for chunk in request.seq_stream(
                         self.url,
                         timeout=timeout,
-                        max_retries=max_retries
+                        max_retries=max_retries,
+                        limiter=limiter
                     ):
                         if interrupt_checker is not None and interrupt_checker() == True:
                             logger.debug('interrupt_checker returned True, causing to force stop the downloading')
@@ -428,11 +468,313 @@ class Stream:
                         write_chunk(chunk, bytes_remaining)
                 else:
                     logger.debug('This stream is SABR. Starting ServerAbrStream')
-                    ServerAbrStream(stream=self, write_chunk=write_chunk, monostate=self._monostate).start()
+                    ServerAbrStream(
+                        stream=self, write_chunk=write_chunk, monostate=self._monostate, limiter=limiter
+                    ).start()
 
             self.on_complete(file_path)
             return file_path
 
+    async def download_async(
+        self,
+        output_path: Optional[str] = None,
+        filename: Optional[str] = None,
+        filename_prefix: Optional[str] = None,
+        skip_existing: bool = True,
+        timeout: Optional[int] = None,
+        max_retries: int = 0,
+        interrupt_checker: Optional[Callable[[], bool]] = None,
+        max_bandwidth: Optional[int] = None
+    ) -> Optional[str]:
+        """
+        Asynchronous version of :meth:`download`.
+
+        The stream is read with `pytubefix.async_request`, so a single event loop can run many downloads at once.
+
+        Args:
+            output_path (Optional[str]): Directory path where the downloaded file will be saved. Defaults to the current directory if not specified.
+            filename (Optional[str]): Custom name for the downloaded file. If not provided, a default name is used.
+            filename_prefix (Optional[str]): Prefix to be added to the filename (if provided).
+            skip_existing (bool): Whether to skip the download if the file already exists at the target location. Defaults to True.
+            timeout (Optional[int]): Maximum time, in seconds, to wait for each network operation. Defaults to None for no timeout.
+            max_retries (int): The number of times to retry the download if it fails. Defaults to 0 (no retries).
+            interrupt_checker (Optional[Callable[[], bool]]): A callable function that is checked periodically during the download. If it returns True, the download will stop without errors.
+            max_bandwidth (Optional[int]): Maximum bytes per second read by this download, on top of the process-wide limit of `pytubefix.throttle`. Defaults to None for no limit.
+
+        Returns:
+            Optional[str]: The full file path of the downloaded file, or None if the download was interrupted.
+
+        Note:
+            - OTF and SABR streams have no asynchronous transport, they are downloaded by :meth:`download` in a worker thread.
+        """
+        if self.is_sabr or self.is_otf:
+            return await asyncio.to_thread(
+                self.download,
+                output_path=output_path,
+                filename=filename,
+                filename_prefix=filename_prefix,
+                skip_existing=skip_existing,
+                timeout=timeout,
+                max_retries=max_retries,
+                interrupt_checker=interrupt_checker,
+                max_bandwidth=max_bandwidth
+            )
+
+        file_path = self._download_path(output_path, filename, filename_prefix)
+
+        if skip_existing and self.exists_at_path(file_path):
+            logger.debug(f'file {file_path} already exists, skipping')
+            self.on_complete(file_path)
+            return file_path
+
+        if self._filesize == 0:
+            try:
+                self._filesize = await async_request.filesize(self.url)
+            except HTTPError as e:
+                if e.code != 404:
+                    raise
+                self._filesize = await asyncio.to_thread(request.seq_filesize, self.url)
+        bytes_remaining = self.filesize
+        logger.debug(f'downloading ({self.filesize} total bytes) file to {file_path}')
+
+        limiter = throttle.TokenBucket(max_bandwidth) if max_bandwidth else None
+        with open(file_path, "wb") as fh:
+            chunks = async_request.stream(
+                self.url,
+                timeout=timeout,
+                max_retries=max_retries,
+                file_size=self.filesize,
+                buffer=bytearray(request.default_buffer_size),
+                limiter=limiter
+            )
+            try:
+                async for chunk in chunks:
+                    if interrupt_checker is not None and interrupt_checker() == True:
+                        logger.debug('interrupt_checker returned True, causing to force stop the downloading')
+                        return
+                    # reduce the (bytes) remainder by the length of the chunk.
+                    bytes_remaining -= len(chunk)
+                    self.on_progress(chunk, fh, bytes_remaining)
+            except HTTPError as e:
+                if e.code != 404:
+                    raise
+                # Some adaptive streams need to be requested with sequence numbers,
+                # start over with the sequential transport, like download() does
+                logger.debug('stream not found by range, requesting it by sequence numbers')
+                fh.seek(0)
+                fh.truncate()
+                completed = await asyncio.to_thread(
+                    self._download_sequence, fh, timeout, max_retries, interrupt_checker, limiter
+                )
+                if not completed:
+                    logger.debug('interrupt_checker returned True, causing to force stop the downloading')
+                    return
+            finally:
+                await chunks.aclose()
+
+        self.on_complete(file_path)
+        return file_path
+
+    def _download_sequence(
+        self,
+        file_handler: BinaryIO,
+        timeout: Optional[int] = None,
+        max_retries: int = 0,
+        interrupt_checker: Optional[Callable[[], bool]] = None,
+        limiter: Optional[throttle.TokenBucket] = None
+    ) -> bool:
+        """Download the stream by sequence numbers, see :func:`request.seq_stream`.
+
+        :rtype: bool
+        :returns: False if the download was interrupted by ``interrupt_checker``.
+        """
+        bytes_remaining = self.filesize
+        for chunk in request.seq_stream(
+            self.url,
+            timeout=timeout,
+            max_retries=max_retries,
+            limiter=limiter
+        ):
+            if interrupt_checker is not None and interrupt_checker() == True:
+                return False
+            # reduce the (bytes) remainder by the length of the chunk.
+            bytes_remaining -= len(chunk)
+            self.on_progress(chunk, file_handler, bytes_remaining)
+        return True
+
+    def _download_path(
+        self,
+        output_path: Optional[str] = None,
+        filename: Optional[str] = None,
+        filename_prefix: Optional[str] = None
+    ) -> str:
+        """Get the path to download the stream to, with a filename valid on this system."""
+        kernel = sys.platform
+
+        if kernel == "linux":
+            file_system = "ext4"
+        elif kernel == "darwin":
+            file_system = "APFS"
+        else:
+            file_system = "NTFS"
+
+        translation_table = file_system_verify(file_system)
+
+        if filename is None:
+            filename = self.default_filename.translate(translation_table)
+
+        if filename:
+            filename = filename.translate(translation_table)
+
+        return self.get_file_path(
+            filename=filename,
+            output_path=output_path,
+            filename_prefix=filename_prefix,
+            file_system=file_system
+        )
+
+    def _download_segments(
+        self,
+        file_handler: BinaryIO,
+        workers: int,
+        segment_size: Optional[int] = None,
+        timeout: Optional[int] = None,
+        max_retries: int = 0,
+        interrupt_checker: Optional[Callable[[], bool]] = None,
+        journal: Optional[DownloadJournal] = None,
+        limiter: Optional[throttle.TokenBucket] = None
+    ) -> bool:
+        """Download the stream as several byte ranges fetched concurrently.
+
+        The file is preallocated and every range is written at its own offset,
+        so the ranges can complete in any order. The `on_progress` callback is
+        still called for every chunk, with the aggregate amount of bytes
+        remaining.
+
+        :param file_handler:
+            The file handle where the media is being written to.
+        :param int workers:
+            Number of ranges downloaded at the same time.
+        :param int segment_size:
+            Size in bytes of each range. Defaults to an even split between the workers.
+        :param DownloadJournal journal:
+            (Optional) Journal of the ranges already downloaded. Only the missing
+            ranges are requested, and the journal is kept up to date.
+        :param TokenBucket limiter:
+            (Optional) Bandwidth limit shared by all the ranges of the download.
+        :rtype: bool
+        :returns:
+            False if the download was stopped by the interrupt checker, True otherwise.
+        """
+        file_size = self.filesize
+        if journal is None:
+            journal = DownloadJournal(file_handler.name, file_size, self._journal_identity())
+        missing = journal.missing()
+        if not segment_size or segment_size <= 0:
+            segment_size = max(ceil(sum(stop + 1 - start for start, stop in missing) / workers), 1)
+
+        segments = [
+            (start, min(start + segment_size - 1, stop))
+            for first, stop in missing
+            for start in range(first, stop + 1, segment_size)
+        ]
+        file_handler.truncate(file_size)
+        journal.save(force=True)
+
+        lock = threading.Lock()
+        interrupted = threading.Event()
+        bytes_remaining = file_size - journal.completed
+
+        def fetch(segment):
+            nonlocal bytes_remaining
+            offset, stop = segment
+            for chunk in request.range_stream(
+                self.url,
+                offset,
+                stop,
+                timeout=timeout,
+                max_retries=max_retries,
+                buffer=bytearray(request.default_buffer_size),
+                limiter=limiter
+            ):
+                if interrupted.is_set():
+                    return
+                with lock:
+                    if interrupt_checker is not None and interrupt_checker() == True:
+                        interrupted.set()
+                        return
+                    file_handler.seek(offset)
+                    bytes_remaining -= len(chunk)
+                    self.on_progress(chunk, file_handler, bytes_remaining)
+                    journal.add(offset, len(chunk))
+                    if journal.save_due:
+                        # The journal must never claim bytes still in the write buffer
+                        file_handler.flush()
+                        journal.save(force=True)
+                offset += len(chunk)
+
+        try:
+            with ThreadPoolExecutor(max_workers=min(workers, len(segments)) or 1) as executor:
+                futures = [executor.submit(fetch, segment) for segment in segments]
+                try:
+                    for future in as_completed(futures):
+                        future.result()
+                except BaseException:
+                    interrupted.set()
+                    for future in futures:
+                        future.cancel()
+                    raise
+        finally:
+            file_handler.flush()
+            journal.save(force=True)
+
+        return not interrupted.is_set()
+
+    def _journal_identity(self) -> Dict:
+        """Data identifying this stream in a download journal."""
+        youtube = self._monostate.youtube
+        return {
+            "video_id": youtube.video_id if youtube is not None else None,
+            "itag": self.itag,
+            "audio_track": self.audio_track_language_id_regionalized,
+        }
+
+    def _refresh_if_expired(self) -> None:
+        """Refresh the signed url if it expired, or is about to."""
+        try:
+            expiration = self.expiration
+        except (KeyError, IndexError, ValueError):
+            return
+        if expiration <= datetime.now(timezone.utc) + timedelta(minutes=1):
+            logger.debug(f'stream url expired on {expiration}, refreshing it')
+            self.refresh_url()
+
+    def refresh_url(self) -> None:
+        """Replace the signed url of the stream with a fresh one.
+
+        Signed urls stop working after :attr:`expiration`. The video info is
+        fetched again to get a new url for the same format.
+
+        :raises StreamRefreshError:
+            If the stream is not linked to a video or the format is gone.
+        """
+        youtube = self._monostate.youtube
+        if youtube is None:
+            raise StreamRefreshError(f'stream {self.itag} is not linked to a YouTube object')
+
+        # The cached response holds the same urls
+        response_cache.invalidate(youtube.video_id)
+        youtube.vid_info = None
+        youtube._fmt_streams = None
+        for stream in youtube.streams:
+            if (
+                stream.itag == self.itag
+                and stream.audio_track_language_id_regionalized == self.audio_track_language_id_regionalized
+            ):
+                self.url = stream.url
+                return
+        raise StreamRefreshError(f'stream {self.itag} is not available anymore')
+
     def get_file_path(
         self,
         filename: Optional[str] = None,
@@ -457,26 +799,105 @@ class Stream:
         return str(Path(target_directory(output_path)) / filename)
 
     def exists_at_path(self, file_path: str) -> bool:
+        # A preallocated file has the right size before being complete
         return (
             os.path.isfile(file_path)
             and os.path.getsize(file_path) == self.filesize
+            and not DownloadJournal.journal_exists(file_path)
         )
 
-    def stream_to_buffer(self, buffer: BinaryIO) -> None:
+    def stream_to_buffer(
+        self,
+        buffer: BinaryIO,
+        timeout: Optional[int] = None,
+        max_retries: int = 0,
+        max_bandwidth: Optional[int] = None
+    ) -> None:
         """Write the media stream to buffer
 
-        :rtype: io.BytesIO buffer
+        As with :meth:`download`, an expired url is refreshed and streams
+        that need sequence numbers are read with them. A buffer cannot be
+        rewound, so after a refresh the stream continues from the bytes
+        already written.
+
+        :param buffer:
+            Writable binary object, such as a :class:`io.BytesIO` or a pipe.
+        :param int timeout:
+            (Optional) Maximum time, in seconds, to wait for each request.
+        :param int max_retries:
+            (Optional) Number of times a failed request is retried.
+        :param int max_bandwidth:
+            (Optional) Maximum bytes per second read by this download.
+        :rtype: None
         """
         bytes_remaining = self.filesize
         logger.info(
             "downloading (%s total bytes) file to buffer", self.filesize,
         )
 
-        for chunk in request.stream(self.url):
-            # reduce the (bytes) remainder by the length of the chunk.
-            bytes_remaining -= len(chunk)
+        def write_chunk(chunk_, bytes_remaining_):
             # send to the on_progress callback.
-            self.on_progress(chunk, buffer, bytes_remaining)
+            self.on_progress(chunk_, buffer, bytes_remaining_)
+
+        limiter = throttle.TokenBucket(max_bandwidth) if max_bandwidth else None
+
+        if self.is_sabr:
+            logger.debug('This stream is SABR. Starting ServerAbrStream')
+            ServerAbrStream(
+                stream=self, write_chunk=write_chunk, monostate=self._monostate, limiter=limiter
+            ).start()
+            self.on_complete(None)
+            return
+
+        self._refresh_if_expired()
+        refreshed = False
+        while True:
+            written = self.filesize - bytes_remaining
+            try:
+                if not written:
+                    chunks = request.stream(
+                        self.url,
+                        timeout=timeout,
+                        max_retries=max_retries,
+                        file_size=self.filesize,
+                        buffer=bytearray(request.default_buffer_size),
+                        limiter=limiter
+                    )
+                else:
+                    chunks = request.range_stream(
+                        self.url,
+                        written,
+                        self.filesize - 1,
+                        timeout=timeout,
+                        max_retries=max_retries,
+                        buffer=bytearray(request.default_buffer_size),
+                        limiter=limiter
+                    )
+                for chunk in chunks:
+                    # reduce the (bytes) remainder by the length of the chunk.
+                    bytes_remaining -= len(chunk)
+                    write_chunk(chunk, bytes_remaining)
+                break
+            except HTTPError as e:
+                if e.code == 403 and not refreshed:
+                    # Signed urls are rejected once expired, get a new one and go on.
+                    logger.debug('stream url rejected, refreshing it before resuming')
+                    self.refresh_url()
+                    refreshed = True
+                    continue
+                if e.code != 404 or bytes_remaining != self.filesize:
+                    raise
+
+            # Some adaptive streams need to be requested with sequence numbers
+            for chunk in request.seq_stream(
+                self.url,
+                timeout=timeout,
+                max_retries=max_retries,
+                limiter=limiter
+            ):
+                bytes_remaining -= len(chunk)
+                write_chunk(chunk, bytes_remaining)
+            break
         self.on_complete(None)
 
     def on_progress(
@@ -489,7 +910,8 @@ class Stream:
         allow things like displaying a progress bar.
 
         :param bytes chunk:
-            Segment of media file binary data, not yet written to disk.
+            Segment of media file binary data, not yet written to disk. It can
+            be a view of a reused read buffer, only valid during the call.
         :param file_handler:
             The file handle where the media is being written to.
         :type file_handler:
@@ -595,7 +1017,7 @@ class Stream:
             self.filesize,
         )
         try:
-            stream = request.stream(self.url)
+            stream = request.stream(self.url, file_size=self.filesize)
         except HTTPError as e:
             if e.code != 404:
                 raise
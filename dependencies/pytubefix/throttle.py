@@ -0,0 +1,112 @@
+"""This module implements the token buckets limiting the bandwidth and request rate.
+
+Every byte read from a media response goes through the process-wide
+``bandwidth`` bucket, and through the bucket of its download if it has one.
+InnerTube API calls go through the ``innertube_requests`` bucket. All the
+buckets are disabled by default, see :func:`configure`.
+"""
+import asyncio
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """Allow ``rate`` tokens per second, with bursts of up to ``capacity`` tokens.
+
+    Consumers may take more tokens than available: the bucket goes into debt
+    and every consumer waits until it is paid back, so the average rate is
+    respected whatever the size of the reads. It is shared between threads.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """Construct a :class:`TokenBucket <TokenBucket>`.
+
+        :param float rate:
+            Tokens added to the bucket every second.
+        :param float capacity:
+            (Optional) Maximum amount of tokens saved while idle. Defaults to
+            one second worth of tokens.
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, amount: float) -> float:
+        """Take tokens from the bucket.
+
+        :param float amount:
+            Number of tokens to take.
+        :rtype: float
+        :returns:
+            Seconds to wait before using them.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= amount
+            return max(0.0, -self._tokens / self.rate)
+
+    def __repr__(self) -> str:
+        return f"<TokenBucket: {self.rate}/s>"
+
+
+# Process-wide limits, see configure().
+bandwidth: Optional[TokenBucket] = None
+innertube_requests: Optional[TokenBucket] = None
+
+
+def configure(max_bandwidth: Optional[int] = None, max_innertube_requests: Optional[float] = None):
+    """Set the process-wide limits.
+
+    :param int max_bandwidth:
+        Maximum bytes per second read by all the downloads together. None or 0
+        removes the limit.
+    :param float max_innertube_requests:
+        Maximum InnerTube API calls per second. None or 0 removes the limit.
+    """
+    global bandwidth, innertube_requests
+    bandwidth = TokenBucket(max_bandwidth) if max_bandwidth else None
+    innertube_requests = TokenBucket(max_innertube_requests, capacity=1) if max_innertube_requests else None
+
+
+def _delay(buckets, amount) -> float:
+    # Every bucket is charged, the slowest one sets the pace
+    return max((bucket.reserve(amount) for bucket in buckets if bucket is not None), default=0.0)
+
+
+def consume(amount: int, limiter: Optional[TokenBucket] = None):
+    """Wait until ``amount`` bytes can be read.
+
+    :param int amount:
+        Number of bytes read.
+    :param TokenBucket limiter:
+        (Optional) Bucket of the download the bytes belong to.
+    """
+    delay = _delay((bandwidth, limiter), amount)
+    if delay:
+        time.sleep(delay)
+
+
+async def consume_async(amount: int, limiter: Optional[TokenBucket] = None):
+    """Asynchronous version of :func:`consume`."""
+    delay = _delay((bandwidth, limiter), amount)
+    if delay:
+        await asyncio.sleep(delay)
+
+
+def innertube_call():
+    """Wait until an InnerTube API call can be made."""
+    delay = _delay((innertube_requests,), 1)
+    if delay:
+        time.sleep(delay)
+
+
+async def innertube_call_async():
+    """Asynchronous version of :func:`innertube_call`."""
+    delay = _delay((innertube_requests,), 1)
+    if delay:
+        await asyncio.sleep(delay)
@@ -38,11 +38,41 @@ def main () -> None:
     config.load_config_file()
     app_config = config.get_config_data()
     range_size_bytes = app_config.get("pytube_range_size_bytes", 1024 * 1024)
+    adaptive_range_size = app_config.get("pytube_adaptive_range_size", True)
+    pool_size = app_config.get("pytube_pool_size", 10)
+    pool_idle_timeout = app_config.get("pytube_pool_idle_timeout", 60)
+    pool_max_connections = app_config.get("pytube_pool_max_connections_per_host", 8)
+    segment_workers = app_config.get("pytube_segment_workers", 4)
+    max_bandwidth = app_config.get("pytube_max_bandwidth_bytes", 0)
+    max_innertube_requests = app_config.get("pytube_max_innertube_requests_per_second", 0)
+    use_http2 = app_config.get("pytube_http2", False)
+    persistent_response_cache = app_config.get("pytube_persistent_response_cache", True)
+    racing_clients = app_config.get("pytube_racing_fallback_clients", 0)
     default_download_option = app_config.get("default_download_option_number", 1)
     default_download_option = default_download_option if default_download_option > 0 and default_download_option <= 4 else 1
 
     ffmpeg_installed = ffmpeg.check_installation()
     pytubefix.request.default_range_size = range_size_bytes if range_size_bytes > 0 else 1024 * 1024
+    pytubefix.request.adaptive_range_size = adaptive_range_size
+    pytubefix.request.use_http2 = use_http2
+
+    if use_http2 and not pytubefix.http2.available():
+        print("Warning: \"pytube_http2\" is enabled but the h2 package is not installed (pip install h2)! HTTP/1.1 will be used instead.")
+
+    pytubefix.YouTube.racing_clients = racing_clients if racing_clients >= 0 and racing_clients <= 2 else 0
+    pytubefix.request.default_segment_workers = segment_workers if segment_workers >= 1 and segment_workers <= 32 else 4
+    pytubefix.throttle.configure(
+        max_bandwidth = max_bandwidth if max_bandwidth >= 0 else 0,
+        max_innertube_requests = max_innertube_requests if max_innertube_requests >= 0 else 0
+    )
+    pytubefix.response_cache.configure(
+        database = pytubefix.response_cache.default_database if persistent_response_cache else None
+    )
+    pytubefix.request.configure_pool(
+        pool_size = pool_size if pool_size > 0 else 10,
+        idle_timeout = pool_idle_timeout if pool_idle_timeout >= 0 else 60,
+        max_connections_per_host = pool_max_connections if pool_max_connections > 0 else 8
+    )
     source_type = "video"
     system = platform.system()
     url = None
@@ -62,7 +92,8 @@ def main () -> None:
                 youtube_source = pytubefix.YouTube(url)
                 source_type = "video"
             except:
-                youtube_source = pytubefix.Playlist(url)
+                # The videos of a playlist only need what the player request returns.
+                youtube_source = pytubefix.Playlist(url, video_fields = ("title", "streams", "thumbnail_url", "captions"))
                 source_type = "playlist"
 
         if source_type == "video":
@@ -2,8 +2,6 @@ import config
 import helpers
 import os
 import pytubefix
-import shutil
-import subprocess
 import typing
 
 def download_audio (
@@ -18,7 +16,7 @@ def download_audio (
         2) Get the audio stream with the highest bitrate.
         3) Download the stream.
         4) Convert to mp3 if necessary.
-        5) Move the file to the destination folder if necessary.
+        5) Move the file from the job workspace to the destination folder.
 
     Parameters:
         - youtube_video    / YouTube    / Targeted YouTube video.
@@ -51,15 +49,22 @@ def download_audio (
 
     youtube_video.register_on_progress_callback(helpers.download_progress) # Get the download progress data.
     file_extension = audio_stream.mime_type.split("/")[-1]
-    helpers.download_stream(audio_stream, f"{sanitized_title}.{file_extension}")
 
-    if file_extension != "mp3" and auto_mp3_conversion:
-        print(end = "\n\n") # UI format.
-        subprocess.run([ffmpeg, "-y", "-i", f"{sanitized_title}.{file_extension}", "-ar", "44100", "-ac", "2", "-b:a", "192k",  f"{sanitized_title}.mp3"], check = True)
-        helpers.remove_if_exists(f"{sanitized_title}.{file_extension}") # Delete the original file.
-        file_extension = "mp3"
+    output_extension = "mp3" if auto_mp3_conversion else file_extension
 
-    if destination_path != app_directory_path:
-        shutil.move(f"{sanitized_title}.{file_extension}", destination_path)
+    # Every file of the download stays in its own workspace, so several downloads can run at once and a failed one can be resumed.
+    with helpers.job_workspace(destination_path, f"{youtube_video.video_id}-{audio_stream.itag}-{output_extension}") as workspace:
+        helpers.reset_streams_progress([audio_stream])
 
-    print(f"\nDownload finished: \"{destination_path}/{sanitized_title}.{file_extension}\"")
+        with helpers.transfer_slots:
+            workspace_file = helpers.download_stream(audio_stream, workspace, f"{sanitized_title}.{file_extension}")
+
+        if file_extension != "mp3" and auto_mp3_conversion:
+            print(end = "\n\n") # UI format.
+            mp3_file = os.path.join(workspace, f"{sanitized_title}.mp3")
+            helpers.run_ffmpeg([ffmpeg, "-y", "-i", workspace_file, "-ar", "44100", "-ac", "2", "-b:a", "192k", mp3_file])
+            workspace_file = mp3_file # The original file is deleted with the workspace.
+
+        output_path = helpers.publish_file(workspace_file, destination_path)
+
+    print(f"\nDownload finished: \"{output_path}\"")
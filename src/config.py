@@ -8,12 +8,31 @@ config = {
     "max_download_retries": 10,
     "retry_cooldown": 3,
     "pytube_range_size_bytes": 1048576,  # 1 MB (1024 KB * 1024 KB).
+    "pytube_adaptive_range_size": True,
+    "pytube_pool_size": 10,
+    "pytube_pool_idle_timeout": 60,
+    "pytube_pool_max_connections_per_host": 8,
+    "pytube_segment_workers": 4,
+    "pytube_max_bandwidth_bytes": 0, # Unlimited.
+    "pytube_max_innertube_requests_per_second": 0, # Unlimited.
+    "pytube_http2": False, # Requires the h2 package (pip install h2).
+    "pytube_persistent_response_cache": True,
+    "pytube_racing_fallback_clients": 0,
+    "playlist_metadata_workers": 4,
+    "max_parallel_downloads": 1,
+    "max_parallel_conversions": 2,
+    "download_workers": 4,
+    "download_segment_size_bytes": 10485760, # 10 MB.
+    "download_max_bandwidth_bytes": 0, # Unlimited.
+    "resume_downloads": True,
     "download_bars_length": 20,
     "default_download_option_number": 1, # Full video download option.
     "default_download_destination": "./",
     "default_download_resolution": "1080p",
     "default_subtitle_lang": "a.en",     # English (auto generated).
     "block_age_restricted_content": True,
+    "pipe_muxing": True,
+    "allow_webm_mkv_output": True,
     "auto_mp3_conversion": True
 }
 
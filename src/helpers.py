@@ -1,9 +1,284 @@
 import config
+import contextlib
 import os
 import platform
 import pytubefix
 import re
+import shutil
+import subprocess
+import sys
+import threading
 import time
+import typing
+
+from concurrent.futures import ThreadPoolExecutor
+
+# Bytes remaining of each stream downloaded by download_streams(), used to display a combined progress.
+streams_progress = {}
+# Streams of the same download, and dashboard line of the download, by stream.
+streams_downloads = {}
+streams_rows = {}
+streams_progress_lock = threading.Lock()
+
+# Amount of downloads transferring data and of FFmpeg processes running at once, see configure_parallelism().
+transfer_slots = threading.BoundedSemaphore(1)
+conversion_slots = threading.BoundedSemaphore(1)
+
+# Lock of each job workspace, by path, see job_workspace().
+workspace_locks = {}
+workspace_locks_lock = threading.Lock()
+
+# Dashboard displayed while several downloads run at once, see start_dashboard().
+dashboard = None
+job_status = threading.local()
+
+
+class Dashboard:
+    """
+    Multi-line display of the downloads running at once, used as the standard output.
+
+    Each thread running a download (see start_job()) writes in its own line instead of printing a new one.
+    The output of the other threads is printed above the lines.
+    Everything else (isatty(), encoding, fileno()..) is forwarded to the real output, as callers expect from sys.stdout.
+    """
+
+    def __init__ (
+        self,
+        output: typing.TextIO
+    ) -> None:
+        """
+        Make an empty dashboard.
+
+        Tasks:
+            1) Keep the real output the lines are written to.
+            2) Start without any line.
+
+        Parameters:
+            - output / TextIO / Real standard output.
+
+        Returns:
+            No object returned.
+        """
+
+        self.output = output
+        self.labels = {}
+        self.rows = {}
+        self.lines_drawn = 0
+        self.last_draw = 0.0
+        self.pending = ""
+        self.lock = threading.RLock()
+
+    def __getattr__ (
+        self,
+        name: str
+    ) -> typing.Any:
+        """
+        Get the attributes the dashboard doesn't have from the real output.
+
+        Tasks:
+            1) Forward the attribute lookup to the real output.
+
+        Parameters:
+            - name / str / Name of the attribute.
+
+        Returns:
+            The attribute of the real output.
+        """
+
+        return getattr(self.output, name)
+
+    @property
+    def encoding (self) -> str:
+        """
+        Get the encoding of the real output.
+
+        Tasks:
+            1) Forward the encoding of the real output.
+
+        Parameters:
+            No parameters.
+
+        Returns:
+            The name of the encoding.
+        """
+
+        return self.output.encoding
+
+    def isatty (self) -> bool:
+        """
+        Check if the real output is a terminal.
+
+        Tasks:
+            1) Forward the check to the real output.
+
+        Parameters:
+            No parameters.
+
+        Returns:
+            True if the real output is a terminal.
+            False if not.
+        """
+
+        return self.output.isatty()
+
+    def write (
+        self,
+        text: str
+    ) -> int:
+        """
+        Write a text, in the line of the current download or above the lines.
+
+        Tasks:
+            1) Replace the line of the current download with the last line of the text.
+            2) Otherwise, print the complete lines of the text above the dashboard, then draw it again.
+
+        Parameters:
+            - text / str / Text to write.
+
+        Returns:
+            The number of characters written.
+        """
+
+        row = getattr(job_status, "row", None)
+
+        with self.lock:
+            if row is not None and row in self.rows:
+                # Only the last message of a download is displayed.
+                lines = [line.strip() for line in re.split(r"[\r\n]", text) if line.strip()]
+
+                if lines:
+                    self.set_row(row, lines[-1])
+            else:
+                # Complete lines only, a partial one would be followed by the dashboard.
+                self.pending += text
+
+                if "\n" in self.pending:
+                    lines, self.pending = self.pending.rsplit("\n", 1)
+                    self.output.write(self.erase() + lines + "\n")
+                    self.lines_drawn = 0
+                    self.draw()
+
+        return len(text)
+
+    def flush (self) -> None:
+        """
+        Flush the real output.
+
+        Tasks:
+            1) Forward the flush to the real output.
+
+        Parameters:
+            No parameters.
+
+        Returns:
+            No object returned.
+        """
+
+        self.output.flush()
+
+    def set_row (
+        self,
+        row:   int,
+        text:  str,
+        label: typing.Optional[str] = None
+    ) -> None:
+        """
+        Add or update the line of a download.
+
+        Tasks:
+            1) Ignore the update of a line already removed.
+            2) Save the text (and the label) of the line.
+            3) Draw the dashboard again if the line is new, or if it wasn't drawn recently.
+
+        Parameters:
+            - row   / int        / Identifier of the line.
+            - text  / str        / Text of the line.
+            - label / str | None / Text displayed before the text of the line. If None, the line must already exist.
+
+        Returns:
+            No object returned.
+        """
+
+        with self.lock:
+            if label is None and row not in self.rows:
+                return # Late progress of a download already removed.
+
+            changed = row not in self.rows or label is not None
+
+            if label is not None:
+                self.labels[row] = label
+
+            self.rows[row] = text
+
+            # Download progress changes very often, the lines are redrawn 10 times per second at most.
+            if changed or time.monotonic() - self.last_draw >= 0.1:
+                self.draw()
+
+    def remove_row (
+        self,
+        row: int
+    ) -> str:
+        """
+        Remove the line of a download.
+
+        Tasks:
+            1) Forget the line and its label.
+            2) Draw the dashboard again.
+
+        Parameters:
+            - row / int / Identifier of the line.
+
+        Returns:
+            The last text of the line.
+        """
+
+        with self.lock:
+            self.labels.pop(row, None)
+            text = self.rows.pop(row, "")
+            self.draw()
+
+            return text
+
+    def erase (self) -> str:
+        """
+        Get the escape sequence erasing the lines drawn.
+
+        Tasks:
+            1) Move the cursor up to the first line drawn and clear everything below it.
+
+        Parameters:
+            No parameters.
+
+        Returns:
+            The escape sequence, empty if no line is drawn.
+        """
+
+        return f"\033[{self.lines_drawn}F\033[J" if self.lines_drawn else ""
+
+    def draw (self) -> None:
+        """
+        Draw the lines of the downloads again.
+
+        Tasks:
+            1) Erase the lines drawn.
+            2) Write every line, cut to the width of the terminal.
+
+        Parameters:
+            No parameters.
+
+        Returns:
+            No object returned.
+        """
+
+        with self.lock:
+            width = max(shutil.get_terminal_size().columns - 1, 20)
+            lines = [f"{self.labels.get(row, '')} {text}".strip()[:width] for row, text in self.rows.items()]
+
+            self.output.write(self.erase() + "".join(line + "\n" for line in lines))
+            self.output.flush()
+            self.lines_drawn = len(lines)
+            self.last_draw = time.monotonic()
+
 
 def folder_input() -> str:
     """
@@ -58,6 +333,72 @@ def remove_if_exists (
         os.remove(file_path)
 
 
+@contextlib.contextmanager
+def job_workspace (
+    destination_path: str,
+    job_key:          str
+) -> typing.Iterator[str]:
+    """
+    Give a download its own folder, next to its destination.
+
+    Tasks:
+        1) Wait for any other job using the same folder (same video twice in a playlist).
+        2) Create (or reuse) the hidden folder of the job in the destination folder.
+        3) Let the download write its files in it.
+        4) Remove the folder and everything left in it once the download succeeded, or tell where it is kept.
+
+    Parameters:
+        - destination_path / str / Targeted directory for the download.
+        - job_key          / str / Name of the job, the same for every attempt of the same download (video id, streams, options).
+
+    Returns:
+        The path of the job folder (used with the "with" statement).
+    """
+
+    # Being on the same filesystem as the destination makes publish_file() a rename.
+    workspace = os.path.join(destination_path, f".youtube-downloader-{job_key}")
+
+    with workspace_locks_lock:
+        workspace_lock = workspace_locks.setdefault(workspace, threading.Lock())
+
+    # Two jobs sharing the files and journals would overwrite each other's data, they take turns.
+    with workspace_lock:
+        os.makedirs(workspace, exist_ok = True)
+
+        try:
+            yield workspace
+        except BaseException:
+            # A failed or cancelled download keeps its partial files and their journals, the next attempt resumes them.
+            print(f"\nThe unfinished files of the download are kept in \"{workspace}\" to resume it later, delete this folder to discard them.")
+            raise
+
+        shutil.rmtree(workspace, ignore_errors = True)
+
+
+def publish_file (
+    file_path:        str,
+    destination_path: str
+) -> str:
+    """
+    Move a finished file from a job workspace to its destination.
+
+    Tasks:
+        1) Rename the file into the destination folder, replacing any previous file of that name.
+
+    Parameters:
+        - file_path        / str / Path of the finished file in the workspace.
+        - destination_path / str / Targeted directory for the download.
+
+    Returns:
+        The path of the file in the destination folder.
+    """
+
+    output_path = os.path.join(destination_path, os.path.basename(file_path))
+    os.replace(file_path, output_path) # Atomic, the file is never seen half written.
+
+    return output_path
+
+
 def remove_invalid_characters (
     input_string: str
 ) -> str:
@@ -82,23 +423,25 @@ def remove_invalid_characters (
 
 
 def download_stream (
-    stream:    pytubefix.Stream,
-    file_name: str
-) -> None:
+    stream:      pytubefix.Stream,
+    output_path: str,
+    file_name:   str
+) -> str:
     """
     Download a YouTube stream with an attempts system.
 
     Tasks:
         1) Verify the configuration values.
-        2) Try to download the stream.
-        3) Cooldown and retry on failure.
+        2) Try to download the stream (split in segments downloaded concurrently).
+        3) Cooldown and retry on failure, resuming from the already downloaded segments.
 
     Parameters:
-        - stream    / Stream / Targeted stream to download.
-        - file_name / str    / Name of the output file.
+        - stream      / Stream / Targeted stream to download.
+        - output_path / str    / Directory of the output file.
+        - file_name   / str    / Name of the output file (without directory, pytubefix removes the path separators).
 
     Returns:
-        No object returned.
+        The path of the downloaded file.
     """
 
     app_config = config.get_config_data()
@@ -107,11 +450,24 @@ def download_stream (
     max_retries = max_retries if max_retries >= 1 and max_retries <= 100 else 10
     retry_cooldown = app_config.get("retry_cooldown", 3)
     retry_cooldown = retry_cooldown if retry_cooldown >= 0 and retry_cooldown <= 60 else 3
+    workers = app_config.get("download_workers", 4)
+    workers = workers if workers >= 1 and workers <= 32 else 4
+    segment_size = app_config.get("download_segment_size_bytes", 10485760)
+    segment_size = segment_size if segment_size > 0 else 10485760
+    resume = app_config.get("resume_downloads", True)
+    max_bandwidth = app_config.get("download_max_bandwidth_bytes", 0)
+    max_bandwidth = max_bandwidth if max_bandwidth >= 0 else 0
 
     for i in range(max_retries):
         try:
-            stream.download(filename = file_name)
-            return
+            return stream.download(
+                output_path = output_path,
+                filename = file_name,
+                workers = workers,
+                segment_size = segment_size,
+                resume = resume,
+                max_bandwidth = max_bandwidth
+            )
         except Exception as error:
             print(f"\nDownload attempt {i + 1}/{max_retries} failed with error {error}!", end = "\n\n")
             time.sleep(retry_cooldown)
@@ -119,6 +475,119 @@ def download_stream (
     raise ValueError(f"Download failed! Too many failures ({max_retries}/{max_retries}).")
 
 
+def download_streams (
+    downloads:   list,
+    output_path: str
+) -> list:
+    """
+    Download several YouTube streams concurrently.
+
+    Tasks:
+        1) Reset the combined progress of the streams.
+        2) Download every stream in its own thread (each with the attempts system).
+        3) Wait for all the downloads and raise the first failure.
+
+    Parameters:
+        - downloads   / list / Tuples of the stream to download and the name of its output file.
+        - output_path / str  / Directory of the output files.
+
+    Returns:
+        The paths of the downloaded files, in the order of the downloads.
+    """
+
+    reset_streams_progress([stream for stream, _ in downloads])
+
+    with ThreadPoolExecutor(max_workers = len(downloads)) as executor:
+        futures = [executor.submit(download_stream, stream, output_path, file_name) for stream, file_name in downloads]
+
+        return [future.result() for future in futures]
+
+
+def reset_streams_progress (
+    streams: list
+) -> None:
+    """
+    Start a new combined progress for download_streams_progress().
+
+    Tasks:
+        1) Forget the streams of the downloads already finished.
+        2) Register the new streams with all their bytes remaining, and the dashboard line of the current download.
+
+    Parameters:
+        - streams / list / Streams about to be downloaded.
+
+    Returns:
+        No object returned.
+    """
+
+    row = getattr(job_status, "row", None)
+
+    with streams_progress_lock:
+        finished = [stream for stream, downloads in streams_downloads.items() if all(streams_progress.get(download) == 0 for download in downloads)]
+
+        for stream in finished + streams:
+            streams_progress.pop(stream, None)
+            streams_downloads.pop(stream, None)
+            streams_rows.pop(stream, None)
+
+        for stream in streams:
+            streams_progress[stream] = stream.filesize
+            streams_downloads[stream] = streams
+            streams_rows[stream] = row
+
+
+def stream_to_pipe (
+    stream:    pytubefix.Stream,
+    pipe_path: str
+) -> None:
+    """
+    Download a YouTube stream into a named pipe.
+
+    Tasks:
+        1) Verify the configuration values.
+        2) Open the pipe (waits for its reader).
+        3) Write the stream into it, in order (retrying failed requests and refreshing an expired link).
+
+    Parameters:
+        - stream    / Stream / Targeted stream to download.
+        - pipe_path / str    / Path of the named pipe.
+
+    Returns:
+        No object returned.
+    """
+
+    app_config = config.get_config_data()
+    max_retries = app_config.get("max_download_retries", 10)
+    max_retries = max_retries if max_retries >= 1 and max_retries <= 100 else 10
+    max_bandwidth = app_config.get("download_max_bandwidth_bytes", 0)
+    max_bandwidth = max_bandwidth if max_bandwidth >= 0 else 0
+
+    with open(pipe_path, "wb") as pipe:
+        stream.stream_to_buffer(pipe, max_retries = max_retries, max_bandwidth = max_bandwidth)
+
+
+def release_pipe (
+    pipe_path: str
+) -> None:
+    """
+    Unblock a writer waiting for the reader of a named pipe that will never come.
+
+    Tasks:
+        1) Open the pipe for reading without blocking, then close it right away.
+
+    Parameters:
+        - pipe_path / str / Path of the named pipe.
+
+    Returns:
+        No object returned.
+    """
+
+    try:
+        os.close(os.open(pipe_path, os.O_RDONLY | os.O_NONBLOCK))
+    except OSError:
+        pass
+
+
 def download_progress (
     stream:          pytubefix.Stream,
     chunk:           bytes,
@@ -128,10 +597,8 @@ def download_progress (
     Display the progress of the download of a stream.
 
     Tasks:
-        1) Verify the configuration values.
-        2) Calculate the download status.
-        3) Make the progress bar.
-        4) Display all relevant data.
+        1) Calculate the download status.
+        2) Display the progress bar.
 
     Parameters:
         - stream          / Stream / Stream being downloaded.
@@ -142,12 +609,74 @@ def download_progress (
         No object returned.
     """
 
+    file_size = stream.filesize
+    downloaded_bytes = file_size - remaining_bytes
+
+    display_progress(downloaded_bytes, file_size, row = streams_rows.get(stream))
+
+
+def download_streams_progress (
+    stream:          pytubefix.Stream,
+    chunk:           bytes,
+    remaining_bytes: int
+) -> None:
+    """
+    Display the combined progress of the streams downloaded by download_streams().
+
+    Tasks:
+        1) Update the bytes remaining of the stream.
+        2) Calculate the download status of all the streams.
+        3) Display all relevant data, with the progress of each stream.
+
+    Parameters:
+        - stream          / Stream / Stream being downloaded.
+        - chunk           / bytes  / Bytes of the last downloaded data chunk (not used but necessary in this order).
+        - remaining_bytes / int    / Amount of bytes remaining to complete the download of this stream.
+
+    Returns:
+        No object returned.
+    """
+
+    # Streams report their progress from different threads.
+    with streams_progress_lock:
+        streams_progress[stream] = remaining_bytes
+        downloads = {download: streams_progress.get(download, download.filesize) for download in streams_downloads.get(stream, [stream])}
+
+        file_size = sum(download.filesize for download in downloads)
+        downloaded_bytes = sum(download.filesize - remaining for download, remaining in downloads.items())
+        details = " | ".join(f"{download.type} {int((download.filesize - remaining) / download.filesize * 100):02d}%" for download, remaining in downloads.items())
+
+        display_progress(downloaded_bytes, file_size, f" [{details}]", streams_rows.get(stream))
+
+
+def display_progress (
+    downloaded_bytes: int,
+    file_size:        int,
+    details:          str = "",
+    row:              typing.Optional[int] = None
+) -> None:
+    """
+    Display a download progress bar.
+
+    Tasks:
+        1) Verify the configuration values.
+        2) Make the progress bar.
+        3) Display all relevant data, in the line of the download when a dashboard is displayed.
+
+    Parameters:
+        - downloaded_bytes / int / Amount of bytes already downloaded.
+        - file_size        / int / Total amount of bytes to download.
+        - details          / str / Text displayed after the sizes.
+        - row              / int / Dashboard line of the download, if any.
+
+    Returns:
+        No object returned.
+    """
+
     app_config = config.get_config_data()
     bar_length = app_config.get("download_bars_length", 20)
     bar_length = bar_length if bar_length > 0 and bar_length <= 100 else 20
 
-    file_size = stream.filesize
-    downloaded_bytes = file_size - remaining_bytes
     percentage = downloaded_bytes / file_size * 100
 
     filled = int(bar_length * downloaded_bytes / file_size)
@@ -155,7 +684,176 @@ def download_progress (
     progress_bar = "[" + "█" * filled + " " * empty + "]"
     percentage_display = f"{int(percentage):02d}" # UI format (1 -> 01 ; 2 -> 02 ; 10 -> 10)
 
-    print(f"\rDownload progress: {percentage_display}% {progress_bar} ({downloaded_bytes / 1000000:.2f}MB/{file_size / 1000000:.2f}MB).", end = "", flush = True)
+    progress = f"Download progress: {percentage_display}% {progress_bar} ({downloaded_bytes / 1000000:.2f}MB/{file_size / 1000000:.2f}MB){details}."
+    current_dashboard = dashboard
+
+    if row is not None and current_dashboard is not None:
+        current_dashboard.set_row(row, progress)
+    else:
+        print(f"\r{progress}", end = "", flush = True)
+
+
+def configure_parallelism (
+    max_downloads:   int,
+    max_conversions: int
+) -> None:
+    """
+    Size the amount of downloads transferring data and of FFmpeg processes running at once.
+
+    Tasks:
+        1) Replace the transfer and conversion slots.
+
+    Parameters:
+        - max_downloads   / int / Amount of downloads transferring data at once.
+        - max_conversions / int / Amount of FFmpeg processes running at once.
+
+    Returns:
+        No object returned.
+    """
+
+    global transfer_slots, conversion_slots
+
+    transfer_slots = threading.BoundedSemaphore(max_downloads)
+    conversion_slots = threading.BoundedSemaphore(max_conversions)
+
+
+def ffmpeg_output () -> typing.Optional[int]:
+    """
+    Get where the output of FFmpeg goes.
+
+    Tasks:
+        1) Hide the output of FFmpeg while a dashboard is displayed.
+
+    Parameters:
+        No parameters.
+
+    Returns:
+        subprocess.DEVNULL while a dashboard is displayed.
+        None otherwise (the output of FFmpeg is displayed).
+    """
+
+    return subprocess.DEVNULL if dashboard is not None else None
+
+
+def run_ffmpeg (
+    command: list
+) -> None:
+    """
+    Run an FFmpeg command once a conversion slot is available.
+
+    Tasks:
+        1) Wait for a conversion slot.
+        2) Run the command and raise on failure.
+
+    Parameters:
+        - command / list / FFmpeg command and its arguments.
+
+    Returns:
+        No object returned.
+    """
+
+    with conversion_slots:
+        subprocess.run(command, stdout = ffmpeg_output(), stderr = ffmpeg_output(), check = True)
+
+
+def start_dashboard () -> None:
+    """
+    Display the downloads running at once on several lines.
+
+    Tasks:
+        1) Enable the terminal escape sequences if necessary.
+        2) Make the dashboard the standard output.
+
+    Parameters:
+        No parameters.
+
+    Returns:
+        No object returned.
+    """
+
+    global dashboard
+
+    if platform.system() == "Windows":
+        os.system("") # Enables the escape sequences of the Windows console.
+
+    dashboard = Dashboard(sys.stdout)
+    sys.stdout = dashboard
+
+
+def stop_dashboard () -> None:
+    """
+    Stop displaying the dashboard.
+
+    Tasks:
+        1) Erase the dashboard lines.
+        2) Restore the standard output.
+
+    Parameters:
+        No parameters.
+
+    Returns:
+        No object returned.
+    """
+
+    global dashboard
+
+    if dashboard is None:
+        return
+
+    with dashboard.lock:
+        dashboard.output.write(dashboard.erase() + dashboard.pending)
+        dashboard.output.flush()
+        sys.stdout = dashboard.output
+        dashboard = None
+
+
+def start_job (
+    row:   int,
+    label: str
+) -> None:
+    """
+    Display the output of the current thread in its own dashboard line.
+
+    Tasks:
+        1) Link the current thread to the line.
+        2) Add or rename the line.
+
+    Parameters:
+        - row   / int / Key of the line, lines are displayed in the order they are added.
+        - label / str / Text displayed at the start of the line.
+
+    Returns:
+        No object returned.
+    """
+
+    job_status.row = row
+
+    if dashboard is not None:
+        dashboard.set_row(row, dashboard.rows.get(row, "Waiting.."), label)
+
+
+def end_job () -> str:
+    """
+    Remove the dashboard line of the current thread.
+
+    Tasks:
+        1) Unlink the current thread from its line.
+        2) Remove the line.
+
+    Parameters:
+        No parameters.
+
+    Returns:
+        The last message written in the line.
+    """
+
+    row = getattr(job_status, "row", None)
+    job_status.row = None
+
+    if dashboard is None or row is None:
+        return ""
+
+    return dashboard.remove_row(row)
 
 
 def ffmpeg_command_keyword () -> str:
@@ -7,6 +7,8 @@ import subtitles_download
 import thumbnail_download
 import video_download
 
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
 def playlist_information_scrapper (
     youtube_playlist: pytubefix.Playlist
 ) -> None:
@@ -42,6 +44,154 @@ def playlist_information_scrapper (
     print(f"- Views count: {playlist_views} views.")
 
 
+def download_playlist_video (
+    youtube_video:    pytubefix.YouTube,
+    option:           str,
+    destination_path: str,
+    resolution:       str,
+    language:         str
+) -> None:
+    """
+    Download a video of a playlist.
+
+    Tasks:
+        1) Select an action to do depending on the option selected.
+
+    Parameters:
+        - youtube_video    / YouTube / Targeted YouTube video.
+        - option           / str     / Targeted action to do.
+        - destination_path / str     / Targeted directory for the download.
+        - resolution       / str     / Targeted resolution for the video downloads.
+        - language         / str     / Targeted language for the subtitles downloads.
+
+    Returns:
+        No object returned.
+    """
+
+    if option == "1":
+        video_download.download_video(youtube_video, destination_path, resolution)
+    elif option == "2":
+        audio_download.download_audio(youtube_video, destination_path)
+    elif option == "3":
+        subtitles_download.download_subtitles(youtube_video, destination_path, language)
+    else:
+        thumbnail_download.download_thumbnail(youtube_video.thumbnail_url, youtube_video.title, destination_path)
+
+
+def playlist_download_job (
+    youtube_video:    pytubefix.YouTube,
+    index:            int,
+    videos_count:     int,
+    option:           str,
+    destination_path: str,
+    resolution:       str,
+    language:         str
+) -> tuple:
+    """
+    Download a video of a playlist in its own dashboard line.
+
+    Tasks:
+        1) Add the dashboard line of the video.
+        2) Download the video.
+        3) Remove the line and keep its last message for the report.
+
+    Parameters:
+        - youtube_video    / YouTube / Targeted YouTube video.
+        - index            / int     / Position of the video in the playlist.
+        - videos_count     / int     / Amount of videos in the playlist.
+        - option           / str     / Targeted action to do.
+        - destination_path / str     / Targeted directory for the download.
+        - resolution       / str     / Targeted resolution for the video downloads.
+        - language         / str     / Targeted language for the subtitles downloads.
+
+    Returns:
+        A tuple containing the position of the video, its title and the last message of its download.
+    """
+
+    title = ""
+    helpers.start_job(index, f"[{index}/{videos_count}]")
+
+    try:
+        title = youtube_video.title
+        helpers.start_job(index, f"[{index}/{videos_count} - {title}]")
+        download_playlist_video(youtube_video, option, destination_path, resolution, language)
+    except Exception as error:
+        print(f"Download failed with error {error}!")
+
+    return index, title, helpers.end_job()
+
+
+def parallel_playlist_downloads (
+    youtube_playlist: pytubefix.Playlist,
+    option:           str,
+    destination_path: str,
+    resolution:       str,
+    language:         str,
+    max_downloads:    int,
+    max_conversions:  int,
+    metadata_workers: int
+) -> None:
+    """
+    Download the videos of a playlist several at a time.
+
+    Tasks:
+        1) Size the amount of downloads transferring data and of FFmpeg processes running at once.
+        2) Display a dashboard line for each download running.
+        3) Give the videos to a pool of workers, keeping a bounded amount of videos waiting.
+        4) Display the report of the downloads in the playlist order.
+
+    Parameters:
+        - youtube_playlist / Playlist / Targeted YouTube playlist.
+        - option           / str      / Targeted action to do.
+        - destination_path / str      / Targeted directory for the downloads.
+        - resolution       / str      / Targeted resolution for the video downloads.
+        - language         / str      / Targeted language for the subtitles downloads.
+        - max_downloads    / int      / Amount of downloads transferring data at once.
+        - max_conversions  / int      / Amount of FFmpeg processes running at once.
+        - metadata_workers / int      / Amount of videos whose information is fetched at once.
+
+    Returns:
+        No object returned.
+    """
+
+    videos_count = len(youtube_playlist.video_urls)
+    workers = max_downloads + max_conversions # Downloads being converted don't keep the next ones from transferring.
+    results = {}
+    pending = set()
+
+    def collect (
+        future
+    ) -> None:
+        index, title, message = future.result()
+        results[index] = (title, message)
+        helpers.dashboard.set_row(0, f"{len(results)}/{videos_count} downloads finished.")
+
+    helpers.configure_parallelism(max_downloads, max_conversions)
+    print(f"Downloading {max_downloads} videos at once..", end = "\n\n")
+    helpers.start_dashboard()
+    helpers.dashboard.set_row(0, f"0/{videos_count} downloads finished.", "Playlist:")
+
+    try:
+        with ThreadPoolExecutor(max_workers = workers) as executor:
+            # Fetch the information of the next videos while the current ones download.
+            for i, youtube_video in enumerate(youtube_playlist.videos_parallel(workers = metadata_workers), start = 1):
+                future = executor.submit(playlist_download_job, youtube_video, i, videos_count, option, destination_path, resolution, language)
+                future.add_done_callback(collect)
+                pending.add(future)
+
+                # Videos waiting for a worker are already resolved, keep their amount bounded.
+                if len(pending) >= workers * 2:
+                    _, pending = wait(pending, return_when = FIRST_COMPLETED)
+    finally:
+        helpers.stop_dashboard()
+
+    print("Downloads report:")
+
+    for index in sorted(results):
+        title, message = results[index]
+        print(f"- [{index}/{videos_count} - {title}] {message}")
+
+
 def playlist_download_handler (
     youtube_playlist: pytubefix.Playlist,
     option:           str
@@ -50,8 +200,8 @@ def playlist_download_handler (
     Handler of the YouTube playlist downloads.
 
     Tasks:
-        1) Select an action to do depending on the option selected.
-        2) Ask preferred values to the user if necessary.
+        1) Ask preferred values to the user if necessary.
+        2) Download the videos one after the other, or several at a time if configured.
 
     Parameters:
         - youtube_playlist / Playlist / Targeted YouTube playlist.
@@ -65,6 +215,12 @@ def playlist_download_handler (
     app_config = config.get_config_data()
     default_lang = app_config.get("default_subtitle_lang", "a.en")
     default_resolution = app_config.get("default_download_resolution", "1080p")
+    metadata_workers = app_config.get("playlist_metadata_workers", 4)
+    metadata_workers = metadata_workers if metadata_workers >= 0 and metadata_workers <= 16 else 4
+    max_downloads = app_config.get("max_parallel_downloads", 1)
+    max_downloads = max_downloads if max_downloads >= 1 and max_downloads <= 16 else 1
+    max_conversions = app_config.get("max_parallel_conversions", 2)
+    max_conversions = max_conversions if max_conversions >= 1 and max_conversions <= 16 else 2
     destination_path = helpers.folder_input()
     destination_path = os.path.abspath(destination_path) # Sanitize the destination path.
     language = ""
@@ -97,15 +253,12 @@ def playlist_download_handler (
 
     print("Preparing downloads.. This may take a while.")
 
-    for youtube_video in youtube_playlist.videos:
+    if max_downloads > 1:
+        parallel_playlist_downloads(youtube_playlist, option, destination_path, resolution, language, max_downloads, max_conversions, metadata_workers)
+        return
+
+    # Fetch the information of the next videos while the current one downloads.
+    for youtube_video in youtube_playlist.videos_parallel(workers = metadata_workers):
         i += 1
         print(f"\n[Download {i}/{videos_count} - {youtube_video.title}]")
-
-        if option == "1":
-            video_download.download_video(youtube_video, destination_path, resolution)
-        elif option == "2":
-            audio_download.download_audio(youtube_video, destination_path)
-        elif option == "3":
-            subtitles_download.download_subtitles(youtube_video, destination_path, language)
-        else:
-            thumbnail_download.download_thumbnail(youtube_video.thumbnail_url, youtube_video.title, destination_path)
+        download_playlist_video(youtube_video, option, destination_path, resolution, language)
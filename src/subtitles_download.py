@@ -2,7 +2,6 @@ import config
 import helpers
 import os
 import pytubefix
-import shutil
 import typing
 
 def display_subtitles_list (
@@ -49,7 +48,7 @@ def download_subtitles (
         2) Display available subtitles.
         3) Verify the language value.
         4) Write the subtitles into a .srt file.
-        5) Move the file to the destination folder if necessary.
+        5) Move the file from the job workspace to the destination folder.
 
     Parameters:
         - youtube_video    / YouTube    / Targeted YouTube video.
@@ -105,10 +104,12 @@ def download_subtitles (
     print("\nPreparing your download.. Download speed depends on your internet connection.");
     subtitles = youtube_video.captions[language].generate_srt_captions()
 
-    with open(f"{sanitized_title}.srt", "w") as file:
-        file.write(subtitles)
+    with helpers.job_workspace(destination_path, f"{youtube_video.video_id}-{language}-srt") as workspace:
+        workspace_file = os.path.join(workspace, f"{sanitized_title}.srt")
 
-    if destination_path != app_directory_path:
-        shutil.move(f"{sanitized_title}.srt", destination_path)
+        with open(workspace_file, "w") as file:
+            file.write(subtitles)
 
-    print(f"Download finished: \"{destination_path}/{sanitized_title}.srt\"")
+        output_path = helpers.publish_file(workspace_file, destination_path)
+
+    print(f"Download finished: \"{output_path}\"")
@@ -1,11 +1,14 @@
 import config
+import contextlib
 import helpers
 import os
 import pytubefix
 import subprocess
-import shutil
+import time
 import typing
 
+from concurrent.futures import ThreadPoolExecutor, wait
+
 def display_resolutions (
     youtube_video: pytubefix.YouTube
 ) -> list:
@@ -40,6 +43,132 @@ def display_resolutions (
     return available_resolutions
 
 
+def mux_plan (
+    video_stream:           pytubefix.Stream,
+    audio_stream:           pytubefix.Stream,
+    allow_other_containers: bool
+) -> tuple:
+    """
+    Choose the output container and the FFmpeg codec arguments to assemble two streams.
+
+    Tasks:
+        1) Get the codec families of both streams.
+        2) Copy both streams into MP4 if the audio is already AAC.
+        3) Otherwise, copy them into WebM or MKV if allowed.
+        4) Otherwise, copy the video into MP4 and encode the audio to AAC.
+
+    Parameters:
+        - video_stream           / Stream / Video stream to assemble.
+        - audio_stream           / Stream / Audio stream to assemble.
+        - allow_other_containers / bool   / Whether the output can be a WebM or MKV file instead of MP4.
+
+    Returns:
+        A tuple containing the output file extension and the FFmpeg codec arguments.
+    """
+
+    # "avc1.640028" -> "avc1" ; "mp4a.40.2" -> "mp4a"
+    video_codec = (video_stream.video_codec or "").split(".")[0]
+    audio_codec = (audio_stream.audio_codec or "").split(".")[0]
+
+    if audio_codec == "mp4a":
+        return "mp4", ["-c", "copy"]
+
+    if allow_other_containers and audio_codec in ["opus", "vorbis"]:
+        if video_codec in ["vp8", "vp9", "vp09", "av01"]:
+            return "webm", ["-c", "copy"]
+
+        return "mkv", ["-c", "copy"] # MKV accepts any codec.
+
+    return "mp4", ["-c:v", "copy", "-c:a", "aac"] # Only the audio needs to be encoded.
+
+
+def pipe_mux (
+    ffmpeg:       str,
+    video_stream: pytubefix.Stream,
+    audio_stream: pytubefix.Stream,
+    workspace:    str,
+    output_path:  str,
+    codec_args:   list
+) -> bool:
+    """
+    Assemble the audio and video streams while they are downloaded, without source files.
+
+    Tasks:
+        1) Create a named pipe for each stream.
+        2) Start FFmpeg reading from both pipes and writing the output file.
+        3) Download each stream into its pipe concurrently.
+        4) Wait for FFmpeg, then remove the pipes.
+
+    Parameters:
+        - ffmpeg       / str    / FFmpeg keyword command.
+        - video_stream / Stream / Video stream to download.
+        - audio_stream / Stream / Audio stream to download.
+        - workspace    / str    / Job workspace where the pipes are created.
+        - output_path  / str    / Path of the output file.
+        - codec_args   / list   / FFmpeg codec arguments, see mux_plan().
+
+    Returns:
+        True if the output file was made.
+        False if not (named pipes unsupported, download or FFmpeg failure).
+    """
+
+    if not hasattr(os, "mkfifo"): # Named pipes are not available on Windows.
+        return False
+
+    video_pipe = os.path.join(workspace, "video_pipe")
+    audio_pipe = os.path.join(workspace, "audio_pipe")
+    writers_timeout = 30 # Seconds the downloads have to stop once FFmpeg stopped.
+    errors = []
+    executor = None
+
+    try:
+        for pipe in [video_pipe, audio_pipe]:
+            if os.path.exists(pipe): # Left by an interrupted attempt, the workspace is kept until the download succeeds.
+                os.remove(pipe)
+
+        os.mkfifo(video_pipe)
+        os.mkfifo(audio_pipe)
+
+        process = subprocess.Popen([ffmpeg, "-y", "-loglevel", "error", "-i", video_pipe, "-i", audio_pipe, *codec_args, output_path], stdin = subprocess.DEVNULL, stdout = helpers.ffmpeg_output(), stderr = helpers.ffmpeg_output())
+        helpers.reset_streams_progress([video_stream, audio_stream])
+
+        executor = ThreadPoolExecutor(max_workers = 2)
+        futures = [executor.submit(helpers.stream_to_pipe, video_stream, video_pipe), executor.submit(helpers.stream_to_pipe, audio_stream, audio_pipe)]
+        return_code = process.wait()
+        deadline = time.monotonic() + writers_timeout
+
+        # FFmpeg may have stopped before opening a pipe, its writer would wait forever.
+        # A writer can reach the pipe after any release, so keep releasing them until all the writers are done.
+        while not all(future.done() for future in futures) and time.monotonic() < deadline:
+            helpers.release_pipe(video_pipe)
+            helpers.release_pipe(audio_pipe)
+            wait(futures, timeout = 0.1)
+
+        for future in futures:
+            if not future.done():
+                errors.append(TimeoutError(f"download still writing {writers_timeout} seconds after FFmpeg stopped"))
+            elif future.exception():
+                errors.append(future.exception())
+    except OSError as error:
+        errors.append(error)
+        return_code = None
+    finally:
+        if executor is not None:
+            executor.shutdown(wait = False) # A stuck writer must not block the job.
+
+        for pipe in [video_pipe, audio_pipe]:
+            if os.path.exists(pipe):
+                os.remove(pipe)
+
+    if return_code != 0 or errors:
+        reason = errors[0] if errors else f"FFmpeg exit code {return_code}"
+        print(f"\n\nWarning: Assembling during the download failed ({reason})!")
+        helpers.remove_if_exists(output_path)
+        return False
+
+    return True
+
+
 def download_video (
     youtube_video:    pytubefix.YouTube,
     destination_path: typing.Optional[str],
@@ -52,9 +181,10 @@ def download_video (
         1) Verify the destination path value.
         2) Display available resolutions.
         3) Verify the resolution value.
-        4) Download the audio and video streams.
-        5) Assemble both streams to make a single output file.
-        6) Move the file to the destination folder if necessary.
+        4) Download and assemble the audio and video streams through pipes, into a job workspace.
+        5) Otherwise, download the audio and video streams concurrently.
+        6) Assemble both streams to make a single output file, copying the codecs the container accepts.
+        7) Move the file from the job workspace to the destination folder.
 
     Parameters:
         - youtube_video    / YouTube    / Targeted YouTube video.
@@ -68,6 +198,8 @@ def download_video (
     app_config = config.get_config_data()
     app_directory_path = os.getcwd()
     default_resolution = app_config.get("default_download_resolution", "1080p")
+    pipe_muxing = app_config.get("pipe_muxing", True)
+    allow_other_containers = app_config.get("allow_webm_mkv_output", True)
     ffmpeg = helpers.ffmpeg_command_keyword()
     sanitized_title = helpers.remove_invalid_characters(youtube_video.title)
 
@@ -112,23 +244,41 @@ def download_video (
         print("Download failed! No audio stream was found for this video!")
         return
 
-    # Get the download progress data.
-    youtube_video.register_on_progress_callback(helpers.download_progress)
+    # Copying the streams is much cheaper than encoding the audio.
+    extension, codec_args = mux_plan(video_stream, audio_stream, allow_other_containers)
+    output_file = f"{sanitized_title}.{extension}"
+
+    # Get the download progress data of both streams.
+    youtube_video.register_on_progress_callback(helpers.download_streams_progress)
+
+    # Every file of the download stays in its own workspace, so several downloads can run at once and a failed one can be resumed.
+    with helpers.job_workspace(destination_path, f"{youtube_video.video_id}-{video_stream.itag}-{audio_stream.itag}") as workspace:
+        workspace_file = os.path.join(workspace, output_file)
+
+        # Only the output file is written to the disk.
+        if pipe_muxing:
+            print("\nDownloading and assembling audio and video:")
+
+            # Copying the streams only moves bytes, FFmpeg takes a conversion slot when it has to encode the audio.
+            conversion = helpers.conversion_slots if "-c:a" in codec_args else contextlib.nullcontext()
 
-    print("\nDownloading video source:")
-    helpers.download_stream(video_stream, "video_source.mp4")
+            with helpers.transfer_slots, conversion:
+                muxed = pipe_mux(ffmpeg, video_stream, audio_stream, workspace, workspace_file, codec_args)
 
-    print("\n\nDownloading audio source:")
-    helpers.download_stream(audio_stream, "audio_source.mp3")
+            if muxed:
+                output_path = helpers.publish_file(workspace_file, destination_path)
+                print(f"\n\nDownload finished: \"{output_path}\"")
+                return
 
-    print("\n\nAssembling audio and video..")
-    helpers.remove_if_exists("output.mp4")
-    subprocess.run([ffmpeg, "-y", "-i", "video_source.mp4", "-i", "audio_source.mp3", "-c:v", "copy", "-c:a", "aac", f"{sanitized_title}.mp4"], check = True)
+            print("Downloading the sources before assembling them instead..")
 
-    helpers.remove_if_exists("video_source.mp4")
-    helpers.remove_if_exists("audio_source.mp3")
+        # Both sources are downloaded at the same time, often from different servers.
+        print("\nDownloading video and audio sources:")
+        with helpers.transfer_slots:
+            video_source, audio_source = helpers.download_streams([(video_stream, "video_source.mp4"), (audio_stream, "audio_source.mp3")], workspace)
 
-    if destination_path != app_directory_path:
-        shutil.move(f"{sanitized_title}.mp4", destination_path)
+        print("\n\nAssembling audio and video..")
+        helpers.run_ffmpeg([ffmpeg, "-y", "-i", video_source, "-i", audio_source, *codec_args, workspace_file])
+        output_path = helpers.publish_file(workspace_file, destination_path)
 
-    print(f"\nDownload finished: \"{destination_path}/{sanitized_title}.mp4\"")
+    print(f"\nDownload finished: \"{output_path}\"")
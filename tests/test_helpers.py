@@ -0,0 +1,87 @@
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "dependencies"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import config
+import helpers
+import pytest
+import pytubefix
+
+
+class FakeStream:
+    """
+    Stream writing its content where pytubefix.Stream.download() would write it.
+    """
+
+    mime_type = "video/mp4"
+    default_filename = "default.mp4"
+    filesize = 5
+    get_file_path = pytubefix.Stream.get_file_path
+
+    def download (self, output_path = None, filename = None, **kwargs) -> str:
+        file_path = pytubefix.Stream._download_path(self, output_path, filename)
+
+        with open(file_path, "wb") as file:
+            file.write(b"video")
+
+        return file_path
+
+
+@pytest.fixture(autouse = True)
+def no_retry_cooldown (monkeypatch):
+    monkeypatch.setitem(config.get_config_data(), "retry_cooldown", 0)
+
+
+def test_download_stream_writes_into_the_workspace (tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    destination_path = tmp_path / "destination"
+    destination_path.mkdir()
+
+    with helpers.job_workspace(str(destination_path), "abc-137-140") as workspace:
+        file_path = helpers.download_stream(FakeStream(), workspace, "video_source.mp4")
+
+        assert file_path == os.path.join(workspace, "video_source.mp4")
+        assert os.listdir(workspace) == ["video_source.mp4"]
+
+    assert sorted(os.listdir(tmp_path)) == ["destination"] # Nothing written to the current directory.
+
+
+def test_download_streams_returns_the_paths_in_order (tmp_path):
+    paths = helpers.download_streams([(FakeStream(), "video_source.mp4"), (FakeStream(), "audio_source.mp3")], str(tmp_path))
+
+    assert paths == [str(tmp_path / "video_source.mp4"), str(tmp_path / "audio_source.mp3")]
+
+
+def test_job_workspace_is_used_by_one_job_at_a_time (tmp_path):
+    events = []
+
+    def job (name: str) -> None:
+        with helpers.job_workspace(str(tmp_path), "abc-137-140") as workspace:
+            events.append(f"{name} start")
+            time.sleep(0.1)
+            assert os.path.isdir(workspace)
+            events.append(f"{name} end")
+
+    threads = [threading.Thread(target = job, args = (name,)) for name in ["first", "second"]]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert [event.split()[1] for event in events] == ["start", "end", "start", "end"]
+    assert os.listdir(tmp_path) == []
+
+
+def test_job_workspace_is_kept_after_a_failure (tmp_path):
+    with pytest.raises(ConnectionError):
+        with helpers.job_workspace(str(tmp_path), "abc-137-140") as workspace:
+            open(os.path.join(workspace, "video_source.mp4.journal"), "w").close()
+            raise ConnectionError()
+
+    assert os.listdir(tmp_path / ".youtube-downloader-abc-137-140") == ["video_source.mp4.journal"]